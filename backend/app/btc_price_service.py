@@ -12,7 +12,7 @@ import asyncio
 import json
 import logging
 import re
-from datetime import datetime
+import time
 from typing import Optional, Dict, Any
 
 import aiohttp
@@ -36,7 +36,7 @@ class BTCPriceService:
         self._live_btc_price: Optional[float] = None
         self._price_to_beat: Optional[float] = None
         self._current_market_slug: Optional[str] = None
-        self._last_price_update: Optional[datetime] = None
+        self._last_price_update: Optional[float] = None  # time.monotonic() of last update
         self._running = False
         self._ws_task: Optional[asyncio.Task] = None
 
@@ -150,7 +150,7 @@ class BTCPriceService:
                                 price = payload.get("value")
                                 if price:
                                     self._live_btc_price = float(price)
-                                    self._last_price_update = datetime.utcnow()
+                                    self._last_price_update = time.monotonic()
                     except json.JSONDecodeError:
                         pass
 
@@ -173,7 +173,7 @@ class BTCPriceService:
         """
         # Try WebSocket price first (most up to date)
         if self._live_btc_price and self._last_price_update:
-            age = (datetime.utcnow() - self._last_price_update).total_seconds()
+            age = time.monotonic() - self._last_price_update
             if age < 30:  # Price is fresh (< 30 seconds old)
                 return self._live_btc_price
 
@@ -190,7 +190,7 @@ class BTCPriceService:
                     data = await response.json()
                     price = float(data.get("price", 0))
                     self._live_btc_price = price
-                    self._last_price_update = datetime.utcnow()
+                    self._last_price_update = time.monotonic()
                     return price
         except Exception as e:
             logger.error(f"[BTC] Error fetching live price: {e}")
@@ -73,6 +73,9 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./data/trades.db",
         description="Database connection URL"
     )
+    db_pool_size: int = Field(default=20, description="Connection pool size (ignored for SQLite)")
+    db_max_overflow: int = Field(default=10, description="Burst connections allowed beyond the pool size (ignored for SQLite)")
+    db_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is replaced (ignored for SQLite)")
 
     # API
     api_host: str = Field(default="0.0.0.0", description="API host")
@@ -85,6 +88,15 @@ class Settings(BaseSettings):
     market_scan_interval: int = Field(default=10, description="Market scanning interval")
     position_check_interval: int = Field(default=2, description="Position monitoring interval")
 
+    # CLOB WebSocket feed
+    clob_ws_enabled: bool = Field(default=True, description="Stream prices and order fills from the CLOB WebSocket (REST polling is the fallback)")
+    ws_price_max_age: float = Field(default=5.0, description="Max age (seconds) of a WebSocket price before falling back to REST")
+
+    # HTTP connection reuse for CLOB REST calls
+    http_pool_size: int = Field(default=32, description="Max pooled HTTP connections to the CLOB API")
+    http_keepalive_timeout: float = Field(default=300.0, description="Seconds an idle pooled HTTP connection is kept open")
+    http_keepalive_interval: float = Field(default=20.0, description="Seconds between keepalive pings that keep pooled connections warm (0 disables)")
+
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
@@ -99,6 +111,11 @@ class Settings(BaseSettings):
             return "https://clob.polymarket.com"  # Testnet uses same host
         return "https://clob.polymarket.com"
 
+    @property
+    def clob_ws_host(self) -> str:
+        """Get the CLOB WebSocket host for market and user channels."""
+        return "wss://ws-subscriptions-clob.polymarket.com/ws"
+
     @property
     def gamma_host(self) -> str:
         """Get the Gamma API host for market discovery."""
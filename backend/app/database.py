@@ -1,11 +1,12 @@
 """Database models and setup using SQLAlchemy with async SQLite."""
 
+import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 import enum
@@ -37,6 +38,10 @@ class Side(enum.Enum):
 class Trade(Base):
     """Trade record model."""
     __tablename__ = "trades"
+    __table_args__ = (
+        # Trade history pages: newest first, optionally filtered by market
+        Index("ix_trades_market_id_created_at", "market_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     order_id = Column(String(100), unique=True, index=True)
@@ -50,7 +55,7 @@ class Trade(Base):
     status = Column(SQLEnum(OrderStatus), default=OrderStatus.PENDING)
     pnl = Column(Float, default=0.0)
     is_paper = Column(Boolean, default=False)  # Paper trade flag
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self) -> str:
@@ -127,10 +132,22 @@ def get_database_url() -> str:
 
     return db_url
 
+def get_engine_options(db_url: str) -> dict:
+    """Get connection pool options - SQLite keeps SQLAlchemy's defaults."""
+    if "sqlite" in db_url:
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 engine = create_async_engine(
     get_database_url(),
     echo=False,
-    future=True
+    future=True,
+    **get_engine_options(settings.database_url)
 )
 
 async_session_maker = async_sessionmaker(
@@ -144,6 +161,26 @@ async def init_db() -> None:
     """Initialize the database and create all tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+
+    await warm_up_pool()
+
+
+def create_missing_indexes(conn) -> None:
+    """Add indexes declared after a table was created - create_all skips existing tables."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+async def warm_up_pool() -> None:
+    """Open the pool's connections at startup so the first trades don't pay connect latency."""
+    if engine.dialect.name == "sqlite":
+        return
+
+    connections = await asyncio.gather(*(engine.connect() for _ in range(settings.db_pool_size)))
+    # Closing returns them to the pool, still open
+    await asyncio.gather(*(conn.close() for conn in connections))
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
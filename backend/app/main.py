@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -41,6 +42,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
     # Startup
     logger.info("Starting Polymarket Trading Bot API...")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
 
     # Initialize database
     await init_db()
@@ -146,9 +148,17 @@ async def get_trading_config():
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop ships with uvicorn[standard]; fall back to the stdlib loop if it is missing
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
+        loop=loop,
         reload=True
     )
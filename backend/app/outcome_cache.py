@@ -0,0 +1,72 @@
+"""Token ID -> outcome (YES/NO) lookup cache shared by the trade endpoints."""
+
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import Position
+
+class OutcomeCache:
+    """
+    In-process TTL cache of token_id -> outcome.
+
+    Outcomes never change once a Position row exists, so only hits are cached;
+    unknown tokens are looked up again on the next request. Lookups are batched
+    so a page of trades costs at most one indexed IN query instead of a full
+    Position table scan.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[str, float]] = {}  # token_id -> (outcome, expires_at)
+
+    async def get_many(self, db: AsyncSession, token_ids: Iterable[str]) -> Dict[str, str]:
+        """Get outcomes for several tokens in one round trip (MGET-style)."""
+        now = time.monotonic()
+        found: Dict[str, str] = {}
+        missing = set()
+
+        for token_id in token_ids:
+            if token_id is None or token_id in found:
+                continue
+            entry = self._entries.get(token_id)
+            if entry and entry[1] > now:
+                found[token_id] = entry[0]
+            else:
+                missing.add(token_id)
+
+        if missing:
+            result = await db.execute(
+                select(Position.token_id, Position.outcome).where(Position.token_id.in_(missing))
+            )
+            expires_at = now + self._ttl
+            for token_id, outcome in result.all():
+                found[token_id] = outcome
+                self._entries[token_id] = (outcome, expires_at)
+
+        return found
+
+    async def get(self, db: AsyncSession, token_id: str) -> Optional[str]:
+        """Get the outcome for a single token."""
+        return (await self.get_many(db, [token_id])).get(token_id)
+
+    def invalidate(self, token_id: Optional[str] = None) -> None:
+        """Drop a single token (or everything) after a Position write."""
+        if token_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(token_id, None)
+
+
+# Singleton instance
+_outcome_cache: Optional[OutcomeCache] = None
+
+
+def get_outcome_cache() -> OutcomeCache:
+    """Get or create the outcome cache singleton."""
+    global _outcome_cache
+    if _outcome_cache is None:
+        _outcome_cache = OutcomeCache()
+    return _outcome_cache
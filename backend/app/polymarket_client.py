@@ -4,8 +4,9 @@ import asyncio
 import json
 import logging
 import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any, Callable, Set
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
@@ -30,22 +31,62 @@ class LivePriceStream:
         self._session: Optional[aiohttp.ClientSession] = None
         self._callbacks: List[Callable[[str, float], None]] = []
         self._running = False
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create a session whose pooled connections stay open between polls."""
+        settings = get_settings()
+        connector = aiohttp.TCPConnector(
+            limit=settings.http_pool_size,
+            keepalive_timeout=settings.http_keepalive_timeout
+        )
+        return aiohttp.ClientSession(connector=connector)
 
     async def start(self) -> None:
         """Start the price stream."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = self._new_session()
         self._running = True
+        if get_settings().http_keepalive_interval > 0 and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive())
         logger.info("Live price stream started")
 
     async def stop(self) -> None:
         """Stop the price stream."""
         self._running = False
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
         if self._session:
             await self._session.close()
             self._session = None
         logger.info("Live price stream stopped")
 
+    async def _keepalive(self) -> None:
+        """
+        Ping the cheap CLOB /time endpoint so the pooled connection (and its
+        TLS session) stays warm through idle gaps between market polls.
+        """
+        settings = get_settings()
+        url = f"{settings.polymarket_host}/time"
+        timeout = aiohttp.ClientTimeout(total=5)
+
+        while self._running:
+            await asyncio.sleep(settings.http_keepalive_interval)
+            try:
+                if self._session is None:
+                    continue
+                async with self._session.get(url, timeout=timeout) as response:
+                    await response.read()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Keepalive ping failed: %s", e)
+
     def add_callback(self, callback: Callable[[str, float], None]) -> None:
         """Add a callback for price updates."""
         self._callbacks.append(callback)
@@ -59,7 +100,7 @@ class LivePriceStream:
 
         try:
             if self._session is None:
-                self._session = aiohttp.ClientSession()
+                self._session = self._new_session()
 
             timeout = aiohttp.ClientTimeout(total=5)
 
@@ -89,18 +130,378 @@ class LivePriceStream:
             return None
 
     async def get_live_prices_batch(self, token_ids: List[str]) -> Dict[str, float]:
-        """Get live prices for multiple tokens in parallel."""
-        tasks = [self.get_live_price(tid) for tid in token_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """
+        Get live prices for multiple tokens.
+        Uses one CLOB /midpoints request for all tokens, then fetches any
+        tokens missing from that response individually in parallel.
+        """
+        settings = get_settings()
+        prices: Dict[str, float] = {}
+        if not token_ids:
+            return prices
 
-        prices = {}
-        for token_id, result in zip(token_ids, results):
-            if isinstance(result, float):
-                prices[token_id] = result
+        try:
+            if self._session is None:
+                self._session = self._new_session()
+
+            timeout = aiohttp.ClientTimeout(total=5)
+            url = f"{settings.polymarket_host}/midpoints"
+            body = [{"token_id": token_id} for token_id in token_ids]
+
+            async with self._session.post(url, json=body, timeout=timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    for token_id in token_ids:
+                        mid = data.get(token_id)
+                        if mid is not None:
+                            prices[token_id] = float(mid)
+        except Exception as e:
+            logger.debug("Batch midpoints request failed: %s", e)
+
+        missing = [token_id for token_id in token_ids if token_id not in prices]
+        if missing:
+            results = await asyncio.gather(
+                *(self.get_live_price(token_id) for token_id in missing),
+                return_exceptions=True
+            )
+            for token_id, result in zip(missing, results):
+                if isinstance(result, float):
+                    prices[token_id] = result
 
         return prices
 
 
+# Decimal places of streamed prices - midpoints of 0.001 ticks need 4
+PRICE_DECIMALS = 4
+
+
+class ClobMarketFeed:
+    """
+    Push-based prices and order fills from the Polymarket CLOB WebSocket.
+
+    - Market channel: book/price_change events keep a top-of-book midpoint per token
+    - User channel: order/trade events record the matched size per order ID
+
+    Readers go through get_price()/get_filled_size() and fall back to REST
+    when the data is missing or older than ws_price_max_age.
+    """
+
+    PING_INTERVAL = 10  # seconds - the server drops sockets that stay silent
+    RECONNECT_DELAY = 2  # seconds
+    MAX_TRACKED = 1000  # order fills / trade IDs kept per market - the oldest are dropped beyond this
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._running = False
+        self._asset_ids: List[str] = []
+        self._condition_id: Optional[str] = None
+        self._auth: Optional[Dict[str, str]] = None
+        self._market_task: Optional[asyncio.Task] = None
+        self._user_task: Optional[asyncio.Task] = None
+        self._user_connected = False  # Streamed balances are only trusted while the user socket is up
+        self._books: Dict[str, Dict[str, Dict[float, float]]] = {}  # token_id -> {"bids": {price: size}, "asks": {...}}
+        self._prices: Dict[str, Tuple[float, float]] = {}  # token_id -> (midpoint, monotonic time)
+        self._fills: Dict[str, float] = {}  # order_id -> matched size
+        self._token_balances: Dict[str, float] = {}  # token_id -> balance (REST seed + streamed trades)
+        self._applied_trades: Dict[str, None] = {}  # trade IDs applied to _token_balances, or skipped as unseeded (insertion-ordered set)
+        self._fill_events: Dict[str, asyncio.Event] = {}
+        self.price_event = asyncio.Event()  # Set on every streamed price update
+
+    async def start(self) -> None:
+        """Start the feed (channels connect on subscribe_market)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        self._running = True
+        logger.info("CLOB market feed started")
+
+    async def stop(self) -> None:
+        """Stop the feed and close both channels."""
+        self._running = False
+        await self._cancel_tasks()
+        if self._session:
+            await self._session.close()
+            self._session = None
+        logger.info("CLOB market feed stopped")
+
+    def set_auth(self, creds: Optional[ApiCreds]) -> None:
+        """Set L2 API credentials used to authenticate the user channel."""
+        if creds is None:
+            self._auth = None
+            return
+        self._auth = {
+            "apiKey": creds.api_key,
+            "secret": creds.api_secret,
+            "passphrase": creds.api_passphrase,
+        }
+
+    async def subscribe_market(self, token_ids: List[str], condition_id: Optional[str] = None) -> None:
+        """Point both channels at a market. No-op if already subscribed to it."""
+        if not self.settings.clob_ws_enabled:
+            return
+
+        token_ids = list(token_ids)
+        if (
+            self._market_task is not None
+            and set(token_ids) == set(self._asset_ids)
+            and condition_id == self._condition_id
+        ):
+            return
+
+        await self._cancel_tasks()
+        self._asset_ids = token_ids
+        self._condition_id = condition_id
+        self._books.clear()
+        self._prices.clear()
+        # Fills and trades belong to the previous market's orders
+        self._fills.clear()
+        self._applied_trades.clear()
+
+        await self.start()
+        self._market_task = asyncio.create_task(
+            self._run_channel("market", self._market_subscription, self._handle_market_event)
+        )
+        if self._auth and condition_id:
+            self._user_task = asyncio.create_task(
+                self._run_channel("user", self._user_subscription, self._handle_user_event)
+            )
+
+    async def _cancel_tasks(self) -> None:
+        """Cancel the channel tasks, if running."""
+        for task in (self._market_task, self._user_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._market_task = None
+        self._user_task = None
+
+    def _market_subscription(self) -> Dict[str, Any]:
+        return {"assets_ids": self._asset_ids, "type": "market"}
+
+    def _user_subscription(self) -> Dict[str, Any]:
+        return {"auth": self._auth, "markets": [self._condition_id], "type": "user"}
+
+    async def _run_channel(
+        self,
+        channel: str,
+        subscription: Callable[[], Dict[str, Any]],
+        handler: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Connect, subscribe and dispatch events, reconnecting until cancelled."""
+        url = f"{self.settings.clob_ws_host}/{channel}"
+
+        while self._running:
+            ping_task = None
+            try:
+                async with self._session.ws_connect(url) as ws:
+                    await ws.send_str(json.dumps(subscription()))
+                    logger.info(f"[CLOB WS] Subscribed to {channel} channel")
+                    ping_task = asyncio.create_task(self._ping(ws))
+
+                    if channel == "user":
+                        # Trades may have been missed while disconnected - REST re-seeds balances
+                        self._token_balances.clear()
+                        self._user_connected = True
+
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            if msg.data == "PONG":
+                                continue
+                            try:
+                                data = json.loads(msg.data)
+                            except json.JSONDecodeError:
+                                continue
+                            for event in (data if isinstance(data, list) else [data]):
+                                handler(event)
+
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+
+                logger.warning(f"[CLOB WS] {channel} channel closed, reconnecting...")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[CLOB WS] {channel} channel error: {e}")
+            finally:
+                if ping_task:
+                    ping_task.cancel()
+                if channel == "user":
+                    self._user_connected = False
+
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _ping(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Keep the socket alive with the text PING the CLOB server expects."""
+        while True:
+            await asyncio.sleep(self.PING_INTERVAL)
+            await ws.send_str("PING")
+
+    def _handle_market_event(self, event: Dict[str, Any]) -> None:
+        """Apply a market channel event to the local books."""
+        event_type = event.get("event_type")
+
+        if event_type == "book":
+            asset_id = event.get("asset_id")
+            if not asset_id:
+                return
+            self._books[asset_id] = {
+                "bids": {float(level["price"]): float(level["size"]) for level in event.get("bids", [])},
+                "asks": {float(level["price"]): float(level["size"]) for level in event.get("asks", [])},
+            }
+            self._update_midpoint(asset_id)
+
+        elif event_type == "price_change":
+            # Newer payloads nest changes (with best_bid/best_ask) under price_changes,
+            # older ones list level deltas under changes with a top-level asset_id
+            changes = event.get("price_changes") or event.get("changes") or []
+            for change in changes:
+                asset_id = change.get("asset_id") or event.get("asset_id")
+                if not asset_id:
+                    continue
+
+                book = self._books.get(asset_id)
+                if book is not None and change.get("price") is not None:
+                    levels = book["bids"] if str(change.get("side", "")).upper() == "BUY" else book["asks"]
+                    price = float(change["price"])
+                    size = float(change.get("size") or 0)
+                    if size > 0:
+                        levels[price] = size
+                    else:
+                        levels.pop(price, None)
+
+                best_bid = change.get("best_bid")
+                best_ask = change.get("best_ask")
+                if best_bid and best_ask:
+                    self._set_price(asset_id, (float(best_bid) + float(best_ask)) / 2)
+                else:
+                    self._update_midpoint(asset_id)
+
+    def _update_midpoint(self, asset_id: str) -> None:
+        """Recompute the top-of-book midpoint for a token."""
+        book = self._books.get(asset_id)
+        if not book or not book["bids"] or not book["asks"]:
+            return
+        self._set_price(asset_id, (max(book["bids"]) + min(book["asks"])) / 2)
+
+    def _set_price(self, asset_id: str, midpoint: float) -> None:
+        """Store a streamed midpoint and wake anyone waiting on price_event."""
+        # Snap to the price grid - (bid + ask) / 2 in binary floats can land a hair
+        # off, e.g. just under a 0.75 trigger the REST /midpoint would report exactly
+        self._prices[asset_id] = (round(midpoint, PRICE_DECIMALS), time.monotonic())
+        self.price_event.set()
+
+    def _handle_user_event(self, event: Dict[str, Any]) -> None:
+        """Record matched size from user channel order/trade events."""
+        event_type = event.get("event_type")
+
+        if event_type == "order":
+            size_matched = float(event.get("size_matched") or 0)
+            if event.get("id") and size_matched > 0:
+                self._record_fill(event["id"], size_matched)
+
+        elif event_type == "trade":
+            if str(event.get("status", "")).upper() == "FAILED":
+                return
+            if event.get("taker_order_id"):
+                self._record_fill(event["taker_order_id"], float(event.get("size") or 0))
+            for maker in event.get("maker_orders", []):
+                if maker.get("order_id"):
+                    self._record_fill(maker["order_id"], float(maker.get("matched_amount") or 0))
+            self._apply_trade_to_balances(event)
+
+    def _apply_trade_to_balances(self, event: Dict[str, Any]) -> None:
+        """
+        Adjust seeded token balances by our side of a trade (once per trade ID).
+        A trade seen while a token it touches is unseeded is never applied: the
+        REST seed taken afterwards may already include it, and applying a later
+        MINED/CONFIRMED copy on top would count it twice. A seed that predates
+        settlement reads low instead, which callers re-check against REST.
+        """
+        trade_id = event.get("id")
+        if not trade_id or trade_id in self._applied_trades:
+            return
+
+        side = str(event.get("side", "")).upper()
+        if str(event.get("trader_side", "")).upper() == "TAKER":
+            fills = [(event.get("asset_id"), side, float(event.get("size") or 0))]
+        else:
+            # We were a maker - only our own maker orders count, on the opposite side to the taker
+            api_key = self._auth.get("apiKey") if self._auth else None
+            fills = [
+                (
+                    maker.get("asset_id"),
+                    str(maker.get("side") or ("SELL" if side == "BUY" else "BUY")).upper(),
+                    float(maker.get("matched_amount") or 0),
+                )
+                for maker in event.get("maker_orders", [])
+                if api_key and maker.get("owner") == api_key
+            ]
+
+        self._applied_trades[trade_id] = None
+        if len(self._applied_trades) > self.MAX_TRACKED:
+            del self._applied_trades[next(iter(self._applied_trades))]
+        if any(token_id not in self._token_balances for token_id, _, _ in fills):
+            return
+
+        for token_id, fill_side, size in fills:
+            delta = size if fill_side == "BUY" else -size
+            self._token_balances[token_id] = max(self._token_balances[token_id] + delta, 0.0)
+
+    def _record_fill(self, order_id: str, size: float) -> None:
+        """Store matched size for an order and wake any waiter."""
+        if size <= 0:
+            return
+        # The same trade is re-sent as it moves MATCHED -> MINED -> CONFIRMED,
+        # and order events carry cumulative size_matched, so keep the max
+        self._fills[order_id] = max(self._fills.get(order_id, 0.0), size)
+        if len(self._fills) > self.MAX_TRACKED:
+            del self._fills[next(iter(self._fills))]
+        fill_event = self._fill_events.get(order_id)
+        if fill_event:
+            fill_event.set()
+
+    def get_price(self, token_id: str, max_age: Optional[float] = None) -> Optional[float]:
+        """Get the streamed midpoint for a token, or None if missing/stale."""
+        entry = self._prices.get(token_id)
+        if entry is None:
+            return None
+        if max_age is None:
+            max_age = self.settings.ws_price_max_age
+        if time.monotonic() - entry[1] > max_age:
+            return None
+        return entry[0]
+
+    def seed_token_balance(self, token_id: str, balance: float) -> None:
+        """Set a token balance from REST; streamed trades adjust it from here on."""
+        self._token_balances[token_id] = balance
+
+    def get_token_balance(self, token_id: str) -> Optional[float]:
+        """Get the tracked token balance, or None if not seeded (or user channel is down)."""
+        if not self._user_connected:
+            return None
+        return self._token_balances.get(token_id)
+
+    def get_filled_size(self, order_id: str) -> Optional[float]:
+        """Get the matched size reported for an order, or None if no fill seen."""
+        return self._fills.get(order_id)
+
+    async def wait_for_fill(self, order_id: str, timeout: float) -> Optional[float]:
+        """Wait up to timeout seconds for a fill on an order."""
+        if order_id in self._fills:
+            return self._fills[order_id]
+        fill_event = self._fill_events.setdefault(order_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(fill_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._fill_events.pop(order_id, None)
+        return self._fills.get(order_id)
+
+
 class PolymarketClient:
     """Async wrapper around py-clob-client for Polymarket trading."""
 
@@ -110,6 +511,8 @@ class PolymarketClient:
         self._executor = ThreadPoolExecutor(max_workers=4)
         self._connected = False
         self.live_prices = LivePriceStream()
+        self.market_feed = ClobMarketFeed()
+        self._close_deadlines: Dict[str, float] = {}  # market_id -> time.monotonic() at close (static per market)
 
     async def connect(self) -> bool:
         """Initialize and authenticate with Polymarket."""
@@ -121,6 +524,10 @@ class PolymarketClient:
             # Start live price stream
             await self.live_prices.start()
 
+            # Start CLOB WebSocket feed - user channel needs the derived API creds
+            await self.market_feed.start()
+            self.market_feed.set_auth(self.client.creds)
+
             # Set up collateral (USDC) allowance for buying
             logger.info("Setting up trading allowances...")
             await self.ensure_collateral_allowance()
@@ -303,9 +710,7 @@ class PolymarketClient:
             return result
 
         except Exception as e:
-            logger.error(f"[FOK] ❌ FOK market order FAILED: {e}")
-            import traceback
-            logger.error(f"[FOK] 📋 Traceback: {traceback.format_exc()}")
+            logger.exception(f"[FOK] ❌ FOK market order FAILED: {e}")
             return None
 
     async def cancel_order(self, order_id: str) -> bool:
@@ -426,9 +831,7 @@ class PolymarketClient:
             return result
 
         except Exception as e:
-            logger.error(f"[ORDER_STATUS] Error checking order status: {e}")
-            import traceback
-            logger.error(f"[ORDER_STATUS] Traceback: {traceback.format_exc()}")
+            logger.exception(f"[ORDER_STATUS] Error checking order status: {e}")
             return result
 
     async def get_open_orders(self, market_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -620,7 +1023,10 @@ class PolymarketClient:
                     logger.error(f"Failed to get conditional balance: {e}")
                 return None
 
-            return await self._run_sync(_get_balance_sync)
+            balance = await self._run_sync(_get_balance_sync)
+            if balance is not None:
+                self.market_feed.seed_token_balance(token_id, balance)
+            return balance
         except Exception:
             return None
 
@@ -852,11 +1258,33 @@ class PolymarketClient:
 
     async def get_current_price(self, token_id: str) -> Optional[float]:
         """
-        Get LIVE current price for a token - NO CACHING.
-        Always fetches fresh data from the orderbook API.
+        Get LIVE current price for a token.
+        Uses the CLOB WebSocket midpoint when fresh, otherwise fetches from the API.
         """
+        price = self.market_feed.get_price(token_id)
+        if price is not None:
+            return price
         return await self.live_prices.get_live_price(token_id)
 
+    async def get_current_prices(self, token_ids: List[str]) -> Dict[str, float]:
+        """
+        Get LIVE current prices for several tokens.
+        Fresh CLOB WebSocket midpoints are used as-is; the rest are fetched
+        from the API in one batch request. Tokens without a price are omitted.
+        """
+        prices: Dict[str, float] = {}
+        missing = []
+        for token_id in token_ids:
+            price = self.market_feed.get_price(token_id)
+            if price is not None:
+                prices[token_id] = price
+            else:
+                missing.append(token_id)
+
+        if missing:
+            prices.update(await self.live_prices.get_live_prices_batch(missing))
+        return prices
+
     def _is_dst(self, dt: datetime) -> bool:
         """Check if a given UTC datetime is in US Eastern Daylight Time."""
         year = dt.year
@@ -987,6 +1415,7 @@ class PolymarketClient:
 
                             if time_to_close > 0:
                                 market["time_to_close_minutes"] = time_to_close
+                                self._set_close_deadline(market_id, time_to_close * 60)
 
                                 if "tokens" not in market:
                                     tokens = self._parse_tokens(market)
@@ -1038,31 +1467,47 @@ class PolymarketClient:
         Returns:
             Minutes remaining or None if market not found
         """
-        market_info = await self.get_market_info(market_id)
-        if not market_info:
-            return None
+        deadline = self._close_deadlines.get(market_id)
+        if deadline is None:
+            # End date never changes for a market - fetch it once and keep it as a monotonic deadline
+            market_info = await self.get_market_info(market_id)
+            if not market_info:
+                return None
 
-        end_date_str = market_info.get("endDate")
-        if not end_date_str:
-            return None
+            end_date_str = market_info.get("endDate")
+            if not end_date_str:
+                return None
 
-        try:
-            end_date = datetime.fromisoformat(
-                end_date_str.replace("Z", "+00:00")
-            ).replace(tzinfo=None)
-            now = datetime.utcnow()
+            try:
+                end_date = datetime.fromisoformat(
+                    end_date_str.replace("Z", "+00:00")
+                ).replace(tzinfo=None)
+            except (ValueError, TypeError):
+                return None
 
-            if end_date <= now:
-                return 0
+            deadline = self._set_close_deadline(market_id, (end_date - datetime.utcnow()).total_seconds())
 
-            return (end_date - now).total_seconds() / 60
-        except (ValueError, TypeError):
-            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 0
+
+        return remaining / 60
+
+    def _set_close_deadline(self, market_id: str, seconds_to_close: float) -> float:
+        """Remember when a market closes as a monotonic deadline."""
+        deadline = time.monotonic() + seconds_to_close
+        if len(self._close_deadlines) >= 256:
+            # Drop markets that have already closed
+            cutoff = time.monotonic()
+            self._close_deadlines = {k: v for k, v in self._close_deadlines.items() if v > cutoff}
+        self._close_deadlines[market_id] = deadline
+        return deadline
 
     async def close(self) -> None:
         """Close the client and cleanup."""
         self._connected = False
         await self.live_prices.stop()
+        await self.market_feed.stop()
         self._executor.shutdown(wait=False)
         logger.info("Polymarket client closed")
 
@@ -139,6 +139,14 @@ async def search_markets():
 
     markets = await client.find_btc_5min_markets()
 
+    # Price every YES/NO token of every market in one batch instead of one request per token
+    prices = await client.get_current_prices([
+        token["token_id"]
+        for m in markets
+        for token in m.get("tokens", [])
+        if token.get("outcome") in ("Yes", "No") and token.get("token_id")
+    ])
+
     market_list = []
     for m in markets:
         tokens = m.get("tokens", [])
@@ -147,11 +155,9 @@ async def search_markets():
 
         for token in tokens:
             if token.get("outcome") == "Yes":
-                price = await client.get_current_price(token.get("token_id"))
-                yes_price = price
+                yes_price = prices.get(token.get("token_id"))
             elif token.get("outcome") == "No":
-                price = await client.get_current_price(token.get("token_id"))
-                no_price = price
+                no_price = prices.get(token.get("token_id"))
 
         try:
             end_date = datetime.fromisoformat(
@@ -3,33 +3,51 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db, Trade, Position
+from ..database import get_db, Trade
 from ..models.schemas import TradeResponse, TradeListResponse
+from ..outcome_cache import get_outcome_cache
 
 router = APIRouter(prefix="/api/trades", tags=["trades"])
 
 
-def trade_to_response(trade: Trade, token_to_outcome: dict) -> TradeResponse:
-    """Convert Trade model to TradeResponse with outcome."""
-    data = {
-        "id": trade.id,
-        "order_id": trade.order_id,
-        "market_id": trade.market_id,
-        "token_id": trade.token_id,
-        "side": trade.side.value,
-        "price": trade.price,
-        "size": trade.size,
-        "filled_size": trade.filled_size,
-        "status": trade.status.value,
-        "pnl": trade.pnl,
-        "outcome": token_to_outcome.get(trade.token_id, "YES"),  # Default to YES
-        "created_at": trade.created_at,
-        "updated_at": trade.updated_at,
-    }
-    return TradeResponse(**data)
+# Columns needed to build a TradeResponse - selecting these instead of the
+# Trade entity returns lightweight rows that skip the ORM identity map
+TRADE_RESPONSE_COLUMNS = (
+    Trade.id,
+    Trade.order_id,
+    Trade.market_id,
+    Trade.token_id,
+    Trade.side,
+    Trade.price,
+    Trade.size,
+    Trade.filled_size,
+    Trade.status,
+    Trade.pnl,
+    Trade.created_at,
+    Trade.updated_at,
+)
+
+
+def trade_to_response(trade, token_to_outcome: dict) -> TradeResponse:
+    """Convert a Trade model (or a TRADE_RESPONSE_COLUMNS row) to TradeResponse with outcome."""
+    return TradeResponse(
+        id=trade.id,
+        order_id=trade.order_id,
+        market_id=trade.market_id,
+        token_id=trade.token_id,
+        side=trade.side.value,
+        price=trade.price,
+        size=trade.size,
+        filled_size=trade.filled_size,
+        status=trade.status.value,
+        pnl=trade.pnl,
+        outcome=token_to_outcome.get(trade.token_id, "YES"),  # Default to YES
+        created_at=trade.created_at,
+        updated_at=trade.updated_at,
+    )
 
 
 @router.get("", response_model=TradeListResponse)
@@ -42,7 +60,7 @@ async def get_trades(
 ):
     """Get paginated trade history."""
     # Build query
-    query = select(Trade)
+    query = select(*TRADE_RESPONSE_COLUMNS)
 
     if market_id:
         query = query.where(Trade.market_id == market_id)
@@ -51,29 +69,42 @@ async def get_trades(
         query = query.where(Trade.market_id != exclude_market_id)
 
     # Get total count
-    count_query = select(func.count()).select_from(Trade)
-    if market_id:
-        count_query = count_query.where(Trade.market_id == market_id)
-    if exclude_market_id:
-        count_query = count_query.where(Trade.market_id != exclude_market_id)
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total = None
+    if not market_id and not exclude_market_id and db.bind.dialect.name == "postgresql":
+        # Unfiltered COUNT(*) is a full heap scan in Postgres - the planner's
+        # row estimate is good enough for the UI total badge
+        total_result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": Trade.__tablename__}
+        )
+        estimate = total_result.scalar()
+        # reltuples is -1 until the table has been vacuumed/analyzed once
+        if estimate is not None and estimate >= 0:
+            total = estimate
+
+    if total is None:
+        count_query = select(func.count()).select_from(Trade)
+        if market_id:
+            count_query = count_query.where(Trade.market_id == market_id)
+        if exclude_market_id:
+            count_query = count_query.where(Trade.market_id != exclude_market_id)
+
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
 
     # Get paginated results
     offset = (page - 1) * page_size
     query = query.order_by(desc(Trade.created_at)).offset(offset).limit(page_size)
 
     result = await db.execute(query)
-    trades = result.scalars().all()
+    trades = result.all()
 
-    # Get all positions to map token_id to outcome
-    positions_result = await db.execute(select(Position))
-    positions = positions_result.scalars().all()
-    token_to_outcome = {p.token_id: p.outcome for p in positions}
+    # Map token_id to outcome for just the tokens on this page
+    token_to_outcome = await get_outcome_cache().get_many(db, (t.token_id for t in trades))
 
     return TradeListResponse(
-        trades=[trade_to_response(t, token_to_outcome) for t in trades],
+        # Generator - pydantic builds the only list, no intermediate copy
+        trades=(trade_to_response(t, token_to_outcome) for t in trades),
         total=total,
         page=page,
         page_size=page_size
@@ -95,9 +126,7 @@ async def get_trade(
         raise HTTPException(status_code=404, detail="Trade not found")
 
     # Get outcome from position
-    positions_result = await db.execute(select(Position))
-    positions = positions_result.scalars().all()
-    token_to_outcome = {p.token_id: p.outcome for p in positions}
+    token_to_outcome = await get_outcome_cache().get_many(db, [trade.token_id])
 
     return trade_to_response(trade, token_to_outcome)
 
@@ -117,8 +146,6 @@ async def get_trade_by_order_id(
         raise HTTPException(status_code=404, detail="Trade not found")
 
     # Get outcome from position
-    positions_result = await db.execute(select(Position))
-    positions = positions_result.scalars().all()
-    token_to_outcome = {p.token_id: p.outcome for p in positions}
+    token_to_outcome = await get_outcome_cache().get_many(db, [trade.token_id])
 
     return trade_to_response(trade, token_to_outcome)
@@ -3,7 +3,9 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Set, Optional
+from typing import Any, Dict, Set, Optional
+
+import orjson
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
@@ -13,12 +15,19 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["websocket"])
 
 
+async def _send(websocket: WebSocket, message: Dict[str, Any]) -> None:
+    """Send a JSON message, serialized with orjson, as a text frame."""
+    # Text (not bytes) so the browser receives a string it can JSON.parse
+    await websocket.send_text(orjson.dumps(message).decode())
+
+
 class ConnectionManager:
     """Manages WebSocket connections and price subscriptions."""
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[WebSocket, Set[str]] = {}  # ws -> set of token_ids
+        self.last_sent: Dict[WebSocket, Dict[str, Any]] = {}  # ws -> last prices pushed
         self._broadcast_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket) -> None:
@@ -33,19 +42,35 @@ class ConnectionManager:
         self.active_connections.discard(websocket)
         if websocket in self.subscriptions:
             del self.subscriptions[websocket]
+        self.last_sent.pop(websocket, None)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
     async def subscribe(self, websocket: WebSocket, token_ids: list) -> None:
         """Subscribe a WebSocket to token price updates."""
         if websocket in self.subscriptions:
             self.subscriptions[websocket].update(token_ids)
-            logger.debug(f"WebSocket subscribed to {len(token_ids)} tokens")
+            logger.debug("WebSocket subscribed to %d tokens", len(token_ids))
 
     async def unsubscribe(self, websocket: WebSocket, token_ids: list) -> None:
         """Unsubscribe a WebSocket from token price updates."""
         if websocket in self.subscriptions:
             for token_id in token_ids:
                 self.subscriptions[websocket].discard(token_id)
+                self.last_sent.get(websocket, {}).pop(token_id, None)
+
+    async def send_price_delta(self, websocket: WebSocket, prices: Dict[str, Any]) -> bool:
+        """Send only the prices that changed since the last push. Returns True if sent."""
+        last = self.last_sent.setdefault(websocket, {})
+        delta = {t: p for t, p in prices.items() if last.get(t) != p}
+        if not delta:
+            return False
+
+        await _send(websocket, {
+            "type": "prices_delta",
+            "data": delta
+        })
+        last.update(delta)
+        return True
 
     async def broadcast_prices(self) -> None:
         """Broadcast LIVE prices to all subscribed connections - NO CACHING."""
@@ -67,13 +92,10 @@ class ConnectionManager:
                 )
 
                 if prices_to_send:
-                    await websocket.send_json({
-                        "type": "prices",
-                        "data": prices_to_send
-                    })
+                    await self.send_price_delta(websocket, prices_to_send)
 
             except Exception as e:
-                logger.debug(f"Error broadcasting to WebSocket: {e}")
+                logger.debug("Error broadcasting to WebSocket: %s", e)
                 self.disconnect(websocket)
 
 
@@ -91,14 +113,14 @@ async def websocket_prices(websocket: WebSocket):
     - {"action": "unsubscribe", "token_ids": ["token1"]}
 
     Messages to client:
-    - {"type": "prices", "data": {"token_id": price, ...}}
+    - {"type": "prices_delta", "data": {"token_id": price, ...}}  (changed prices only)
     - {"type": "connected", "message": "Connected to price stream"}
     """
     await manager.connect(websocket)
 
     try:
         # Send connection confirmation
-        await websocket.send_json({
+        await _send(websocket, {
             "type": "connected",
             "message": "Connected to price stream"
         })
@@ -115,7 +137,7 @@ async def websocket_prices(websocket: WebSocket):
                 if action == "subscribe":
                     token_ids = data.get("token_ids", [])
                     await manager.subscribe(websocket, token_ids)
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "type": "subscribed",
                         "token_ids": token_ids
                     })
@@ -123,13 +145,13 @@ async def websocket_prices(websocket: WebSocket):
                 elif action == "unsubscribe":
                     token_ids = data.get("token_ids", [])
                     await manager.unsubscribe(websocket, token_ids)
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "type": "unsubscribed",
                         "token_ids": token_ids
                     })
 
             except json.JSONDecodeError:
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "error",
                     "message": "Invalid JSON"
                 })
@@ -156,17 +178,13 @@ async def _broadcast_loop(websocket: WebSocket) -> None:
                     list(subscribed)
                 )
 
-                if prices_to_send:
-                    await websocket.send_json({
-                        "type": "prices",
-                        "data": prices_to_send
-                    })
-                    logger.debug(f"[WS] Sent live prices: {prices_to_send}")
+                if prices_to_send and await manager.send_price_delta(websocket, prices_to_send):
+                    logger.debug("[WS] Sent live prices: %s", prices_to_send)
 
             await asyncio.sleep(1.0)  # Fetch live prices every second
 
         except asyncio.CancelledError:
             break
         except Exception as e:
-            logger.debug(f"Broadcast loop error: {e}")
+            logger.debug("Broadcast loop error: %s", e)
             break
@@ -1,13 +1,18 @@
 """Core trading bot logic with async strategy execution."""
 
 import asyncio
+import itertools
 import logging
-import uuid
+import math
+import random
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Awaitable, Callable, List, NamedTuple, Tuple, Union
 from enum import Enum
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import get_settings
@@ -17,9 +22,99 @@ from .database import (
 )
 from .polymarket_client import PolymarketClient, get_polymarket_client
 from .btc_price_service import BTCPriceService, get_btc_price_service
+from .outcome_cache import get_outcome_cache
 
 logger = logging.getLogger(__name__)
 
+_floor = math.floor
+
+# Strategy time windows, in minutes to expiry
+LIVE_NO_BUY_THRESHOLD = 0 / 60  # No buying at or below this
+LIVE_FORCE_CLOSE_THRESHOLD = 3 / 60  # Force sell all positions at or below this
+LIVE_EARLY_BUY_THRESHOLD = 3.5  # No buying above this (first part of the trading window)
+PAPER_NO_BUY_THRESHOLD = 10 / 60
+PAPER_FORCE_CLOSE_THRESHOLD = 0 / 60
+PAPER_EARLY_BUY_THRESHOLD = 4
+ENTRY_NO_BUY_THRESHOLD = 10 / 60  # Abort entry retries this close to expiry
+
+# Smallest sell Polymarket accepts (shares) - a balance below this is dust
+MIN_ORDER_SIZE = 0.1
+
+# Shortest pause between strategy ticks (seconds), even when prices stream in
+MIN_TICK_INTERVAL = 0.25
+
+# Pause after a failed strategy tick (seconds) - doubles per consecutive failure up to the max
+ERROR_BACKOFF_MIN = 0.5
+ERROR_BACKOFF_MAX = 30.0
+
+# Queued DB writes (paper fills) are collected for this long and committed together
+DB_WRITE_BATCH_DELAY = 0.05
+DB_WRITE_BATCH_SIZE = 50
+
+# Periodic status actions, rewritten every tick with fresh prices - rate limited
+HEARTBEAT_ACTIONS = ("Watching for entry", "No buying", "Max positions", "Waiting for entry window", "Trading:")
+HEARTBEAT_INTERVAL = 5.0
+
+# Seconds a fetched live balance is reused by later strategy ticks and status polls
+LIVE_BALANCE_TTL = 2.0
+
+# BotState columns returned by get_status
+STATUS_COLUMNS = (
+    "is_running", "current_market_id", "last_action", "total_pnl", "trades_count",
+    "wins", "losses", "updated_at", "paper_balance", "paper_starting_balance",
+)
+
+
+class StatusLine(NamedTuple):
+    """
+    A last_action status kept as template + args, formatted only when written.
+    Per-tick statuses are usually replaced before they are flushed, and
+    comparing the args tuple is cheaper than formatting the string.
+    """
+    template: str
+    args: Tuple[Any, ...]
+    heartbeat: bool = True
+
+    def __str__(self) -> str:
+        return self.template % self.args
+
+
+def _is_heartbeat_action(action: Any) -> bool:
+    """Check if an action is a periodic heartbeat (ignoring a leading [LIVE]/[PAPER] tag)."""
+    if isinstance(action, StatusLine):
+        return action.heartbeat
+    if not action:
+        return False
+    if action.startswith("["):
+        action = action.split("] ", 1)[-1]
+    return action.startswith(HEARTBEAT_ACTIONS)
+
+# Last formatted log timestamp - many lines are logged within the same second
+_ts_sec: int = -1
+_ts_str: str = ""
+
+
+def _timestamp() -> str:
+    """Get current UTC timestamp for logging, formatted at most once per second."""
+    global _ts_sec, _ts_str
+    sec = int(time.time())
+    if sec != _ts_sec:
+        _ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec))
+        _ts_sec = sec
+    return _ts_str
+
+
+class _LazyTimestamp:
+    """Log argument that formats the timestamp only if the record is emitted."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return _timestamp()
+
+
+LOG_TS = _LazyTimestamp()
+
 
 class BotAction(Enum):
     """Bot action types for logging."""
@@ -39,38 +134,116 @@ class BotAction(Enum):
     PAPER_MONITORING = "Monitoring SL/Target"
 
 
+# Plain-string copies of the actions written to bot state (skips Enum.value lookups)
+ACTION_STARTED = BotAction.STARTED.value
+ACTION_STOPPED = BotAction.STOPPED.value
+ACTION_MONITORING = BotAction.MONITORING.value
+ACTION_SQUARE_OFF = BotAction.SQUARE_OFF.value
+ACTION_PRICE_TARGET = BotAction.PRICE_TARGET.value
+ACTION_MAX_LOSS = BotAction.MAX_LOSS.value
+
+
+class MarketSnapshot(NamedTuple):
+    """Fields of a market that are fixed for its lifetime, resolved once at discovery."""
+    id: str
+    condition_id: Optional[str]
+    yes_token_id: str
+    no_token_id: str
+    question: str
+
+
+class ExitPnL(NamedTuple):
+    """Fees and P&L of closing a position."""
+    buy_fee: float
+    sell_fee: float
+    total_fees: float
+    gross_pnl: float
+    net_pnl: float
+    net_pnl_pct: float
+
+
+class QueuedWrite(NamedTuple):
+    """A DB write waiting on _db_writer."""
+    write: Callable[[AsyncSession], Awaitable[None]]
+    cost: float = 0.0  # Paper buy cost the write deducts from the balance
+    on_error: Optional[Callable[[], None]] = None  # Called if the write is never committed
+
+
+def _compute_exit_pnl(entry_price: float, exit_price: float, size: float, fee_rate: float, min_fee: float) -> ExitPnL:
+    """
+    Compute fees and P&L for selling size tokens bought at entry_price.
+    Each side pays a taker fee of max(value * fee_rate, min_fee).
+    """
+    buy_value = entry_price * size
+    sell_value = exit_price * size
+    buy_fee = max(buy_value * fee_rate, min_fee)
+    sell_fee = max(sell_value * fee_rate, min_fee)
+    total_fees = buy_fee + sell_fee
+    # Net P&L = (sell_price - buy_price) * size - buy_fee - sell_fee
+    gross_pnl = (exit_price - entry_price) * size
+    net_pnl = gross_pnl - total_fees
+    net_pnl_pct = (net_pnl / buy_value) * 100 if buy_value > 0 else 0
+    return ExitPnL(buy_fee, sell_fee, total_fees, gross_pnl, net_pnl, net_pnl_pct)
+
+
 class PaperTradingState:
     """Track paper trading strategy state."""
+    __slots__ = ("position_open", "entry_price", "entry_side", "entry_token_id", "entry_order_id", "stoploss_price", "positions_taken")
+
     def __init__(self):
         self.position_open = False
         self.entry_price = 0.0
         self.entry_side = None
         self.entry_token_id = None
+        self.entry_order_id = None  # Paper order that opened the position
+        self.stoploss_price = 0.0  # Soft stoploss, fixed at entry
         self.positions_taken = 0
 
     def reset(self):
         """Reset position state (preserves positions_taken externally)."""
-        logger.debug(f"[STATE] PaperTradingState.reset() called - position_open was {self.position_open}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] PaperTradingState.reset() called - position_open was %s", self.position_open)
         self.position_open = False
         self.entry_price = 0.0
         self.entry_side = None
         self.entry_token_id = None
+        self.entry_order_id = None
+        self.stoploss_price = 0.0
         self.positions_taken = 0
-        logger.debug(f"[STATE] PaperTradingState.reset() done - position_open is now {self.position_open}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] PaperTradingState.reset() done - position_open is now %s", self.position_open)
 
     def close_position(self):
         """Close current position and increment positions_taken."""
-        logger.info(f"[STATE] Closing paper position - was open: {self.position_open}, positions_taken: {self.positions_taken}")
+        logger.info("[STATE] Closing paper position - was open: %s, positions_taken: %s", self.position_open, self.positions_taken)
         self.position_open = False
         self.entry_price = 0.0
         self.entry_side = None
         self.entry_token_id = None
+        self.entry_order_id = None
+        self.stoploss_price = 0.0
         self.positions_taken += 1
-        logger.info(f"[STATE] Paper position closed - position_open: {self.position_open}, positions_taken: {self.positions_taken}")
+        logger.info("[STATE] Paper position closed - position_open: %s, positions_taken: %s", self.position_open, self.positions_taken)
+
+    def cancel_entry(self):
+        """Undo an entry whose fill was never recorded (positions_taken is unchanged)."""
+        logger.info("[STATE] Cancelling paper entry %s - its fill was dropped", self.entry_order_id)
+        self.position_open = False
+        self.entry_price = 0.0
+        self.entry_side = None
+        self.entry_token_id = None
+        self.entry_order_id = None
+        self.stoploss_price = 0.0
 
 
 class LiveTradingState:
     """Track live trading strategy state."""
+    __slots__ = (
+        "position_open", "entry_price", "entry_side", "entry_token_id", "positions_taken",
+        "buy_order_id", "buy_filled", "filled_size", "stoploss_price", "stoploss_order_id",
+        "stoploss_order_placed", "use_soft_stoploss", "sell_attempted",
+    )
+
     def __init__(self):
         self.position_open = False
         self.entry_price = 0.0
@@ -88,7 +261,8 @@ class LiveTradingState:
 
     def reset(self):
         """Reset all state (preserves positions_taken externally)."""
-        logger.debug(f"[STATE] LiveTradingState.reset() called - position_open was {self.position_open}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] LiveTradingState.reset() called - position_open was %s", self.position_open)
         self.position_open = False
         self.entry_price = 0.0
         self.entry_side = None
@@ -102,11 +276,12 @@ class LiveTradingState:
         self.stoploss_order_placed = False
         self.use_soft_stoploss = False
         self.sell_attempted = False
-        logger.debug(f"[STATE] LiveTradingState.reset() done - position_open is now {self.position_open}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] LiveTradingState.reset() done - position_open is now %s", self.position_open)
 
     def close_position(self):
         """Close current position and increment positions_taken."""
-        logger.info(f"[STATE] Closing live position - was open: {self.position_open}, positions_taken: {self.positions_taken}")
+        logger.info("[STATE] Closing live position - was open: %s, positions_taken: %s", self.position_open, self.positions_taken)
         prev_positions = self.positions_taken
         self.position_open = False
         self.entry_price = 0.0
@@ -121,7 +296,7 @@ class LiveTradingState:
         self.use_soft_stoploss = False
         self.sell_attempted = False
         self.positions_taken = prev_positions + 1
-        logger.info(f"[STATE] Live position closed - position_open: {self.position_open}, positions_taken: {self.positions_taken}")
+        logger.info("[STATE] Live position closed - position_open: %s, positions_taken: %s", self.position_open, self.positions_taken)
 
 
 class TradingBot:
@@ -134,10 +309,52 @@ class TradingBot:
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._current_market: Optional[Dict[str, Any]] = None
-        self._active_orders: Dict[str, Dict[str, Any]] = {}
+        self._active_orders: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (token_id, side) -> order
         self._paper_state = PaperTradingState()
         self._live_state = LiveTradingState()  # Live trading state
         self._price_to_beat_fetched = False  # Track if market open price has been fetched for current market
+        self._tick_start = 0.0  # time.monotonic() at the start of the current strategy tick
+        self._snapshot: Optional[MarketSnapshot] = None  # Resolved fields of the current market
+        self._tick_prices: Dict[str, float] = {}  # token_id -> price fetched during the current tick
+        self._last_price_log_ts = 0.0  # time.monotonic() of the last [PRICE] log line
+        self._error_backoff = ERROR_BACKOFF_MIN  # Next pause after a failed strategy tick
+        self._market_options_cache: Dict[str, Dict[str, Any]] = {}  # market_id -> tick_size/neg_risk
+        self._db_queue: asyncio.Queue = asyncio.Queue()  # QueuedWrite jobs for _db_writer
+        self._db_writer_task: Optional[asyncio.Task] = None
+        self._queued_paper_cost = 0.0  # Paper buy cost queued but not yet deducted in the DB
+        # Paper order IDs - seeded from the start time (ms) so IDs stay unique across restarts
+        self._paper_order_seq = itertools.count(int(time.time() * 1000) << 20)
+        # Row IDs for primary-key lookups - positions and the bot state row are never deleted
+        self._position_ids: Dict[str, int] = {}  # token_id -> Position.id
+        self._bot_state_id: Optional[int] = None
+        self._pending_state: Dict[str, Any] = {}  # Bot state fields not yet written
+        self._last_state_payload: Dict[str, Any] = {}  # Bot state fields as last written
+        self._last_heartbeat = 0.0  # time.monotonic() of the last heartbeat action write
+        self._live_balance: Optional[Tuple[float, Optional[float]]] = None  # (time.monotonic(), live balance)
+        # BotState columns served by get_status - dropped after every DB write, reloaded on the next poll
+        self._status_row: Optional[Dict[str, Any]] = None
+        self._status_gen = 0  # Bumped on every DB write so an in-flight reload can't cache a stale row
+        self._bind_settings()
+
+    def _bind_settings(self) -> None:
+        """Copy strategy levels from settings onto plain attributes read on every tick."""
+        self._trigger = float(self.settings.trigger_price)
+        self._stoploss = float(self.settings.stoploss)
+        self._target = float(self.settings.target)
+        self._cancel_thresh = float(self.settings.order_cancel_threshold)
+        self._max_positions = int(self.settings.max_positions_per_market)
+        self._order_size = float(self.settings.order_size)
+        self._reentry_max = float(self.settings.reentry_max_price)
+        self._fee_rate = float(self.settings.taker_fee_rate)
+        self._min_fee = float(self.settings.min_taker_fee)
+        self._entry_min = float(self.settings.entry_min)
+        self._entry_max = float(self.settings.entry_max)
+        self._check_interval = float(self.settings.position_check_interval)
+        self._paper = bool(self.settings.paper_trading)
+        self._btc_filter = bool(self.settings.btc_price_filter_enabled)
+        self._btc_min_diff = float(self.settings.btc_min_price_difference)
+        self._price_target = float(self.settings.price_target)
+        self._max_loss = float(self.settings.max_loss)
 
     @property
     def is_running(self) -> bool:
@@ -158,6 +375,8 @@ class TradingBot:
             logger.warning("Bot is already running")
             return False, "Bot is already running"
 
+        self._bind_settings()
+
         # Initialize client
         self.client = await get_polymarket_client()
 
@@ -180,25 +399,28 @@ class TradingBot:
         # Initialize BTC price service if filter is enabled
         if self.settings.btc_price_filter_enabled:
             self.btc_service = await get_btc_price_service()
-            logger.info(f"[BTC] Price filter enabled (min difference: ${self.settings.btc_min_price_difference})")
+            logger.info("[BTC] Price filter enabled (min difference: $%s)", self.settings.btc_min_price_difference)
 
         # Reset trading state
         self._paper_state.reset()
         self._live_state.reset()
         self._price_to_beat_fetched = False
+        self._market_options_cache.clear()
 
         mode = "PAPER" if self.settings.paper_trading else "LIVE"
         btc_filter_status = f"BTC Filter: ${self.settings.btc_min_price_difference}" if self.settings.btc_price_filter_enabled else "BTC Filter: OFF"
-        logger.info(f"[{mode}] Bot started | Trigger: {self.settings.trigger_price} | Target: {self.settings.target} | SL: {self.settings.stoploss} | Size: {self.settings.order_size} | {btc_filter_status}")
+        logger.info("[%s] Bot started | Trigger: %s | Target: %s | SL: %s | Size: %s | %s", mode, self._trigger, self._target, self._stoploss, self._order_size, btc_filter_status)
 
         # Update database state
         await self._update_bot_state(
             is_running=True,
-            last_action=BotAction.STARTED.value,
+            last_action=ACTION_STARTED,
             current_market_id=market_id
         )
 
         self._task = asyncio.create_task(self._run_strategy(market_id))
+        if self._db_writer_task is None:
+            self._db_writer_task = asyncio.create_task(self._db_writer())
         return True, ""
 
     async def stop(self) -> bool:
@@ -219,6 +441,17 @@ class TradingBot:
         # Cancel all open orders
         if self.client and self.client.is_connected:
             await self.client.cancel_all_orders()
+        self._active_orders.clear()
+
+        # Drain queued DB writes before stopping the writer
+        if self._db_writer_task:
+            await self._db_queue.join()
+            self._db_writer_task.cancel()
+            try:
+                await self._db_writer_task
+            except asyncio.CancelledError:
+                pass
+            self._db_writer_task = None
 
         # Stop BTC price service
         if self.btc_service:
@@ -228,7 +461,7 @@ class TradingBot:
         # Update database state
         await self._update_bot_state(
             is_running=False,
-            last_action=BotAction.STOPPED.value
+            last_action=ACTION_STOPPED
         )
 
         logger.info("Trading bot stopped")
@@ -236,7 +469,7 @@ class TradingBot:
 
     def _timestamp(self) -> str:
         """Get current timestamp for logging."""
-        return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        return _timestamp()
 
     async def _run_strategy(self, target_market_id: Optional[str] = None) -> None:
         """Main trading strategy loop."""
@@ -244,6 +477,8 @@ class TradingBot:
 
         try:
             while self._running:
+                self._tick_start = time.monotonic()
+                self._tick_prices.clear()
                 try:
                     # Find a market to trade (always auto-discover to get next market)
                     market = await self._find_market(current_market_id)
@@ -252,11 +487,11 @@ class TradingBot:
                         await self._update_bot_state(
                             last_action="Scanning for Bitcoin Up/Down markets..."
                         )
-                        logger.info(f"[{self._timestamp()}] [BOT] No market found, scanning again in 10s...")
+                        logger.info("[%s] [BOT] No market found, scanning again in 10s...", LOG_TS)
                         await asyncio.sleep(10)
                         continue
 
-                    market_id = market.get("id") or market.get("conditionId")
+                    market_id = market["_id"]
                     time_to_close = market.get("time_to_close_minutes", float("inf"))
                     market_title = market.get("question", "Unknown")[:60]
 
@@ -265,16 +500,19 @@ class TradingBot:
                         # Reset state for new market
                         self._paper_state.reset()
                         self._live_state.reset()
+                        self._active_orders.clear()
                         current_market_id = None
                         await self._update_bot_state(last_action="Market expired, searching...")
                         await asyncio.sleep(2)
                         continue
 
                     # Check if we switched to a new market
-                    if self._current_market and (self._current_market.get("id") != market_id):
-                        logger.info(f"[{self._timestamp()}] [LIVE] New market: {market_title}")
+                    if self._current_market and (self._current_market["_id"] != market_id):
+                        logger.info("[%s] [LIVE] New market: %s", LOG_TS, market_title)
                         self._paper_state.reset()
                         self._live_state.reset()
+                        # Orders are tracked per token - the old market's can never match again
+                        self._active_orders.clear()
                         self._price_to_beat_fetched = False
                         # Clear old market open price
                         if self.btc_service:
@@ -284,66 +522,126 @@ class TradingBot:
                     current_market_id = market_id
 
                     # Fetch market open price during the early buffer period (first 2 minutes)
-                    # This runs once per market when time_to_close > EARLY_BUY_THRESHOLD
-                    if self.settings.btc_price_filter_enabled and self.btc_service and not self._price_to_beat_fetched:
-                        EARLY_BUY_THRESHOLD = 3.5  # Same as in strategy
-                        if time_to_close > EARLY_BUY_THRESHOLD:
+                    # This runs once per market when time_to_close > LIVE_EARLY_BUY_THRESHOLD
+                    if self._btc_filter and self.btc_service and not self._price_to_beat_fetched:
+                        if time_to_close > LIVE_EARLY_BUY_THRESHOLD:
                             market_slug = market.get("slug")
                             if market_slug:
-                                logger.info(f"[{self._timestamp()}] [BTC] Fetching market open price for {market_slug}...")
+                                logger.info("[%s] [BTC] Fetching market open price for %s...", LOG_TS, market_slug)
                                 price = await self.btc_service.fetch_price_to_beat(market_slug)
                                 if price:
                                     self._price_to_beat_fetched = True
                                     logger.info(f"[{self._timestamp()}] [BTC] Market open: ${price:,.2f}")
                                 else:
-                                    logger.warning(f"[{self._timestamp()}] [BTC] Could not fetch market open price")
+                                    logger.warning("[%s] [BTC] Could not fetch market open price", LOG_TS)
 
                     await self._update_bot_state(
                         current_market_id=market_id,
-                        last_action=f"Trading: {market_title}..."
+                        last_action=StatusLine("Trading: %s...", (market_title,))
                     )
 
                     # Execute trading logic (no time threshold - trade immediately)
-                    await self._execute_trading_logic(market)
+                    if self._snapshot is not None:
+                        await self._execute_trading_logic(market, self._snapshot)
 
                     # Monitor positions
                     await self._monitor_positions(market)
 
-                    await asyncio.sleep(self.settings.position_check_interval)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[%s] [BOT] Tick took %.1fms", LOG_TS, (time.monotonic() - self._tick_start) * 1000)
+
+                    # One bot state write per tick for the buffered heartbeat actions
+                    await self._flush_state()
+                    self._error_backoff = ERROR_BACKOFF_MIN
+
+                    await self._wait_next_tick(market.get("time_to_close_minutes", float("inf")))
 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    logger.error(f"[{self._timestamp()}] Strategy error: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    await asyncio.sleep(5)
+                    logger.exception("[%s] Strategy error: %s", LOG_TS, e)
+                    # Retry quickly after a one-off failure, back off when it persists
+                    await asyncio.sleep(self._error_backoff + random.uniform(0, 0.25))
+                    self._error_backoff = min(self._error_backoff * 2, ERROR_BACKOFF_MAX)
 
         except asyncio.CancelledError:
-            logger.info(f"[{self._timestamp()}] Strategy loop cancelled")
+            logger.info("[%s] Strategy loop cancelled", LOG_TS)
         finally:
             self._running = False
 
+    async def _wait_next_tick(self, time_to_close: float) -> None:
+        """
+        Sleep until the next strategy tick.
+
+        The delay shrinks as expiry approaches (a tenth of the remaining time,
+        capped at position_check_interval), and a streamed price update ends
+        the wait early - but never before MIN_TICK_INTERVAL.
+        """
+        delay = max(MIN_TICK_INTERVAL, min(self._check_interval, time_to_close * 60 / 10))
+        await asyncio.sleep(MIN_TICK_INTERVAL)
+
+        price_event = self.client.market_feed.price_event
+        price_event.clear()
+        try:
+            await asyncio.wait_for(price_event.wait(), timeout=delay - MIN_TICK_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
     async def _find_market(self, target_market_id: Optional[str]) -> Optional[Dict[str, Any]]:
         """Find a market to trade. Auto-discovers next market if current expired."""
-        # Always auto-discover to get the current/next active market
+        # The current market stays the soonest-closing one until it expires - keep it
+        # without a discovery scan while its (locally tracked) close time is ahead.
+        # Without a snapshot (its tokens couldn't be resolved) it is rediscovered,
+        # so the snapshot is rebuilt from fresh market data.
+        current = self._current_market
+        snapshot = self._snapshot
+        if current is not None and snapshot is not None and snapshot.id == current["_id"]:
+            time_to_close = await self.client.get_time_to_close(current["_id"])
+            if time_to_close:
+                current["time_to_close_minutes"] = time_to_close
+                return current
+
+        # Auto-discover to get the current/next active market
         markets = await self.client.find_btc_5min_markets()
 
         if markets:
             market = markets[0]
-            market_id = market.get("id") or market.get("conditionId")
-            time_to_close = market.get("time_to_close_minutes", 0)
+            # Canonical market ID, resolved once - downstream code reads market["_id"]
+            market["_id"] = market.get("id") or market.get("conditionId")
 
-            # Log tokens for debugging
-            tokens = market.get("tokens", [])
-            for t in tokens:
-                logger.debug(f"Token {t.get('outcome')}: price={t.get('price')}")
+            if self._snapshot is None or self._snapshot.id != market["_id"]:
+                self._snapshot = self._build_snapshot(market)
 
             return market
 
         return None
 
-    async def _execute_trading_logic(self, market: Dict[str, Any]) -> None:
+    def _build_snapshot(self, market: Dict[str, Any]) -> Optional[MarketSnapshot]:
+        """Resolve a market's YES/NO token IDs in a single pass. None if they can't be found."""
+        tokens = market.get("tokens", [])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Market data keys: %s", market.keys())
+            for t in tokens:
+                logger.debug("Token %s: price=%s", t.get("outcome"), t.get("price"))
+
+        if len(tokens) < 2:
+            logger.warning("Market doesn't have expected tokens. Got %s tokens. outcomes=%s, clobTokenIds=%s", len(tokens), market.get('outcomes'), market.get('clobTokenIds'))
+            return None
+
+        outcomes = {t.get("outcome"): t.get("token_id") for t in tokens}
+        if not outcomes.get("Yes") or not outcomes.get("No"):
+            logger.warning("Could not identify YES/NO tokens")
+            return None
+
+        return MarketSnapshot(
+            id=market["_id"],
+            condition_id=market.get("conditionId"),
+            yes_token_id=outcomes["Yes"],
+            no_token_id=outcomes["No"],
+            question=market.get("question", "Unknown"),
+        )
+
+    async def _execute_trading_logic(self, market: Dict[str, Any], snapshot: MarketSnapshot) -> None:
         """
         Execute the core trading logic.
 
@@ -360,28 +658,17 @@ class TradingBot:
         3. After buy fill, place sell order at 0.5
         4. No positions? Buy both YES and NO at 0.8
         """
-        tokens = market.get("tokens", [])
-        logger.debug(f"Market data keys: {market.keys()}")
-        logger.debug(f"Tokens found: {tokens}")
-
-        if len(tokens) < 2:
-            logger.warning(f"Market doesn't have expected tokens. Got {len(tokens)} tokens. "
-                          f"outcomes={market.get('outcomes')}, clobTokenIds={market.get('clobTokenIds')}")
-            return
-
-        # Get YES and NO token IDs
-        yes_token = next((t for t in tokens if t.get("outcome") == "Yes"), None)
-        no_token = next((t for t in tokens if t.get("outcome") == "No"), None)
+        yes_token_id = snapshot.yes_token_id
+        no_token_id = snapshot.no_token_id
 
-        if not yes_token or not no_token:
-            logger.warning("Could not identify YES/NO tokens")
-            return
-
-        yes_token_id = yes_token.get("token_id")
-        no_token_id = no_token.get("token_id")
+        # Stream prices (and live fills) for this market - no-op if already subscribed
+        await self.client.market_feed.subscribe_market(
+            [yes_token_id, no_token_id],
+            condition_id=snapshot.condition_id
+        )
 
         # Use different strategy for paper trading vs live trading
-        if self.settings.paper_trading:
+        if self._paper:
             # PAPER TRADING - orders are simulated, not sent to Polymarket
             await self._execute_paper_trading_strategy(
                 market=market,
@@ -397,6 +684,24 @@ class TradingBot:
             no_token_id=no_token_id
         )
 
+    async def _get_prices(self, *token_ids: str) -> Dict[str, float]:
+        """
+        Get current prices for tokens, fetching at most once per strategy tick.
+        Tokens already priced this tick are reused; the rest are fetched in one
+        batch. Tokens without a price are omitted.
+        """
+        prices = {t: self._tick_prices[t] for t in token_ids if t in self._tick_prices}
+        missing = [t for t in token_ids if t not in prices]
+        if missing:
+            fetched = await self.client.get_current_prices(missing)
+            self._tick_prices.update(fetched)
+            prices.update(fetched)
+        return prices
+
+    async def _get_price(self, token_id: str) -> Optional[float]:
+        """Get the current price for one token (see _get_prices)."""
+        return (await self._get_prices(token_id)).get(token_id)
+
     async def _execute_live_trading_strategy(
         self,
         market: Dict[str, Any],
@@ -412,38 +717,24 @@ class TradingBot:
         5. FORCE SELL all positions when <= 5 seconds to expiry
         """
         # Config values
-        TRIGGER_PRICE = self.settings.trigger_price
-        STOPLOSS = self.settings.stoploss
-        TARGET = self.settings.target
-        ORDER_CANCEL_THRESHOLD = self.settings.order_cancel_threshold
-        NO_BUY_THRESHOLD = 0 / 60  # 10 seconds in minutes = 0.1667 - no buying below this
-        FORCE_CLOSE_THRESHOLD = 3 / 60  # 5 seconds in minutes - force sell all positions
-        EARLY_BUY_THRESHOLD = 3.5  # 3 minutes - don't buy in first 2 minutes of trading window
-        max_positions = self.settings.max_positions_per_market
-
-        # Get fresh time to close
-        market_id = market.get("id") or market.get("conditionId")
-        time_to_close = await self.client.get_time_to_close(market_id)
+        TRIGGER_PRICE = self._trigger
+        TARGET = self._target
+        ORDER_CANCEL_THRESHOLD = self._cancel_thresh
+        max_positions = self._max_positions
+
+        # Get fresh time to close first - the expiry checks below don't need prices
+        market_id = market["_id"]
+        try:
+            time_to_close = await self.client.get_time_to_close(market_id)
+        except Exception as e:
+            logger.warning("[%s] [LIVE] Time to close fetch failed: %s", LOG_TS, e)
+            time_to_close = None
         if time_to_close is None:
             time_to_close = market.get("time_to_close_minutes", 0)
         market["time_to_close_minutes"] = time_to_close
 
-        # Get live prices
-        yes_price = await self.client.get_current_price(yes_token_id)
-        no_price = await self.client.get_current_price(no_token_id)
-
-        if yes_price is None or no_price is None:
-            logger.warning(f"[{self._timestamp()}] [LIVE] Could not get prices - YES: {yes_price}, NO: {no_price}")
-            return
-
-        # Get and display balance
-        balance = await self.client.get_balance()
-        balance_str = f"${balance:.2f}" if balance is not None else "N/A"
-
-        logger.info(f"[{self._timestamp()}] [LIVE] YES: {yes_price:.4f} | NO: {no_price:.4f} | Time: {time_to_close:.1f}m | Balance: {balance_str}")
-
         # CRITICAL: Force close all positions when <= 5 seconds to expiry
-        if time_to_close <= FORCE_CLOSE_THRESHOLD:
+        if time_to_close <= LIVE_FORCE_CLOSE_THRESHOLD:
             await self._force_close_live_position(market, "5SEC_EXPIRY")
             return
 
@@ -452,73 +743,106 @@ class TradingBot:
             await self._handle_market_close_live(market)
             return
 
+        # Fetch live prices (one batch request) and balance concurrently - they are independent
+        results = await asyncio.gather(
+            self._get_prices(yes_token_id, no_token_id),
+            self._get_live_balance(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("[%s] [LIVE] Tick fetch failed: %s", LOG_TS, result)
+        prices, balance = (
+            None if isinstance(result, Exception) else result for result in results
+        )
+        prices = prices or {}
+        yes_price = prices.get(yes_token_id)
+        no_price = prices.get(no_token_id)
+
+        if yes_price is None or no_price is None:
+            logger.warning("[%s] [LIVE] Could not get prices - YES: %s, NO: %s", LOG_TS, yes_price, no_price)
+            return
+
+        # Per-tick status lines are logged at most once per second - streamed prices
+        # can wake the loop every MIN_TICK_INTERVAL
+        now = time.monotonic()
+        log_tick = now - self._last_price_log_ts >= 1.0
+        if log_tick:
+            self._last_price_log_ts = now
+            balance_str = f"${balance:.2f}" if balance is not None else "N/A"
+            logger.info("[%s] [LIVE] YES: %.4f | NO: %.4f | Time: %.1fm | Balance: %s", LOG_TS, yes_price, no_price, time_to_close, balance_str)
+
         # Log current state for debugging re-entry
-        logger.debug(f"[{self._timestamp()}] [LIVE] State check: position_open={self._live_state.position_open}, positions_taken={self._live_state.positions_taken}/{max_positions}, buy_filled={self._live_state.buy_filled}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] [LIVE] State check: position_open=%s, positions_taken=%s/%s, buy_filled=%s", LOG_TS, self._live_state.position_open, self._live_state.positions_taken, max_positions, self._live_state.buy_filled)
 
         # Check if we've reached max positions
         if self._live_state.positions_taken >= max_positions:
-            logger.info(f"[{self._timestamp()}] [LIVE] Max positions reached ({self._live_state.positions_taken}/{max_positions}). Waiting for next market...")
+            if log_tick:
+                logger.info("[%s] [LIVE] Max positions reached (%s/%s). Waiting for next market...", LOG_TS, self._live_state.positions_taken, max_positions)
             await self._update_bot_state(
-                last_action=f"Max positions reached ({self._live_state.positions_taken}/{max_positions}). Waiting for next market..."
+                last_action=StatusLine("Max positions reached (%s/%s). Waiting for next market...", (self._live_state.positions_taken, max_positions))
             )
             return
 
         # Check if we have a position open (either filled or pending)
         if self._live_state.position_open:
-            logger.debug(f"[{self._timestamp()}] [LIVE] Position is open, monitoring...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] [LIVE] Position is open, monitoring...", LOG_TS)
             await self._monitor_live_position(market)
             return
 
         # No position open - log that we're looking for entry
-        if self._live_state.positions_taken > 0:
-            logger.info(f"[{self._timestamp()}] [LIVE] Position {self._live_state.positions_taken} closed, looking for entry #{self._live_state.positions_taken + 1}...")
+        if log_tick and self._live_state.positions_taken > 0:
+            logger.info("[%s] [LIVE] Position %s closed, looking for entry #%s...", LOG_TS, self._live_state.positions_taken, self._live_state.positions_taken + 1)
 
         # NO BUYING when <= 10 seconds to expiry
-        if time_to_close <= NO_BUY_THRESHOLD:
+        if time_to_close <= LIVE_NO_BUY_THRESHOLD:
             time_seconds = time_to_close * 60
-            logger.info(f"[{self._timestamp()}] [LIVE] No buying - only {time_seconds:.1f}s to expiry (< 10s)")
+            if log_tick:
+                logger.info("[%s] [LIVE] No buying - only %.1fs to expiry (< 10s)", LOG_TS, time_seconds)
             await self._update_bot_state(
-                last_action=f"[LIVE] No buying - {time_seconds:.1f}s to expiry"
+                last_action=StatusLine("[LIVE] No buying - %.1fs to expiry", (time_seconds,))
             )
             return
 
         # NO BUYING in first 2 minutes of trading window (when > 3 minutes to expiry)
-        if time_to_close > EARLY_BUY_THRESHOLD:
-            logger.info(f"[{self._timestamp()}] [LIVE] Waiting for entry window - {time_to_close:.2f}m to expiry (> {EARLY_BUY_THRESHOLD}m)")
+        if time_to_close > LIVE_EARLY_BUY_THRESHOLD:
+            if log_tick:
+                logger.info("[%s] [LIVE] Waiting for entry window - %.2fm to expiry (> %sm)", LOG_TS, time_to_close, LIVE_EARLY_BUY_THRESHOLD)
             await self._update_bot_state(
-                last_action=f"[LIVE] Waiting for entry window - {time_to_close:.1f}m to expiry"
+                last_action=StatusLine("[LIVE] Waiting for entry window - %.1fm to expiry", (time_to_close,))
             )
             return
 
         # No position - look for entry signal (price >= trigger)
-        REENTRY_MAX_PRICE = self.settings.reentry_max_price
+        REENTRY_MAX_PRICE = self._reentry_max
         is_reentry = self._live_state.positions_taken > 0
 
-        logger.info(f"[{self._timestamp()}] [LIVE] Looking for entry: YES={yes_price:.4f}, NO={no_price:.4f}, trigger={TRIGGER_PRICE}, positions={self._live_state.positions_taken}/{max_positions}")
+        if log_tick:
+            logger.info("[%s] [LIVE] Looking for entry: YES=%.4f, NO=%.4f, trigger=%s, positions=%s/%s", LOG_TS, yes_price, no_price, TRIGGER_PRICE, self._live_state.positions_taken, max_positions)
 
         await self._update_bot_state(
-            last_action=f"[LIVE] Watching for entry (>= {TRIGGER_PRICE}) | YES: {yes_price:.3f}, NO: {no_price:.3f}"
+            last_action=StatusLine("[LIVE] Watching for entry (>= %s) | YES: %.3f, NO: %.3f", (TRIGGER_PRICE, yes_price, no_price))
         )
 
-        # Check YES side for entry signal
-        if yes_price >= TRIGGER_PRICE and yes_price < TARGET:
-            # Re-entry: only enter if price < REENTRY_MAX_PRICE
-            if is_reentry and yes_price >= REENTRY_MAX_PRICE:
-                logger.info(f"[{self._timestamp()}] [LIVE] Re-entry skipped: YES @ {yes_price:.4f} >= {REENTRY_MAX_PRICE} (only re-enter when price < {REENTRY_MAX_PRICE})")
-            else:
-                logger.info(f"[{self._timestamp()}] [LIVE] Entry signal triggered: YES @ {yes_price:.4f} >= {TRIGGER_PRICE}")
-                await self._place_live_entry(market=market, token_id=yes_token_id, side="YES", current_price=yes_price)
-                return
+        # Check both sides for an entry signal - higher price first, as it is the one likely to trigger
+        if yes_price >= no_price:
+            candidates = ((yes_price, yes_token_id, "YES"), (no_price, no_token_id, "NO"))
+        else:
+            candidates = ((no_price, no_token_id, "NO"), (yes_price, yes_token_id, "YES"))
 
-        # Check NO side for entry signal
-        if no_price >= TRIGGER_PRICE and no_price < TARGET:
+        for price, token_id, side in candidates:
+            if not TRIGGER_PRICE <= price < TARGET:
+                continue
             # Re-entry: only enter if price < REENTRY_MAX_PRICE
-            if is_reentry and no_price >= REENTRY_MAX_PRICE:
-                logger.info(f"[{self._timestamp()}] [LIVE] Re-entry skipped: NO @ {no_price:.4f} >= {REENTRY_MAX_PRICE} (only re-enter when price < {REENTRY_MAX_PRICE})")
-            else:
-                logger.info(f"[{self._timestamp()}] [LIVE] Entry signal triggered: NO @ {no_price:.4f} >= {TRIGGER_PRICE}")
-                await self._place_live_entry(market=market, token_id=no_token_id, side="NO", current_price=no_price)
-                return
+            if is_reentry and price >= REENTRY_MAX_PRICE:
+                if log_tick:
+                    logger.info("[%s] [LIVE] Re-entry skipped: %s @ %.4f >= %s (only re-enter when price < %s)", LOG_TS, side, price, REENTRY_MAX_PRICE, REENTRY_MAX_PRICE)
+                continue
+            logger.info("[%s] [LIVE] Entry signal triggered: %s @ %.4f >= %s", LOG_TS, side, price, TRIGGER_PRICE)
+            await self._place_live_entry(market=market, token_id=token_id, side=side, current_price=price)
+            return
 
     async def _place_live_entry(
         self,
@@ -534,22 +858,21 @@ class TradingBot:
         Falls back to price increment if orderbook unavailable.
         """
         # CRITICAL: Final time check before placing order
-        NO_BUY_THRESHOLD = 10 / 60  # 10 seconds in minutes
-        market_id = market.get("id") or market.get("conditionId")
+        market_id = market["_id"]
         time_to_close = await self.client.get_time_to_close(market_id)
-        if time_to_close is not None and time_to_close <= NO_BUY_THRESHOLD:
+        if time_to_close is not None and time_to_close <= ENTRY_NO_BUY_THRESHOLD:
             time_seconds = time_to_close * 60
-            logger.info(f"[{self._timestamp()}] [LIVE] ORDER BLOCKED: Only {time_seconds:.1f}s to expiry (< 10s)")
+            logger.info("[%s] [LIVE] ORDER BLOCKED: Only %.1fs to expiry (< 10s)", LOG_TS, time_seconds)
             return
 
         # BTC Price Movement Filter - only place order if BTC moved enough from market open
-        if self.settings.btc_price_filter_enabled and self.btc_service:
+        if self._btc_filter and self.btc_service:
             should_place, price_info = await self.btc_service.should_place_order(
-                min_difference=self.settings.btc_min_price_difference
+                min_difference=self._btc_min_diff
             )
             if not should_place:
                 abs_diff = price_info.get('abs_difference', 0)
-                min_req = price_info.get('min_required', self.settings.btc_min_price_difference)
+                min_req = price_info.get('min_required', self._btc_min_diff)
                 market_open = price_info.get('price_to_beat')
                 live_price = price_info.get('live_price')
 
@@ -560,7 +883,7 @@ class TradingBot:
                         f"|${abs_diff:,.2f}| < ${min_req:,.2f}"
                     )
                 else:
-                    logger.info(f"[{self._timestamp()}] [LIVE] ORDER BLOCKED: BTC price data unavailable")
+                    logger.info("[%s] [LIVE] ORDER BLOCKED: BTC price data unavailable", LOG_TS)
 
                 await self._update_bot_state(
                     last_action=f"[BTC] Blocked: |${abs_diff:,.2f}| < ${min_req:,.2f}"
@@ -577,8 +900,7 @@ class TradingBot:
                     f"Diff: ${abs_diff:,.2f} {direction}"
                 )
 
-        TARGET = self.settings.target
-        STOPLOSS = self.settings.stoploss
+        TARGET = self._target
 
         # Retry settings for buy orders
         MAX_BUY_RETRIES = 5
@@ -589,12 +911,12 @@ class TradingBot:
         top_asks = await self.client.get_top_asks(token_id, count=5)
 
         if top_asks:
-            logger.info(f"[{self._timestamp()}] [LIVE] Using orderbook asks for buy: {top_asks}")
+            logger.info("[%s] [LIVE] Using orderbook asks for buy: %s", LOG_TS, top_asks)
             # Use orderbook ask prices for retries (already sorted lowest first)
             buy_prices = top_asks
         else:
             # Fallback: generate prices by incrementing from current price
-            logger.warning(f"[{self._timestamp()}] [LIVE] Orderbook unavailable, using fallback price increment")
+            logger.warning("[%s] [LIVE] Orderbook unavailable, using fallback price increment", LOG_TS)
             buy_prices = [
                 min(round(current_price + ((i + 1) * FALLBACK_PRICE_INCREMENT), 2), 0.99)
                 for i in range(MAX_BUY_RETRIES)
@@ -606,15 +928,15 @@ class TradingBot:
         for attempt in range(1, MAX_BUY_RETRIES + 1):
             # Check time before each attempt
             time_to_close = await self.client.get_time_to_close(market_id)
-            if time_to_close is not None and time_to_close <= NO_BUY_THRESHOLD:
+            if time_to_close is not None and time_to_close <= ENTRY_NO_BUY_THRESHOLD:
                 time_seconds = time_to_close * 60
-                logger.info(f"[{self._timestamp()}] [LIVE] BUY ABORTED: Only {time_seconds:.1f}s to expiry (< 10s)")
+                logger.info("[%s] [LIVE] BUY ABORTED: Only %.1fs to expiry (< 10s)", LOG_TS, time_seconds)
                 if buy_order_id:
                     try:
                         await self.client.cancel_order(buy_order_id)
-                        logger.info(f"[{self._timestamp()}] [LIVE] Cancelled pending buy order")
+                        logger.info("[%s] [LIVE] Cancelled pending buy order", LOG_TS)
                     except Exception as e:
-                        logger.warning(f"[{self._timestamp()}] [LIVE] Failed to cancel order: {e}")
+                        logger.warning("[%s] [LIVE] Failed to cancel order: %s", LOG_TS, e)
                 return
 
             # Get buy price for this attempt (use orderbook ask or fallback)
@@ -627,13 +949,13 @@ class TradingBot:
             # On final retry, use FOK (Fill-Or-Kill) market order to ensure fill
             is_final_attempt = (attempt == MAX_BUY_RETRIES)
 
-            logger.info(f"[{self._timestamp()}] ========== BUY ATTEMPT {attempt}/{MAX_BUY_RETRIES} ==========")
+            logger.info("[%s] ========== BUY ATTEMPT %s/%s ==========", LOG_TS, attempt, MAX_BUY_RETRIES)
 
             if is_final_attempt:
-                logger.info(f"[{self._timestamp()}] [RETRY] FINAL ATTEMPT - Switching to FOK MARKET ORDER")
-                logger.info(f"[{self._timestamp()}] [RETRY] FOK BUY: ${self.settings.order_size} worth @ market price (max 0.99)")
+                logger.info("[%s] [RETRY] FINAL ATTEMPT - Switching to FOK MARKET ORDER", LOG_TS)
+                logger.info("[%s] [RETRY] FOK BUY: $%s worth @ market price (max 0.99)", LOG_TS, self._order_size)
                 # For FOK market orders, use amount in dollars (price * size)
-                dollar_amount = 0.99 * self.settings.order_size
+                dollar_amount = 0.99 * self._order_size
                 market_result = await self.client.place_market_order(
                     token_id=token_id,
                     side="buy",
@@ -642,44 +964,44 @@ class TradingBot:
                 if market_result and market_result.get("orderID"):
                     buy_order_id = market_result.get("orderID")
                     final_buy_price = 0.99  # Market order price
-                    logger.info(f"[{self._timestamp()}] [RETRY] FOK ORDER PLACED: {buy_order_id[:20]}...")
+                    logger.info("[%s] [RETRY] FOK ORDER PLACED: %s...", LOG_TS, buy_order_id[:20])
                 else:
                     buy_order_id = None
-                    logger.warning(f"[{self._timestamp()}] [RETRY] FOK ORDER FAILED - No orderID in response")
-                    logger.warning(f"[{self._timestamp()}] [RETRY] Response: {market_result}")
+                    logger.warning("[%s] [RETRY] FOK ORDER FAILED - No orderID in response", LOG_TS)
+                    logger.warning("[%s] [RETRY] Response: %s", LOG_TS, market_result)
             else:
-                logger.info(f"[{self._timestamp()}] [RETRY] LIMIT ORDER: {self.settings.order_size} shares @ {buy_price} (ask price)")
+                logger.info("[%s] [RETRY] LIMIT ORDER: %s shares @ %s (ask price)", LOG_TS, self._order_size, buy_price)
                 buy_order_id = await self._place_order(
                     market=market,
                     token_id=token_id,
                     side="buy",
                     price=buy_price,
-                    size=self.settings.order_size,
+                    size=self._order_size,
                     outcome=side
                 )
                 # Set final price for limit orders (FOK price is set in the if block above)
                 if buy_order_id:
                     final_buy_price = buy_price
-                    logger.info(f"[{self._timestamp()}] [RETRY] LIMIT ORDER PLACED: {buy_order_id[:20]}...")
+                    logger.info("[%s] [RETRY] LIMIT ORDER PLACED: %s...", LOG_TS, buy_order_id[:20])
 
             if not buy_order_id:
-                logger.warning(f"[{self._timestamp()}] [RETRY] ORDER PLACEMENT FAILED (attempt {attempt})")
+                logger.warning("[%s] [RETRY] ORDER PLACEMENT FAILED (attempt %s)", LOG_TS, attempt)
                 if attempt < MAX_BUY_RETRIES:
-                    logger.info(f"[{self._timestamp()}] [RETRY] Waiting 0.5s before next attempt...")
+                    logger.info("[%s] [RETRY] Waiting 0.5s before next attempt...", LOG_TS)
                     await asyncio.sleep(0.5)
                     # Refresh orderbook for next attempt
                     fresh_asks = await self.client.get_top_asks(token_id, count=5)
                     if fresh_asks:
                         buy_prices = fresh_asks
-                        logger.info(f"[{self._timestamp()}] [RETRY] Refreshed orderbook asks: {fresh_asks}")
+                        logger.info("[%s] [RETRY] Refreshed orderbook asks: %s", LOG_TS, fresh_asks)
                 continue
 
             # Wait briefly then check order status using get_order API
-            logger.info(f"[{self._timestamp()}] [RETRY] Waiting {FILL_CHECK_DELAY}s to check fill status...")
+            logger.info("[%s] [RETRY] Waiting %ss to check fill status...", LOG_TS, FILL_CHECK_DELAY)
             await asyncio.sleep(FILL_CHECK_DELAY)
 
             # Check order status using get_order API (more reliable than is_order_active)
-            logger.info(f"[{self._timestamp()}] [RETRY] Checking order status via get_order API...")
+            logger.info("[%s] [RETRY] Checking order status via get_order API...", LOG_TS)
             order_status = await self.client.check_order_status(buy_order_id)
 
             # Log status to dashboard
@@ -688,18 +1010,18 @@ class TradingBot:
             original_size = order_status.get("original_size", 0)
             fill_pct = order_status.get("fill_percent", 0)
 
-            logger.info(f"[{self._timestamp()}] ╔══════════════════════════════════════════════════════════")
-            logger.info(f"[{self._timestamp()}] ║ ORDER STATUS: {status_str}")
-            logger.info(f"[{self._timestamp()}] ║ Filled: {size_matched}/{original_size} ({fill_pct:.1f}%)")
-            logger.info(f"[{self._timestamp()}] ║ Is Filled: {order_status.get('is_filled')} | Is Active: {order_status.get('is_active')}")
-            logger.info(f"[{self._timestamp()}] ╚══════════════════════════════════════════════════════════")
+            logger.info("[%s] ╔══════════════════════════════════════════════════════════", LOG_TS)
+            logger.info("[%s] ║ ORDER STATUS: %s", LOG_TS, status_str)
+            logger.info("[%s] ║ Filled: %s/%s (%.1f%%)", LOG_TS, size_matched, original_size, fill_pct)
+            logger.info("[%s] ║ Is Filled: %s | Is Active: %s", LOG_TS, order_status.get('is_filled'), order_status.get('is_active'))
+            logger.info("[%s] ╚══════════════════════════════════════════════════════════", LOG_TS)
 
             # Update trade record with status
             await self._update_trade_status(buy_order_id, OrderStatus.FILLED if order_status.get("is_filled") else OrderStatus.OPEN)
 
             # Check if order is fully filled
             if order_status.get("is_filled"):
-                logger.info(f"[{self._timestamp()}] [RETRY] ORDER FILLED! Status: {status_str}")
+                logger.info("[%s] [RETRY] ORDER FILLED! Status: %s", LOG_TS, status_str)
                 # Update filled size
                 if size_matched > 0:
                     self._live_state.filled_size = size_matched
@@ -707,73 +1029,73 @@ class TradingBot:
 
             # Check if order status is MATCHED (filled)
             if status_str in ["MATCHED", "FILLED"]:
-                logger.info(f"[{self._timestamp()}] [RETRY] ORDER MATCHED/FILLED! Status: {status_str}")
+                logger.info("[%s] [RETRY] ORDER MATCHED/FILLED! Status: %s", LOG_TS, status_str)
                 if size_matched > 0:
                     self._live_state.filled_size = size_matched
                 break
 
             # Double-check via balance (backup verification)
             actual_balance = await self.client.get_token_balance(token_id)
-            logger.info(f"[{self._timestamp()}] [RETRY] Token balance check: {actual_balance}")
-            if actual_balance and actual_balance >= self.settings.order_size * 0.9:
-                logger.info(f"[{self._timestamp()}] [RETRY] ORDER FILLED! (confirmed via balance: {actual_balance})")
+            logger.info("[%s] [RETRY] Token balance check: %s", LOG_TS, actual_balance)
+            if actual_balance and actual_balance >= self._order_size * 0.9:
+                logger.info("[%s] [RETRY] ORDER FILLED! (confirmed via balance: %s)", LOG_TS, actual_balance)
                 self._live_state.filled_size = actual_balance
                 break
 
             # Order still active/open - need to cancel and retry
             if order_status.get("is_active") or status_str in ["LIVE", "OPEN", "PENDING"]:
-                logger.warning(f"[{self._timestamp()}] [RETRY] ORDER NOT FILLED - Status: {status_str}, cancelling...")
+                logger.warning("[%s] [RETRY] ORDER NOT FILLED - Status: %s, cancelling...", LOG_TS, status_str)
 
                 # Cancel the unfilled order
                 cancel_success = False
                 try:
-                    logger.info(f"[{self._timestamp()}] [CANCEL] Cancelling order {buy_order_id[:20]}...")
+                    logger.info("[%s] [CANCEL] Cancelling order %s...", LOG_TS, buy_order_id[:20])
                     cancel_result = await self.client.cancel_order(buy_order_id)
                     if cancel_result:
-                        logger.info(f"[{self._timestamp()}] [CANCEL] Cancel API returned success")
+                        logger.info("[%s] [CANCEL] Cancel API returned success", LOG_TS)
                         cancel_success = True
                     else:
-                        logger.warning(f"[{self._timestamp()}] [CANCEL] Cancel API returned False")
+                        logger.warning("[%s] [CANCEL] Cancel API returned False", LOG_TS)
                 except Exception as e:
-                    logger.warning(f"[{self._timestamp()}] [CANCEL] Cancel exception: {e}")
+                    logger.warning("[%s] [CANCEL] Cancel exception: %s", LOG_TS, e)
 
                 # If single cancel failed, try cancel_all as fallback
                 if not cancel_success:
                     try:
-                        logger.info(f"[{self._timestamp()}] [CANCEL] Trying cancel_all as fallback...")
+                        logger.info("[%s] [CANCEL] Trying cancel_all as fallback...", LOG_TS)
                         await self.client.cancel_all_orders()
-                        logger.info(f"[{self._timestamp()}] [CANCEL] cancel_all completed")
+                        logger.info("[%s] [CANCEL] cancel_all completed", LOG_TS)
                         cancel_success = True
                     except Exception as e:
-                        logger.warning(f"[{self._timestamp()}] [CANCEL] cancel_all also failed: {e}")
+                        logger.warning("[%s] [CANCEL] cancel_all also failed: %s", LOG_TS, e)
 
                 # Wait and verify cancellation via get_order API
-                logger.info(f"[{self._timestamp()}] [CANCEL] Waiting 0.5s to verify cancellation...")
+                logger.info("[%s] [CANCEL] Waiting 0.5s to verify cancellation...", LOG_TS)
                 await asyncio.sleep(0.5)
 
                 # Verify cancellation using get_order API
                 verify_status = await self.client.check_order_status(buy_order_id)
                 verify_status_str = verify_status.get("status", "UNKNOWN")
-                logger.info(f"[{self._timestamp()}] [CANCEL] Post-cancel status: {verify_status_str}")
+                logger.info("[%s] [CANCEL] Post-cancel status: %s", LOG_TS, verify_status_str)
 
                 if verify_status.get("is_active"):
-                    logger.warning(f"[{self._timestamp()}] [CANCEL] WARNING: Order STILL ACTIVE after cancellation!")
+                    logger.warning("[%s] [CANCEL] WARNING: Order STILL ACTIVE after cancellation!", LOG_TS)
                 else:
-                    logger.info(f"[{self._timestamp()}] [CANCEL] Order confirmed cancelled/inactive (Status: {verify_status_str})")
+                    logger.info("[%s] [CANCEL] Order confirmed cancelled/inactive (Status: %s)", LOG_TS, verify_status_str)
 
                 # Update trade record
                 await self._update_trade_status(buy_order_id, OrderStatus.CANCELLED)
 
             # Reset order ID for next attempt
             buy_order_id = None
-            logger.info(f"[{self._timestamp()}] [RETRY] Ready for next attempt...")
+            logger.info("[%s] [RETRY] Ready for next attempt...", LOG_TS)
 
             if attempt < MAX_BUY_RETRIES:
                 # Refresh orderbook for next attempt to get latest ask prices
                 fresh_asks = await self.client.get_top_asks(token_id, count=5)
                 if fresh_asks:
                     buy_prices = fresh_asks
-                    logger.info(f"[{self._timestamp()}] [LIVE] Refreshed orderbook asks: {fresh_asks}")
+                    logger.info("[%s] [LIVE] Refreshed orderbook asks: %s", LOG_TS, fresh_asks)
                 await asyncio.sleep(0.5)
 
         if buy_order_id:
@@ -787,60 +1109,78 @@ class TradingBot:
             # Calculate and store stoploss based on entry price (bought price - 0.2)
             calculated_sl = self._calculate_stoploss_price(final_buy_price, 0.2)
             self._live_state.stoploss_price = calculated_sl
-            logger.info(f"[{self._timestamp()}] [LIVE] BUY {side} @ {final_buy_price:.4f} | Target: {TARGET} | SL: {calculated_sl:.4f}")
+            logger.info("[%s] [LIVE] BUY %s @ %.4f | Target: %s | SL: %.4f", LOG_TS, side, final_buy_price, TARGET, calculated_sl)
 
             await self._update_bot_state(
                 last_action=f"[LIVE] Waiting for position confirmation..."
             )
         else:
-            logger.error(f"[{self._timestamp()}] [LIVE] BUY FAILED after {MAX_BUY_RETRIES} attempts")
+            logger.error("[%s] [LIVE] BUY FAILED after %s attempts", LOG_TS, MAX_BUY_RETRIES)
 
     async def _check_order_filled(self) -> bool:
         """Check if buy order is filled using getOrder and getTrades APIs.
         Also updates self._live_state.filled_size with actual filled quantity."""
         if not self._live_state.buy_order_id:
-            logger.info(f"[{self._timestamp()}] [LIVE] No buy_order_id to check")
+            logger.info("[%s] [LIVE] No buy_order_id to check", LOG_TS)
             return False
 
         order_id = self._live_state.buy_order_id
-        logger.info(f"[{self._timestamp()}] [LIVE] Checking order: {order_id[:20]}...")
+        logger.info("[%s] [LIVE] Checking order: %s...", LOG_TS, order_id[:20])
+
+        # Fast path: fill already pushed on the CLOB user channel
+        streamed_size = self.client.market_feed.get_filled_size(order_id)
+        if streamed_size:
+            self._live_state.filled_size = streamed_size
+            logger.info("[%s] [LIVE] Order FILLED (WebSocket)! Size: %s", LOG_TS, streamed_size)
+            return True
+
+        # getOrder and getTrades are independent - query both at once
+        order, trades = await asyncio.gather(
+            self.client.get_order(order_id),
+            self.client.get_trades(),
+            return_exceptions=True
+        )
 
         # Method 1: Check order status via getOrder
-        try:
-            order = await self.client.get_order(order_id)
-            logger.info(f"[{self._timestamp()}] [LIVE] getOrder response: {order}")
+        if isinstance(order, Exception):
+            logger.error("[%s] [LIVE] getOrder error: %s", LOG_TS, order)
+        else:
+            try:
+                logger.info("[%s] [LIVE] getOrder response: %s", LOG_TS, order)
 
-            if order:
-                status = order.get("status", "").upper()
-                size_matched = order.get("size_matched") or order.get("sizeMatched") or "0"
-                size_matched = float(size_matched)
+                if order:
+                    status = order.get("status", "").upper()
+                    size_matched = order.get("size_matched") or order.get("sizeMatched") or "0"
+                    size_matched = float(size_matched)
 
-                logger.info(f"[{self._timestamp()}] [LIVE] Order status={status}, size_matched={size_matched}")
+                    logger.info("[%s] [LIVE] Order status=%s, size_matched=%s", LOG_TS, status, size_matched)
 
-                if status in ["FILLED", "MATCHED", "LIVE"] or size_matched > 0:
-                    # Store the actual filled size for selling later
-                    self._live_state.filled_size = size_matched
-                    logger.info(f"[{self._timestamp()}] [LIVE] Order FILLED! Size: {size_matched}")
-                    return True
-        except Exception as e:
-            logger.error(f"[{self._timestamp()}] [LIVE] getOrder error: {e}")
+                    if status in ["FILLED", "MATCHED", "LIVE"] or size_matched > 0:
+                        # Store the actual filled size for selling later
+                        self._live_state.filled_size = size_matched
+                        logger.info("[%s] [LIVE] Order FILLED! Size: %s", LOG_TS, size_matched)
+                        return True
+            except Exception as e:
+                logger.error("[%s] [LIVE] getOrder error: %s", LOG_TS, e)
 
         # Method 2: Check trades via getTrades
-        try:
-            trades = await self.client.get_trades()
-            logger.info(f"[{self._timestamp()}] [LIVE] getTrades returned {len(trades) if trades else 0} trades")
-
-            if trades:
-                for trade in trades:
-                    trade_order_id = trade.get("order_id") or trade.get("orderId") or trade.get("id")
-                    if trade_order_id == order_id:
-                        # Get size from trade if available
-                        trade_size = float(trade.get("size") or trade.get("amount") or self.settings.order_size)
-                        self._live_state.filled_size = trade_size
-                        logger.info(f"[{self._timestamp()}] [LIVE] Found matching trade! Size: {trade_size}")
-                        return True
-        except Exception as e:
-            logger.error(f"[{self._timestamp()}] [LIVE] getTrades error: {e}")
+        if isinstance(trades, Exception):
+            logger.error("[%s] [LIVE] getTrades error: %s", LOG_TS, trades)
+        else:
+            try:
+                logger.info("[%s] [LIVE] getTrades returned %s trades", LOG_TS, len(trades) if trades else 0)
+
+                if trades:
+                    for trade in trades:
+                        trade_order_id = trade.get("order_id") or trade.get("orderId") or trade.get("id")
+                        if trade_order_id == order_id:
+                            # Get size from trade if available
+                            trade_size = float(trade.get("size") or trade.get("amount") or self._order_size)
+                            self._live_state.filled_size = trade_size
+                            logger.info("[%s] [LIVE] Found matching trade! Size: %s", LOG_TS, trade_size)
+                            return True
+            except Exception as e:
+                logger.error("[%s] [LIVE] getTrades error: %s", LOG_TS, e)
 
         return False
 
@@ -852,11 +1192,11 @@ class TradingBot:
 
     async def _monitor_live_position(self, market: Dict[str, Any]) -> None:
         """Monitor live position - track price for target and stoploss."""
-        TARGET = self.settings.target
+        TARGET = self._target
 
         # If buy not confirmed yet, check order status
         if not self._live_state.buy_filled and self._live_state.buy_order_id:
-            logger.info(f"[{self._timestamp()}] [LIVE] Checking if order filled...")
+            logger.info("[%s] [LIVE] Checking if order filled...", LOG_TS)
             is_filled = await self._check_order_filled()
             if is_filled:
                 self._live_state.buy_filled = True
@@ -865,90 +1205,115 @@ class TradingBot:
                 # Use soft stoploss (price monitoring) - no limit order
                 self._live_state.use_soft_stoploss = True
                 self._live_state.stoploss_order_placed = True
-                logger.info(f"[{self._timestamp()}] [LIVE] FILLED! Entry: {self._live_state.entry_price:.4f} | Soft SL: {stoploss_price:.4f} | Target: {TARGET}")
+                logger.info("[%s] [LIVE] FILLED! Entry: %.4f | Soft SL: %.4f | Target: %s", LOG_TS, self._live_state.entry_price, stoploss_price, TARGET)
 
                 # Update trade status to FILLED and create position in database
-                market_id = market.get("id") or market.get("conditionId")
+                market_id = market["_id"]
                 await self._update_trade_status(self._live_state.buy_order_id, OrderStatus.FILLED)
                 await self._update_live_position(
                     market_id=market_id,
                     token_id=self._live_state.entry_token_id,
                     side="buy",
                     price=self._live_state.entry_price,
-                    size=self._live_state.filled_size if self._live_state.filled_size > 0 else self.settings.order_size,
+                    size=self._live_state.filled_size if self._live_state.filled_size > 0 else self._order_size,
                     outcome=self._live_state.entry_side
                 )
+                # Seed the streamed token balance now, so exits can size without a REST call
+                await self.client.get_conditional_balance(self._live_state.entry_token_id)
             return
 
-        # Get current price
-        current_price = await self.client.get_current_price(self._live_state.entry_token_id)
+        # Get current price (reuses the price fetched by the strategy this tick)
+        current_price = await self._get_price(self._live_state.entry_token_id)
         if not current_price:
             return
 
-        entry_price = self._live_state.entry_price
-        stoploss_price = getattr(self._live_state, 'stoploss_price', entry_price - 0.05)
-        pnl = (current_price - entry_price) * self.settings.order_size
-        pnl_pct = ((current_price - entry_price) / entry_price) * 100
-        time_to_close = market.get("time_to_close_minutes", 0)
-
-        await self._update_bot_state(
-            last_action=f"[LIVE] {self._live_state.entry_side}: {current_price:.4f} (${pnl:+.2f}) | SL: {stoploss_price:.2f} | {time_to_close:.1f}m"
-        )
+        # Exit checks first - both levels are fixed at entry, so this is two compares
+        stoploss_price = self._live_state.stoploss_price  # Set at entry, before buy_filled flips
 
         # Check if price reached TARGET - limit sell at target price for profit
         if current_price >= TARGET:
-            logger.info(f"[{self._timestamp()}] [LIVE] TARGET! Price {current_price:.4f} >= {TARGET}")
+            logger.info("[%s] [LIVE] TARGET! Price %.4f >= %s", LOG_TS, current_price, TARGET)
             await self._target_sell(market, TARGET, "TARGET")
             return
 
         # Check if price hit STOPLOSS - soft stoploss (price monitoring)
         if current_price <= stoploss_price:
-            logger.info(f"[{self._timestamp()}] [LIVE] STOPLOSS! Price {current_price:.4f} <= {stoploss_price:.4f}")
+            logger.info("[%s] [LIVE] STOPLOSS! Price %.4f <= %.4f", LOG_TS, current_price, stoploss_price)
             await self._market_sell(market, current_price, "STOPLOSS")
             return
 
-    async def _market_sell(self, market: Dict[str, Any], current_price: float, reason: str) -> None:
+        # Still holding - report status
+        pnl = (current_price - self._live_state.entry_price) * self._order_size
+        time_to_close = market.get("time_to_close_minutes", 0)
+
+        await self._update_bot_state(
+            last_action=StatusLine("[LIVE] %s: %.4f ($%+.2f) | SL: %.2f | %.1fm", (self._live_state.entry_side, current_price, pnl, stoploss_price, time_to_close))
+        )
+
+    async def _get_sell_balance(self, token_id: str) -> Optional[float]:
+        """
+        Token balance to size an exit with. The streamed balance is used only
+        while the user channel is connected and it covers the filled size - a
+        lower value may predate the fill (REST seeds can lag settlement), so
+        it is re-read from REST rather than mistaken for dust.
+        """
+        cached = self.client.market_feed.get_token_balance(token_id)
+        if cached is not None and cached >= max(self._live_state.filled_size, MIN_ORDER_SIZE):
+            return cached
+        return await self.client.get_conditional_balance(token_id)
+
+    async def _market_sell(
+        self,
+        market: Dict[str, Any],
+        current_price: float,
+        reason: str,
+        top_bids: Optional[List[float]] = None
+    ) -> None:
         """Execute market sell order using actual token balance.
 
         Uses orderbook bid prices for retry attempts to ensure fill.
-        Fetches top 5 bid prices and uses them sequentially for retries.
+        Fetches top 5 bid prices (unless passed in) and uses them sequentially for retries.
         Falls back to price reduction if orderbook unavailable.
         """
-        import math
 
         # Prevent repeated sell attempts (order might have gone through but returned error)
         if self._live_state.sell_attempted:
             # Check if we still have tokens - if not, the sell went through
             actual_balance = await self.client.get_conditional_balance(self._live_state.entry_token_id)
             if actual_balance is None or actual_balance < 0.1:
-                logger.info(f"[{self._timestamp()}] [LIVE] Previous sell appears to have succeeded (balance: {actual_balance}), closing position")
+                logger.info("[%s] [LIVE] Previous sell appears to have succeeded (balance: %s), closing position", LOG_TS, actual_balance)
                 await self._close_live_position(f"{reason}_CONFIRMED")
                 return
-            logger.info(f"[{self._timestamp()}] [LIVE] Retrying sell (balance: {actual_balance})...")
+            logger.info("[%s] [LIVE] Retrying sell (balance: %s)...", LOG_TS, actual_balance)
 
         # Mark that we're attempting a sell
         self._live_state.sell_attempted = True
 
-        # Get actual conditional token balance (most accurate)
-        actual_balance = await self.client.get_conditional_balance(self._live_state.entry_token_id)
-
-        # Minimum order size for Polymarket
-        MIN_ORDER_SIZE = 0.1
+        # Get actual conditional token balance (streamed from the user channel when tracked)
+        # and the orderbook bids together - both are needed before the first sell attempt
+        token_id = self._live_state.entry_token_id
+        if top_bids is None:
+            actual_balance, top_bids = await asyncio.gather(
+                self._get_sell_balance(token_id),
+                self.client.get_top_bids(token_id, count=5)
+            )
+        else:
+            actual_balance = await self._get_sell_balance(token_id)
 
         if actual_balance and actual_balance >= MIN_ORDER_SIZE:
-            sell_size = math.floor(actual_balance * 100) / 100
-            logger.info(f"[{self._timestamp()}] [LIVE] Actual token balance: {actual_balance}, selling: {sell_size}")
+            sell_size = _floor(actual_balance * 100) / 100
+            logger.info("[%s] [LIVE] Actual token balance: %s, selling: %s", LOG_TS, actual_balance, sell_size)
         elif actual_balance is not None and actual_balance < MIN_ORDER_SIZE:
-            logger.info(f"[{self._timestamp()}] [LIVE] Balance {actual_balance} too small to sell (min: {MIN_ORDER_SIZE}), closing position")
+            logger.info("[%s] [LIVE] Balance %s too small to sell (min: %s), closing position", LOG_TS, actual_balance, MIN_ORDER_SIZE)
             await self._close_live_position(f"{reason}_DUST")
             return
         else:
-            sell_size = self._live_state.filled_size if self._live_state.filled_size > 0 else self.settings.order_size
-            sell_size = math.floor(sell_size * 100) / 100
-            logger.info(f"[{self._timestamp()}] [LIVE] Using filled_size: {sell_size}")
+            sell_size = self._live_state.filled_size if self._live_state.filled_size > 0 else self._order_size
+            sell_size = _floor(sell_size * 100) / 100
+            logger.info("[%s] [LIVE] Using filled_size: %s", LOG_TS, sell_size)
 
         if sell_size < MIN_ORDER_SIZE:
-            logger.info(f"[{self._timestamp()}] [LIVE] Sell size {sell_size} too small (min: {MIN_ORDER_SIZE}), closing position")
+            logger.info("[%s] [LIVE] Sell size %s too small (min: %s), closing position", LOG_TS, sell_size, MIN_ORDER_SIZE)
             await self._close_live_position(f"{reason}_DUST")
             return
 
@@ -957,16 +1322,14 @@ class TradingBot:
         FALLBACK_PRICE_REDUCTION = 0.02  # Fallback if orderbook unavailable
         FILL_CHECK_DELAY = 1.0  # Wait 1 second before checking if filled
 
-        # Fetch top 5 bid prices from orderbook for smart pricing
-        top_bids = await self.client.get_top_bids(self._live_state.entry_token_id, count=5)
-
+        # Top 5 bid prices from orderbook for smart pricing
         if top_bids:
-            logger.info(f"[{self._timestamp()}] [LIVE] Using orderbook bids for sell: {top_bids}")
+            logger.info("[%s] [LIVE] Using orderbook bids for sell: %s", LOG_TS, top_bids)
             # Use orderbook bid prices for retries
             sell_prices = top_bids
         else:
             # Fallback: generate prices by reducing from current price
-            logger.warning(f"[{self._timestamp()}] [LIVE] Orderbook unavailable, using fallback price reduction")
+            logger.warning("[%s] [LIVE] Orderbook unavailable, using fallback price reduction", LOG_TS)
             sell_prices = [
                 max(round(current_price - (i * FALLBACK_PRICE_REDUCTION), 2), 0.01)
                 for i in range(1, MAX_SELL_RETRIES + 1)
@@ -986,11 +1349,11 @@ class TradingBot:
             # On final retry, use FOK (Fill-Or-Kill) market order to ensure fill
             is_final_attempt = (attempt == MAX_SELL_RETRIES)
 
-            logger.info(f"[{self._timestamp()}] ========== SELL ATTEMPT {attempt}/{MAX_SELL_RETRIES} ==========")
+            logger.info("[%s] ========== SELL ATTEMPT %s/%s ==========", LOG_TS, attempt, MAX_SELL_RETRIES)
 
             if is_final_attempt:
-                logger.info(f"[{self._timestamp()}] [RETRY] FINAL ATTEMPT - Switching to FOK MARKET ORDER")
-                logger.info(f"[{self._timestamp()}] [RETRY] FOK SELL: {sell_size} shares @ market price (min 0.01)")
+                logger.info("[%s] [RETRY] FINAL ATTEMPT - Switching to FOK MARKET ORDER", LOG_TS)
+                logger.info("[%s] [RETRY] FOK SELL: %s shares @ market price (min 0.01)", LOG_TS, sell_size)
                 # For FOK sell orders, amount is the number of shares to sell
                 market_result = await self.client.place_market_order(
                     token_id=self._live_state.entry_token_id,
@@ -1000,13 +1363,13 @@ class TradingBot:
                 if market_result and market_result.get("orderID"):
                     sell_order_id = market_result.get("orderID")
                     final_sell_price = 0.01  # Market order price (actual price may differ)
-                    logger.info(f"[{self._timestamp()}] [RETRY] FOK SELL ORDER PLACED: {sell_order_id[:20]}...")
+                    logger.info("[%s] [RETRY] FOK SELL ORDER PLACED: %s...", LOG_TS, sell_order_id[:20])
                 else:
                     sell_order_id = None
-                    logger.warning(f"[{self._timestamp()}] [RETRY] FOK SELL ORDER FAILED - No orderID in response")
-                    logger.warning(f"[{self._timestamp()}] [RETRY] Response: {market_result}")
+                    logger.warning("[%s] [RETRY] FOK SELL ORDER FAILED - No orderID in response", LOG_TS)
+                    logger.warning("[%s] [RETRY] Response: %s", LOG_TS, market_result)
             else:
-                logger.info(f"[{self._timestamp()}] [RETRY] LIMIT ORDER: {sell_size} shares @ {sell_price} (bid price)")
+                logger.info("[%s] [RETRY] LIMIT ORDER: %s shares @ %s (bid price)", LOG_TS, sell_size, sell_price)
                 sell_order_id = await self._place_order(
                     market=market,
                     token_id=self._live_state.entry_token_id,
@@ -1018,26 +1381,26 @@ class TradingBot:
                 # Set final price for limit orders (FOK price is set in the if block above)
                 if sell_order_id:
                     final_sell_price = sell_price
-                    logger.info(f"[{self._timestamp()}] [RETRY] LIMIT ORDER PLACED: {sell_order_id[:20]}...")
+                    logger.info("[%s] [RETRY] LIMIT ORDER PLACED: %s...", LOG_TS, sell_order_id[:20])
 
             if not sell_order_id:
-                logger.warning(f"[{self._timestamp()}] [RETRY] SELL ORDER PLACEMENT FAILED (attempt {attempt})")
+                logger.warning("[%s] [RETRY] SELL ORDER PLACEMENT FAILED (attempt %s)", LOG_TS, attempt)
                 if attempt < MAX_SELL_RETRIES:
-                    logger.info(f"[{self._timestamp()}] [RETRY] Waiting 0.5s before next attempt...")
+                    logger.info("[%s] [RETRY] Waiting 0.5s before next attempt...", LOG_TS)
                     await asyncio.sleep(0.5)
                     # Refresh orderbook for next attempt
                     fresh_bids = await self.client.get_top_bids(self._live_state.entry_token_id, count=5)
                     if fresh_bids:
                         sell_prices = fresh_bids
-                        logger.info(f"[{self._timestamp()}] [RETRY] Refreshed orderbook bids: {fresh_bids}")
+                        logger.info("[%s] [RETRY] Refreshed orderbook bids: %s", LOG_TS, fresh_bids)
                 continue
 
             # Wait briefly then check order status using get_order API
-            logger.info(f"[{self._timestamp()}] [RETRY] Waiting {FILL_CHECK_DELAY}s to check fill status...")
+            logger.info("[%s] [RETRY] Waiting %ss to check fill status...", LOG_TS, FILL_CHECK_DELAY)
             await asyncio.sleep(FILL_CHECK_DELAY)
 
             # Check order status using get_order API (more reliable)
-            logger.info(f"[{self._timestamp()}] [RETRY] Checking order status via get_order API...")
+            logger.info("[%s] [RETRY] Checking order status via get_order API...", LOG_TS)
             order_status = await self.client.check_order_status(sell_order_id)
 
             # Log status to dashboard
@@ -1046,94 +1409,94 @@ class TradingBot:
             original_size = order_status.get("original_size", 0)
             fill_pct = order_status.get("fill_percent", 0)
 
-            logger.info(f"[{self._timestamp()}] ╔══════════════════════════════════════════════════════════")
-            logger.info(f"[{self._timestamp()}] ║ SELL ORDER STATUS: {status_str}")
-            logger.info(f"[{self._timestamp()}] ║ Filled: {size_matched}/{original_size} ({fill_pct:.1f}%)")
-            logger.info(f"[{self._timestamp()}] ║ Is Filled: {order_status.get('is_filled')} | Is Active: {order_status.get('is_active')}")
-            logger.info(f"[{self._timestamp()}] ╚══════════════════════════════════════════════════════════")
+            logger.info("[%s] ╔══════════════════════════════════════════════════════════", LOG_TS)
+            logger.info("[%s] ║ SELL ORDER STATUS: %s", LOG_TS, status_str)
+            logger.info("[%s] ║ Filled: %s/%s (%.1f%%)", LOG_TS, size_matched, original_size, fill_pct)
+            logger.info("[%s] ║ Is Filled: %s | Is Active: %s", LOG_TS, order_status.get('is_filled'), order_status.get('is_active'))
+            logger.info("[%s] ╚══════════════════════════════════════════════════════════", LOG_TS)
 
             # Update trade record with status
             await self._update_trade_status(sell_order_id, OrderStatus.FILLED if order_status.get("is_filled") else OrderStatus.OPEN)
 
             # Check if order is fully filled
             if order_status.get("is_filled"):
-                logger.info(f"[{self._timestamp()}] [RETRY] SELL ORDER FILLED! Status: {status_str}")
+                logger.info("[%s] [RETRY] SELL ORDER FILLED! Status: %s", LOG_TS, status_str)
                 break
 
             # Check if order status is MATCHED (filled)
             if status_str in ["MATCHED", "FILLED"]:
-                logger.info(f"[{self._timestamp()}] [RETRY] SELL ORDER MATCHED/FILLED! Status: {status_str}")
+                logger.info("[%s] [RETRY] SELL ORDER MATCHED/FILLED! Status: %s", LOG_TS, status_str)
                 break
 
             # Double-check via balance (backup verification)
             remaining_balance = await self.client.get_conditional_balance(self._live_state.entry_token_id)
-            logger.info(f"[{self._timestamp()}] [RETRY] Token balance check: {remaining_balance}")
+            logger.info("[%s] [RETRY] Token balance check: %s", LOG_TS, remaining_balance)
             if remaining_balance is None or remaining_balance < 0.1:
-                logger.info(f"[{self._timestamp()}] [RETRY] SELL ORDER FILLED! (confirmed via balance: {remaining_balance})")
+                logger.info("[%s] [RETRY] SELL ORDER FILLED! (confirmed via balance: %s)", LOG_TS, remaining_balance)
                 break
 
             # Order still active/open - need to cancel and retry
             if order_status.get("is_active") or status_str in ["LIVE", "OPEN", "PENDING"]:
-                logger.warning(f"[{self._timestamp()}] [RETRY] ORDER NOT FILLED - Status: {status_str}, cancelling...")
+                logger.warning("[%s] [RETRY] ORDER NOT FILLED - Status: %s, cancelling...", LOG_TS, status_str)
 
                 # Cancel the unfilled order
                 cancel_success = False
                 try:
-                    logger.info(f"[{self._timestamp()}] [CANCEL] Cancelling order {sell_order_id[:20]}...")
+                    logger.info("[%s] [CANCEL] Cancelling order %s...", LOG_TS, sell_order_id[:20])
                     cancel_result = await self.client.cancel_order(sell_order_id)
                     if cancel_result:
-                        logger.info(f"[{self._timestamp()}] [CANCEL] Cancel API returned success")
+                        logger.info("[%s] [CANCEL] Cancel API returned success", LOG_TS)
                         cancel_success = True
                     else:
-                        logger.warning(f"[{self._timestamp()}] [CANCEL] Cancel API returned False")
+                        logger.warning("[%s] [CANCEL] Cancel API returned False", LOG_TS)
                 except Exception as e:
-                    logger.warning(f"[{self._timestamp()}] [CANCEL] Cancel exception: {e}")
+                    logger.warning("[%s] [CANCEL] Cancel exception: %s", LOG_TS, e)
 
                 # If single cancel failed, try cancel_all as fallback
                 if not cancel_success:
                     try:
-                        logger.info(f"[{self._timestamp()}] [CANCEL] Trying cancel_all as fallback...")
+                        logger.info("[%s] [CANCEL] Trying cancel_all as fallback...", LOG_TS)
                         await self.client.cancel_all_orders()
-                        logger.info(f"[{self._timestamp()}] [CANCEL] cancel_all completed")
+                        logger.info("[%s] [CANCEL] cancel_all completed", LOG_TS)
                         cancel_success = True
                     except Exception as e:
-                        logger.warning(f"[{self._timestamp()}] [CANCEL] cancel_all also failed: {e}")
+                        logger.warning("[%s] [CANCEL] cancel_all also failed: %s", LOG_TS, e)
 
                 # Wait and verify cancellation via get_order API
-                logger.info(f"[{self._timestamp()}] [CANCEL] Waiting 0.5s to verify cancellation...")
+                logger.info("[%s] [CANCEL] Waiting 0.5s to verify cancellation...", LOG_TS)
                 await asyncio.sleep(0.5)
 
                 # Verify cancellation using get_order API
                 verify_status = await self.client.check_order_status(sell_order_id)
                 verify_status_str = verify_status.get("status", "UNKNOWN")
-                logger.info(f"[{self._timestamp()}] [CANCEL] Post-cancel status: {verify_status_str}")
+                logger.info("[%s] [CANCEL] Post-cancel status: %s", LOG_TS, verify_status_str)
 
                 if verify_status.get("is_active"):
-                    logger.warning(f"[{self._timestamp()}] [CANCEL] WARNING: Order STILL ACTIVE after cancellation!")
+                    logger.warning("[%s] [CANCEL] WARNING: Order STILL ACTIVE after cancellation!", LOG_TS)
                 else:
-                    logger.info(f"[{self._timestamp()}] [CANCEL] Order confirmed cancelled/inactive (Status: {verify_status_str})")
+                    logger.info("[%s] [CANCEL] Order confirmed cancelled/inactive (Status: %s)", LOG_TS, verify_status_str)
 
                 # Update trade record
                 await self._update_trade_status(sell_order_id, OrderStatus.CANCELLED)
 
             # Reset order ID for next attempt
             sell_order_id = None
-            logger.info(f"[{self._timestamp()}] [RETRY] Ready for next attempt...")
+            logger.info("[%s] [RETRY] Ready for next attempt...", LOG_TS)
 
             if attempt < MAX_SELL_RETRIES:
                 # Refresh orderbook for next attempt to get latest bid prices
                 fresh_bids = await self.client.get_top_bids(self._live_state.entry_token_id, count=5)
                 if fresh_bids:
                     sell_prices = fresh_bids
-                    logger.info(f"[{self._timestamp()}] [RETRY] Refreshed orderbook bids: {fresh_bids}")
+                    logger.info("[%s] [RETRY] Refreshed orderbook bids: %s", LOG_TS, fresh_bids)
                 await asyncio.sleep(0.5)
 
         if sell_order_id:
             pnl = (final_sell_price - self._live_state.entry_price) * sell_size
-            logger.info(f"[{self._timestamp()}] [LIVE] {reason} - Sold {sell_size} @ {final_sell_price:.4f} | P&L: ${pnl:+.2f}")
+            logger.info("[%s] [LIVE] %s - Sold %s @ %.4f | P&L: $%+.2f", LOG_TS, reason, sell_size, final_sell_price, pnl)
 
             # Update trade status and position in database
-            market_id = market.get("id") or market.get("conditionId")
+            market_id = market["_id"]
             await self._update_trade_status(sell_order_id, OrderStatus.FILLED)
             await self._update_live_position(
                 market_id=market_id,
@@ -1146,48 +1509,46 @@ class TradingBot:
 
             await self._close_live_position(reason)
         else:
-            logger.error(f"[{self._timestamp()}] [LIVE] Failed to sell after {MAX_SELL_RETRIES} attempts!")
+            logger.error("[%s] [LIVE] Failed to sell after %s attempts!", LOG_TS, MAX_SELL_RETRIES)
 
     async def _target_sell(self, market: Dict[str, Any], target_price: float, reason: str) -> None:
         """Execute limit sell order at exact target price."""
-        import math
 
         # Prevent repeated sell attempts
         if self._live_state.sell_attempted:
             actual_balance = await self.client.get_conditional_balance(self._live_state.entry_token_id)
             if actual_balance is None or actual_balance < 0.1:
-                logger.info(f"[{self._timestamp()}] [LIVE] Previous sell appears to have succeeded (balance: {actual_balance}), closing position")
+                logger.info("[%s] [LIVE] Previous sell appears to have succeeded (balance: %s), closing position", LOG_TS, actual_balance)
                 await self._close_live_position(f"{reason}_CONFIRMED")
                 return
-            logger.info(f"[{self._timestamp()}] [LIVE] Retrying sell (balance: {actual_balance})...")
+            logger.info("[%s] [LIVE] Retrying sell (balance: %s)...", LOG_TS, actual_balance)
 
         self._live_state.sell_attempted = True
 
         # Use exact target price for limit order
         sell_price = target_price
 
-        # Get actual conditional token balance
-        actual_balance = await self.client.get_conditional_balance(self._live_state.entry_token_id)
-        MIN_ORDER_SIZE = 0.1
+        # Get actual conditional token balance - streamed from the user channel when tracked
+        actual_balance = await self._get_sell_balance(self._live_state.entry_token_id)
 
         if actual_balance and actual_balance >= MIN_ORDER_SIZE:
-            sell_size = math.floor(actual_balance * 100) / 100
-            logger.info(f"[{self._timestamp()}] [LIVE] Actual token balance: {actual_balance}, selling: {sell_size}")
+            sell_size = _floor(actual_balance * 100) / 100
+            logger.info("[%s] [LIVE] Actual token balance: %s, selling: %s", LOG_TS, actual_balance, sell_size)
         elif actual_balance is not None and actual_balance < MIN_ORDER_SIZE:
-            logger.info(f"[{self._timestamp()}] [LIVE] Balance {actual_balance} too small to sell (min: {MIN_ORDER_SIZE}), closing position")
+            logger.info("[%s] [LIVE] Balance %s too small to sell (min: %s), closing position", LOG_TS, actual_balance, MIN_ORDER_SIZE)
             await self._close_live_position(f"{reason}_DUST")
             return
         else:
-            sell_size = self._live_state.filled_size if self._live_state.filled_size > 0 else self.settings.order_size
-            sell_size = math.floor(sell_size * 100) / 100
-            logger.info(f"[{self._timestamp()}] [LIVE] Using filled_size: {sell_size}")
+            sell_size = self._live_state.filled_size if self._live_state.filled_size > 0 else self._order_size
+            sell_size = _floor(sell_size * 100) / 100
+            logger.info("[%s] [LIVE] Using filled_size: %s", LOG_TS, sell_size)
 
         if sell_size < MIN_ORDER_SIZE:
-            logger.info(f"[{self._timestamp()}] [LIVE] Sell size {sell_size} too small (min: {MIN_ORDER_SIZE}), closing position")
+            logger.info("[%s] [LIVE] Sell size %s too small (min: %s), closing position", LOG_TS, sell_size, MIN_ORDER_SIZE)
             await self._close_live_position(f"{reason}_DUST")
             return
 
-        logger.info(f"[{self._timestamp()}] [LIVE] Limit SELL {sell_size} @ {sell_price} (target price)")
+        logger.info("[%s] [LIVE] Limit SELL %s @ %s (target price)", LOG_TS, sell_size, sell_price)
 
         sell_order_id = await self._place_order(
             market=market,
@@ -1200,9 +1561,9 @@ class TradingBot:
 
         if sell_order_id:
             pnl = (sell_price - self._live_state.entry_price) * sell_size
-            logger.info(f"[{self._timestamp()}] [LIVE] {reason} - Limit sell @ {sell_price:.4f} | Est P&L: ${pnl:+.2f}")
+            logger.info("[%s] [LIVE] %s - Limit sell @ %.4f | Est P&L: $%+.2f", LOG_TS, reason, sell_price, pnl)
 
-            market_id = market.get("id") or market.get("conditionId")
+            market_id = market["_id"]
             await self._update_trade_status(sell_order_id, OrderStatus.FILLED)
             await self._update_live_position(
                 market_id=market_id,
@@ -1215,54 +1576,55 @@ class TradingBot:
 
             await self._close_live_position(reason)
         else:
-            logger.error(f"[{self._timestamp()}] [LIVE] Failed to place limit sell!")
+            logger.error("[%s] [LIVE] Failed to place limit sell!", LOG_TS)
+
+    def _clear_active_orders(self, token_id: str) -> None:
+        """Forget the buy/sell orders tracked for a token so it can be re-entered."""
+        self._active_orders.pop((token_id, "buy"), None)
+        self._active_orders.pop((token_id, "sell"), None)
 
     async def _close_live_position(self, reason: str) -> None:
         """Close live position and update state."""
         # Clear active orders for this token to allow re-entry
         token_id = self._live_state.entry_token_id
         if token_id:
-            buy_key = f"{token_id}_buy"
-            sell_key = f"{token_id}_sell"
-            if buy_key in self._active_orders:
-                del self._active_orders[buy_key]
-            if sell_key in self._active_orders:
-                del self._active_orders[sell_key]
-            logger.debug(f"[{self._timestamp()}] [LIVE] Cleared active orders for token {token_id[:16]}...")
+            self._clear_active_orders(token_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] [LIVE] Cleared active orders for token %s...", LOG_TS, token_id[:16])
 
         # Use the close_position method which properly resets state and increments counter
         self._live_state.close_position()
 
-        max_positions = self.settings.max_positions_per_market
+        max_positions = self._max_positions
         positions_taken = self._live_state.positions_taken
 
         await self._update_bot_state(
             last_action=f"[LIVE] [{reason}] Position closed | {positions_taken}/{max_positions}"
         )
-        logger.info(f"[{self._timestamp()}] [LIVE] ════════════════════════════════════════")
-        logger.info(f"[{self._timestamp()}] [LIVE] POSITION CLOSED: {reason}")
-        logger.info(f"[{self._timestamp()}] [LIVE] Positions taken: {positions_taken}/{max_positions}")
-        logger.info(f"[{self._timestamp()}] [LIVE] State: position_open={self._live_state.position_open}, buy_filled={self._live_state.buy_filled}")
+        logger.info("[%s] [LIVE] ════════════════════════════════════════", LOG_TS)
+        logger.info("[%s] [LIVE] POSITION CLOSED: %s", LOG_TS, reason)
+        logger.info("[%s] [LIVE] Positions taken: %s/%s", LOG_TS, positions_taken, max_positions)
+        logger.info("[%s] [LIVE] State: position_open=%s, buy_filled=%s", LOG_TS, self._live_state.position_open, self._live_state.buy_filled)
         if positions_taken < max_positions:
-            logger.info(f"[{self._timestamp()}] [LIVE] Will look for NEW ENTRY on next iteration")
+            logger.info("[%s] [LIVE] Will look for NEW ENTRY on next iteration", LOG_TS)
         else:
-            logger.info(f"[{self._timestamp()}] [LIVE] Max positions reached, waiting for next market")
-        logger.info(f"[{self._timestamp()}] [LIVE] ════════════════════════════════════════")
+            logger.info("[%s] [LIVE] Max positions reached, waiting for next market", LOG_TS)
+        logger.info("[%s] [LIVE] ════════════════════════════════════════", LOG_TS)
 
     async def _handle_market_close_live(self, market: Dict[str, Any]) -> None:
         """Handle market close - cancel unfilled orders."""
         time_to_close = market.get("time_to_close_minutes", 0)
-        logger.info(f"[{self._timestamp()}] [LIVE] Market closing in {time_to_close:.2f} min - handling open orders")
+        logger.info("[%s] [LIVE] Market closing in %.2f min - handling open orders", LOG_TS, time_to_close)
 
         # Cancel unfilled buy order
         if self._live_state.buy_order_id and not self._live_state.buy_filled:
-            logger.info(f"[{self._timestamp()}] [LIVE] Cancelling unfilled buy order: {self._live_state.buy_order_id}")
+            logger.info("[%s] [LIVE] Cancelling unfilled buy order: %s", LOG_TS, self._live_state.buy_order_id)
             await self.client.cancel_order(self._live_state.buy_order_id)
             self._live_state.buy_order_id = None
 
         # If we have a position, let market settle
         if self._live_state.position_open:
-            logger.info(f"[{self._timestamp()}] [LIVE] Position open at market close - will auto-settle at $1.00 if profitable")
+            logger.info("[%s] [LIVE] Position open at market close - will auto-settle at $1.00 if profitable", LOG_TS)
             await self._update_bot_state(
                 last_action=f"[LIVE] Market closing - position will auto-settle"
             )
@@ -1279,27 +1641,32 @@ class TradingBot:
         time_to_close = market.get("time_to_close_minutes", 0)
         time_seconds = time_to_close * 60
 
-        logger.info(f"[{self._timestamp()}] [LIVE] FORCE CLOSE: {time_seconds:.1f}s to expiry - {reason}")
+        logger.info("[%s] [LIVE] FORCE CLOSE: %.1fs to expiry - %s", LOG_TS, time_seconds, reason)
 
         # Cancel any unfilled buy order first
         if self._live_state.buy_order_id and not self._live_state.buy_filled:
-            logger.info(f"[{self._timestamp()}] [LIVE] Cancelling unfilled buy order: {self._live_state.buy_order_id}")
+            logger.info("[%s] [LIVE] Cancelling unfilled buy order: %s", LOG_TS, self._live_state.buy_order_id)
             await self.client.cancel_order(self._live_state.buy_order_id)
             self._live_state.buy_order_id = None
 
         # Force sell if we have a filled position
         if self._live_state.position_open and self._live_state.buy_filled:
-            current_price = await self.client.get_current_price(self._live_state.entry_token_id)
+            # Price and orderbook in one round trip - the expiry budget is only a few seconds
+            token_id = self._live_state.entry_token_id
+            current_price, top_bids = await asyncio.gather(
+                self.client.get_current_price(token_id),
+                self.client.get_top_bids(token_id, count=5)
+            )
             if current_price:
-                logger.info(f"[{self._timestamp()}] [LIVE] Force selling position at {current_price:.4f}")
-                await self._market_sell(market, current_price, reason)
+                logger.info("[%s] [LIVE] Force selling position at %.4f", LOG_TS, current_price)
+                await self._market_sell(market, current_price, reason, top_bids=top_bids)
             else:
-                logger.warning(f"[{self._timestamp()}] [LIVE] Could not get price for force sell")
+                logger.warning("[%s] [LIVE] Could not get price for force sell", LOG_TS)
                 # Close position state anyway to prevent stuck state
                 await self._close_live_position(f"{reason}_NO_PRICE")
         elif self._live_state.position_open:
             # Position open but buy not filled - just close state
-            logger.info(f"[{self._timestamp()}] [LIVE] Position pending but not filled, closing state")
+            logger.info("[%s] [LIVE] Position pending but not filled, closing state", LOG_TS)
             await self._close_live_position(f"{reason}_UNFILLED")
 
         await self._update_bot_state(
@@ -1322,37 +1689,27 @@ class TradingBot:
         6. FORCE SELL all positions when <= 5 seconds to expiry
         """
         # Price levels from config (same as live trading)
-        TRIGGER_PRICE = self.settings.trigger_price
-        STOPLOSS = self.settings.stoploss
-        TARGET = self.settings.target
-        ORDER_CANCEL_THRESHOLD = self.settings.order_cancel_threshold
-        NO_BUY_THRESHOLD = 10 / 60  # 10 seconds in minutes = 0.1667 - no buying below this
-        FORCE_CLOSE_THRESHOLD = 0 / 60  # 5 seconds in minutes - force sell all positions
-        EARLY_BUY_THRESHOLD = 4  # 3 minutes - don't buy in first 2 minutes of trading window
-        max_positions = self.settings.max_positions_per_market
-
-        # Get FRESH time to expiry (not stale from market dict)
-        market_id = market.get("id") or market.get("conditionId")
-        time_to_close = await self.client.get_time_to_close(market_id)
+        TRIGGER_PRICE = self._trigger
+        TARGET = self._target
+        ORDER_CANCEL_THRESHOLD = self._cancel_thresh
+        max_positions = self._max_positions
+
+        # Get FRESH time to expiry - computed locally from the cached close time.
+        # YES/NO prices are only fetched once an entry is actually possible; the
+        # exit and monitoring paths price just the held token themselves.
+        try:
+            time_to_close = await self.client.get_time_to_close(market["_id"])
+        except Exception as e:
+            logger.warning("[%s] [PAPER] Tick fetch failed: %s", LOG_TS, e)
+            time_to_close = None
         if time_to_close is None:
             time_to_close = market.get("time_to_close_minutes", 0)
 
         # Update market dict with fresh time
         market["time_to_close_minutes"] = time_to_close
 
-        # Get LIVE prices from CLOB API
-        yes_price = await self.client.get_current_price(yes_token_id)
-        no_price = await self.client.get_current_price(no_token_id)
-
-        if yes_price is None or no_price is None:
-            logger.warning(f"[{self._timestamp()}] [PAPER] Could not get prices - YES: {yes_price}, NO: {no_price}")
-            return
-
-        # ALWAYS log live prices with timestamp
-        logger.info(f"[{self._timestamp()}] [PRICE] YES: {yes_price:.4f} | NO: {no_price:.4f} | Time left: {time_to_close:.2f} min")
-
         # CRITICAL: Force close all positions when <= 5 seconds to expiry
-        if time_to_close <= FORCE_CLOSE_THRESHOLD:
+        if time_to_close <= PAPER_FORCE_CLOSE_THRESHOLD:
             await self._force_close_paper_position(market, "5SEC_EXPIRY")
             return
 
@@ -1361,58 +1718,81 @@ class TradingBot:
             await self._handle_market_close_paper(market)
             return
 
+        # Per-tick status lines are logged at most once per second - streamed prices
+        # can wake the loop every MIN_TICK_INTERVAL
+        now = time.monotonic()
+        log_tick = now - self._last_price_log_ts >= 1.0
+        if log_tick:
+            self._last_price_log_ts = now
+
         # Log current state for debugging re-entry
-        logger.debug(f"[{self._timestamp()}] [PAPER] State check: position_open={self._paper_state.position_open}, positions_taken={self._paper_state.positions_taken}/{max_positions}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] [PAPER] State check: position_open=%s, positions_taken=%s/%s", LOG_TS, self._paper_state.position_open, self._paper_state.positions_taken, max_positions)
 
         # Check if we've reached the maximum positions for this market
         if self._paper_state.positions_taken >= max_positions:
-            logger.info(f"[{self._timestamp()}] [PAPER] Max positions reached ({self._paper_state.positions_taken}/{max_positions}). Waiting for next market...")
+            if log_tick:
+                logger.info("[%s] [PAPER] Max positions reached (%s/%s). Waiting for next market...", LOG_TS, self._paper_state.positions_taken, max_positions)
             await self._update_bot_state(
-                last_action=f"Max positions reached ({self._paper_state.positions_taken}/{max_positions}). Waiting for next market..."
+                last_action=StatusLine("Max positions reached (%s/%s). Waiting for next market...", (self._paper_state.positions_taken, max_positions))
             )
             return
 
         # Check if we have a position open
         if self._paper_state.position_open:
-            await self._monitor_paper_position_unified(market)
+            await self._monitor_paper_position_unified(market, log_tick)
             return
 
         # No position open - log that we're looking for entry
-        if self._paper_state.positions_taken > 0:
-            logger.info(f"[{self._timestamp()}] [PAPER] Position {self._paper_state.positions_taken} closed, looking for entry #{self._paper_state.positions_taken + 1}...")
+        if log_tick and self._paper_state.positions_taken > 0:
+            logger.info("[%s] [PAPER] Position %s closed, looking for entry #%s...", LOG_TS, self._paper_state.positions_taken, self._paper_state.positions_taken + 1)
 
         # NO BUYING when <= 10 seconds to expiry
-        if time_to_close <= NO_BUY_THRESHOLD:
+        if time_to_close <= PAPER_NO_BUY_THRESHOLD:
             time_seconds = time_to_close * 60
-            logger.info(f"[{self._timestamp()}] [PAPER] No buying - only {time_seconds:.1f}s to expiry (< 10s)")
+            if log_tick:
+                logger.info("[%s] [PAPER] No buying - only %.1fs to expiry (< 10s)", LOG_TS, time_seconds)
             await self._update_bot_state(
-                last_action=f"[PAPER] No buying - {time_seconds:.1f}s to expiry"
+                last_action=StatusLine("[PAPER] No buying - %.1fs to expiry", (time_seconds,))
             )
             return
 
         # NO BUYING in first 2 minutes of trading window (when > 3 minutes to expiry)
-        if time_to_close > EARLY_BUY_THRESHOLD:
-            logger.info(f"[{self._timestamp()}] [PAPER] Waiting for entry window - {time_to_close:.2f}m to expiry (> {EARLY_BUY_THRESHOLD}m)")
+        if time_to_close > PAPER_EARLY_BUY_THRESHOLD:
+            if log_tick:
+                logger.info("[%s] [PAPER] Waiting for entry window - %.2fm to expiry (> %sm)", LOG_TS, time_to_close, PAPER_EARLY_BUY_THRESHOLD)
             await self._update_bot_state(
-                last_action=f"[PAPER] Waiting for entry window - {time_to_close:.1f}m to expiry"
+                last_action=StatusLine("[PAPER] Waiting for entry window - %.1fm to expiry", (time_to_close,))
             )
             return
 
+        prices = await self._get_prices(yes_token_id, no_token_id)
+        yes_price = prices.get(yes_token_id)
+        no_price = prices.get(no_token_id)
+        if yes_price is None or no_price is None:
+            logger.warning("[%s] [PAPER] Could not get prices - YES: %s, NO: %s", LOG_TS, yes_price, no_price)
+            return
+
+        # Log live prices with timestamp
+        if log_tick:
+            logger.info("[%s] [PRICE] YES: %.4f | NO: %.4f | Time left: %.2f min", LOG_TS, yes_price, no_price, time_to_close)
+
         # No position - look for entry signal (price >= trigger_price)
-        REENTRY_MAX_PRICE = self.settings.reentry_max_price
+        REENTRY_MAX_PRICE = self._reentry_max
         is_reentry = self._paper_state.positions_taken > 0
 
         await self._update_bot_state(
-            last_action=f"[PAPER] Watching for entry (>= {TRIGGER_PRICE}) | YES: {yes_price:.3f}, NO: {no_price:.3f}"
+            last_action=StatusLine("[PAPER] Watching for entry (>= %s) | YES: %.3f, NO: %.3f", (TRIGGER_PRICE, yes_price, no_price))
         )
 
         # Check YES side for entry signal (same logic as live trading)
         if yes_price >= TRIGGER_PRICE and yes_price < TARGET:
             # Re-entry: only enter if price < REENTRY_MAX_PRICE
             if is_reentry and yes_price >= REENTRY_MAX_PRICE:
-                logger.info(f"[{self._timestamp()}] [PAPER] Re-entry skipped: YES @ {yes_price:.4f} >= {REENTRY_MAX_PRICE} (only re-enter when price < {REENTRY_MAX_PRICE})")
+                if log_tick:
+                    logger.info("[%s] [PAPER] Re-entry skipped: YES @ %.4f >= %s (only re-enter when price < %s)", LOG_TS, yes_price, REENTRY_MAX_PRICE, REENTRY_MAX_PRICE)
             else:
-                logger.info(f"[{self._timestamp()}] [PAPER] Entry signal: YES @ {yes_price:.4f} (>= {TRIGGER_PRICE})")
+                logger.info("[%s] [PAPER] Entry signal: YES @ %.4f (>= %s)", LOG_TS, yes_price, TRIGGER_PRICE)
                 await self._place_paper_entry_unified(
                     market=market,
                     token_id=yes_token_id,
@@ -1425,9 +1805,10 @@ class TradingBot:
         if no_price >= TRIGGER_PRICE and no_price < TARGET:
             # Re-entry: only enter if price < REENTRY_MAX_PRICE
             if is_reentry and no_price >= REENTRY_MAX_PRICE:
-                logger.info(f"[{self._timestamp()}] [PAPER] Re-entry skipped: NO @ {no_price:.4f} >= {REENTRY_MAX_PRICE} (only re-enter when price < {REENTRY_MAX_PRICE})")
+                if log_tick:
+                    logger.info("[%s] [PAPER] Re-entry skipped: NO @ %.4f >= %s (only re-enter when price < %s)", LOG_TS, no_price, REENTRY_MAX_PRICE, REENTRY_MAX_PRICE)
             else:
-                logger.info(f"[{self._timestamp()}] [PAPER] Entry signal: NO @ {no_price:.4f} (>= {TRIGGER_PRICE})")
+                logger.info("[%s] [PAPER] Entry signal: NO @ %.4f (>= %s)", LOG_TS, no_price, TRIGGER_PRICE)
                 await self._place_paper_entry_unified(
                     market=market,
                     token_id=no_token_id,
@@ -1437,12 +1818,13 @@ class TradingBot:
                 return
 
         # Log when waiting for signal
-        if yes_price >= TARGET:
-            logger.debug(f"[{self._timestamp()}] [PAPER] YES price {yes_price:.4f} >= target {TARGET}, skipping")
-        elif no_price >= TARGET:
-            logger.debug(f"[{self._timestamp()}] [PAPER] NO price {no_price:.4f} >= target {TARGET}, skipping")
-        else:
-            logger.debug(f"[{self._timestamp()}] [PAPER] Waiting for entry signal - need price >= {TRIGGER_PRICE}")
+        if logger.isEnabledFor(logging.DEBUG):
+            if yes_price >= TARGET:
+                logger.debug("[%s] [PAPER] YES price %.4f >= target %s, skipping", LOG_TS, yes_price, TARGET)
+            elif no_price >= TARGET:
+                logger.debug("[%s] [PAPER] NO price %.4f >= target %s, skipping", LOG_TS, no_price, TARGET)
+            else:
+                logger.debug("[%s] [PAPER] Waiting for entry signal - need price >= %s", LOG_TS, TRIGGER_PRICE)
 
     async def _place_paper_entry_unified(
         self,
@@ -1456,22 +1838,21 @@ class TradingBot:
         Entry signal: price >= trigger_price and < target
         """
         # CRITICAL: Final time check before placing order
-        NO_BUY_THRESHOLD = 10 / 60  # 10 seconds in minutes
-        market_id = market.get("id") or market.get("conditionId")
+        market_id = market["_id"]
         time_to_close = await self.client.get_time_to_close(market_id)
-        if time_to_close is not None and time_to_close <= NO_BUY_THRESHOLD:
+        if time_to_close is not None and time_to_close <= ENTRY_NO_BUY_THRESHOLD:
             time_seconds = time_to_close * 60
-            logger.info(f"[{self._timestamp()}] [PAPER] ORDER BLOCKED: Only {time_seconds:.1f}s to expiry (< 10s)")
+            logger.info("[%s] [PAPER] ORDER BLOCKED: Only %.1fs to expiry (< 10s)", LOG_TS, time_seconds)
             return
 
         # BTC Price Movement Filter - only place order if BTC moved enough from market open
-        if self.settings.btc_price_filter_enabled and self.btc_service:
+        if self._btc_filter and self.btc_service:
             should_place, price_info = await self.btc_service.should_place_order(
-                min_difference=self.settings.btc_min_price_difference
+                min_difference=self._btc_min_diff
             )
             if not should_place:
                 abs_diff = price_info.get('abs_difference', 0)
-                min_req = price_info.get('min_required', self.settings.btc_min_price_difference)
+                min_req = price_info.get('min_required', self._btc_min_diff)
                 market_open = price_info.get('price_to_beat')
                 live_price = price_info.get('live_price')
 
@@ -1482,7 +1863,7 @@ class TradingBot:
                         f"|${abs_diff:,.2f}| < ${min_req:,.2f}"
                     )
                 else:
-                    logger.info(f"[{self._timestamp()}] [PAPER] ORDER BLOCKED: BTC price data unavailable")
+                    logger.info("[%s] [PAPER] ORDER BLOCKED: BTC price data unavailable", LOG_TS)
                 return
             else:
                 direction = price_info.get('direction', 'N/A')
@@ -1495,26 +1876,26 @@ class TradingBot:
                     f"Diff: ${abs_diff:,.2f} {direction}"
                 )
 
-        TRIGGER_PRICE = self.settings.trigger_price
-        TARGET = self.settings.target
+        TRIGGER_PRICE = self._trigger
+        TARGET = self._target
 
         # CHECK: Only buy if price is at or above trigger price
         if current_price < TRIGGER_PRICE:
-            logger.warning(f"[{self._timestamp()}] [PAPER] REJECTED: {side} @ {current_price:.4f} < trigger {TRIGGER_PRICE}")
+            logger.warning("[%s] [PAPER] REJECTED: %s @ %.4f < trigger %s", LOG_TS, side, current_price, TRIGGER_PRICE)
             return
 
         # CHECK: Don't buy if price is at or above target (no profit potential)
         if current_price >= TARGET:
-            logger.warning(f"[{self._timestamp()}] [PAPER] REJECTED: {side} @ {current_price:.4f} >= target {TARGET}")
+            logger.warning("[%s] [PAPER] REJECTED: %s @ %.4f >= target %s", LOG_TS, side, current_price, TARGET)
             return
 
         market_name = market.get("question") or market.get("title")
         order_id = await self._simulate_paper_order_unified(
-            market_id=market.get("id") or market.get("conditionId"),
+            market_id=market["_id"],
             token_id=token_id,
             side="buy",
             price=current_price,
-            size=self.settings.order_size,
+            size=self._order_size,
             outcome=side,
             market_name=market_name
         )
@@ -1527,60 +1908,67 @@ class TradingBot:
             self._paper_state.entry_price = current_price
             self._paper_state.entry_side = side
             self._paper_state.entry_token_id = token_id
+            self._paper_state.entry_order_id = order_id
+            self._paper_state.stoploss_price = stoploss_price
 
-            logger.info(f"[{self._timestamp()}] [PAPER] BUY {side} @ {current_price:.4f} | Target: {TARGET} | SL: {stoploss_price:.4f}")
+            logger.info("[%s] [PAPER] BUY %s @ %.4f | Target: %s | SL: %.4f", LOG_TS, side, current_price, TARGET, stoploss_price)
 
             await self._update_bot_state(
                 last_action=f"[PAPER] Position opened: {side} @ {current_price:.4f}"
             )
 
-    async def _monitor_paper_position_unified(self, market: Dict[str, Any]) -> None:
+    async def _monitor_paper_position_unified(self, market: Dict[str, Any], log_tick: bool = True) -> None:
         """
         Monitor paper position (UNIFIED with live trading).
         Uses soft stoploss (entry_price - 0.20) same as live trading.
+        log_tick gates the per-tick [MONITOR] line (at most once per second).
         """
-        TARGET = self.settings.target
+        TARGET = self._target
 
-        # Get current price
-        current_price = await self.client.get_current_price(self._paper_state.entry_token_id)
+        # Get current price (reuses the price fetched by the strategy this tick)
+        current_price = await self._get_price(self._paper_state.entry_token_id)
         if not current_price:
             return
 
-        entry_price = self._paper_state.entry_price
-        stoploss_price = self._calculate_stoploss_price(entry_price, 0.2)
-        pnl = (current_price - entry_price) * self.settings.order_size
-        pnl_pct = ((current_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0
-        time_to_close = market.get("time_to_close_minutes", 0)
-
-        await self._update_bot_state(
-            last_action=f"[PAPER] {self._paper_state.entry_side}: {current_price:.4f} (${pnl:+.2f}) | SL: {stoploss_price:.2f} | {time_to_close:.1f}m"
-        )
-
-        logger.info(f"[{self._timestamp()}] [MONITOR] {self._paper_state.entry_side}: {current_price:.4f} | Entry: {entry_price:.4f} | P&L: {pnl_pct:+.1f}% | Time: {time_to_close:.2f}m | SL: {stoploss_price:.4f} | Target: {TARGET}")
+        # Exit checks first - both levels are fixed at entry, so this is two compares
+        stoploss_price = self._paper_state.stoploss_price  # Set at entry
 
         # Check if price reached TARGET - exit with limit order at target price
         if current_price >= TARGET:
-            logger.info(f"[{self._timestamp()}] [PAPER] TARGET! Price {current_price:.4f} >= {TARGET}")
+            logger.info("[%s] [PAPER] TARGET! Price %.4f >= %s", LOG_TS, current_price, TARGET)
             # Use target price for limit order instead of current price
             await self._exit_paper_position_unified(market, TARGET, "TARGET")
             return
 
         # Check if price hit STOPLOSS - soft stoploss (same as live trading)
         if current_price <= stoploss_price:
-            logger.info(f"[{self._timestamp()}] [PAPER] STOPLOSS! Price {current_price:.4f} <= {stoploss_price:.4f}")
+            logger.info("[%s] [PAPER] STOPLOSS! Price %.4f <= %.4f", LOG_TS, current_price, stoploss_price)
             await self._exit_paper_position_unified(market, current_price, "STOPLOSS")
             return
 
+        # Still holding - report status
+        entry_price = self._paper_state.entry_price
+        pnl = (current_price - entry_price) * self._order_size
+        time_to_close = market.get("time_to_close_minutes", 0)
+
+        await self._update_bot_state(
+            last_action=StatusLine("[PAPER] %s: %.4f ($%+.2f) | SL: %.2f | %.1fm", (self._paper_state.entry_side, current_price, pnl, stoploss_price, time_to_close))
+        )
+
+        if log_tick and logger.isEnabledFor(logging.INFO):
+            pnl_pct = ((current_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0
+            logger.info("[%s] [MONITOR] %s: %.4f | Entry: %.4f | P&L: %+.1f%% | Time: %.2fm | SL: %.4f | Target: %s", LOG_TS, self._paper_state.entry_side, current_price, entry_price, pnl_pct, time_to_close, stoploss_price, TARGET)
+
     async def _handle_market_close_paper(self, market: Dict[str, Any]) -> None:
         """Handle market close for paper trading - close position if open."""
         time_to_close = market.get("time_to_close_minutes", 0)
-        logger.info(f"[{self._timestamp()}] [PAPER] Market closing in {time_to_close:.2f} min")
+        logger.info("[%s] [PAPER] Market closing in %.2f min", LOG_TS, time_to_close)
 
         # If we have a position, close it at current price (market will settle at $1.00)
         if self._paper_state.position_open:
-            current_price = await self.client.get_current_price(self._paper_state.entry_token_id)
+            current_price = await self._get_price(self._paper_state.entry_token_id)
             if current_price:
-                logger.info(f"[{self._timestamp()}] [PAPER] Market close - closing position at {current_price:.4f}")
+                logger.info("[%s] [PAPER] Market close - closing position at %.4f", LOG_TS, current_price)
                 await self._exit_paper_position_unified(market, current_price, "MARKET_CLOSE")
             else:
                 await self._update_bot_state(
@@ -1599,25 +1987,20 @@ class TradingBot:
         time_to_close = market.get("time_to_close_minutes", 0)
         time_seconds = time_to_close * 60
 
-        logger.info(f"[{self._timestamp()}] [PAPER] FORCE CLOSE: {time_seconds:.1f}s to expiry - {reason}")
+        logger.info("[%s] [PAPER] FORCE CLOSE: %.1fs to expiry - %s", LOG_TS, time_seconds, reason)
 
         # Force sell if we have an open position
         if self._paper_state.position_open:
-            current_price = await self.client.get_current_price(self._paper_state.entry_token_id)
+            current_price = await self._get_price(self._paper_state.entry_token_id)
             if current_price:
-                logger.info(f"[{self._timestamp()}] [PAPER] Force selling position at {current_price:.4f}")
+                logger.info("[%s] [PAPER] Force selling position at %.4f", LOG_TS, current_price)
                 await self._exit_paper_position_unified(market, current_price, reason)
             else:
-                logger.warning(f"[{self._timestamp()}] [PAPER] Could not get price for force sell")
+                logger.warning("[%s] [PAPER] Could not get price for force sell", LOG_TS)
                 # Clear active orders for this token to allow re-entry
                 token_id = self._paper_state.entry_token_id
                 if token_id:
-                    buy_key = f"{token_id}_buy"
-                    sell_key = f"{token_id}_sell"
-                    if buy_key in self._active_orders:
-                        del self._active_orders[buy_key]
-                    if sell_key in self._active_orders:
-                        del self._active_orders[sell_key]
+                    self._clear_active_orders(token_id)
                 # Close position state anyway to prevent stuck state
                 self._paper_state.close_position()
 
@@ -1638,23 +2021,14 @@ class TradingBot:
         # Store values before reset
         entry_price = self._paper_state.entry_price
         entry_side = self._paper_state.entry_side
-        size = self.settings.order_size
-
-        # Calculate fees for display
-        buy_value = entry_price * size
-        sell_value = exit_price * size
-        buy_fee = self._calculate_taker_fee(buy_value)
-        sell_fee = self._calculate_taker_fee(sell_value)
-        total_fees = buy_fee + sell_fee
+        size = self._order_size
 
-        # Calculate P&L
-        gross_pnl = (exit_price - entry_price) * size
-        net_pnl = gross_pnl - total_fees
-        net_pnl_pct = (net_pnl / buy_value) * 100 if buy_value > 0 else 0
+        # Calculate fees and P&L for display
+        buy_fee, sell_fee, total_fees, gross_pnl, net_pnl, net_pnl_pct = self._exit_pnl(entry_price, exit_price, size)
 
         market_name = market.get("question") or market.get("title")
         order_id = await self._simulate_paper_order_unified(
-            market_id=market.get("id") or market.get("conditionId"),
+            market_id=market["_id"],
             token_id=self._paper_state.entry_token_id,
             side="sell",
             price=exit_price,
@@ -1667,35 +2041,32 @@ class TradingBot:
             # Clear active orders for this token to allow re-entry
             token_id = self._paper_state.entry_token_id
             if token_id:
-                buy_key = f"{token_id}_buy"
-                sell_key = f"{token_id}_sell"
-                if buy_key in self._active_orders:
-                    del self._active_orders[buy_key]
-                if sell_key in self._active_orders:
-                    del self._active_orders[sell_key]
-                logger.debug(f"[{self._timestamp()}] [PAPER] Cleared active orders for token")
+                self._clear_active_orders(token_id)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] [PAPER] Cleared active orders for token", LOG_TS)
 
             # Use close_position method which properly resets and increments counter
             self._paper_state.close_position()
 
-            max_positions = self.settings.max_positions_per_market
+            max_positions = self._max_positions
             positions_taken = self._paper_state.positions_taken
 
-            logger.info(f"[{self._timestamp()}] [PAPER] ══════════════════════════════════════")
-            logger.info(f"[{self._timestamp()}] [PAPER] POSITION CLOSED: {reason}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Side: {entry_side}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Entry: {entry_price:.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Exit: {exit_price:.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Gross P&L: {gross_pnl:+.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Fees: -{total_fees:.4f} (buy: {buy_fee:.4f}, sell: {sell_fee:.4f})")
-            logger.info(f"[{self._timestamp()}] [PAPER] Net P&L: {net_pnl:+.4f} ({net_pnl_pct:+.1f}%)")
-            logger.info(f"[{self._timestamp()}] [PAPER] Positions taken: {positions_taken}/{max_positions}")
-            logger.info(f"[{self._timestamp()}] [PAPER] State: position_open={self._paper_state.position_open}")
-            if positions_taken < max_positions:
-                logger.info(f"[{self._timestamp()}] [PAPER] Will look for NEW ENTRY on next iteration")
-            else:
-                logger.info(f"[{self._timestamp()}] [PAPER] Max positions reached, waiting for next market")
-            logger.info(f"[{self._timestamp()}] [PAPER] ══════════════════════════════════════")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] [PAPER] ══════════════════════════════════════", LOG_TS)
+                logger.info("[%s] [PAPER] POSITION CLOSED: %s", LOG_TS, reason)
+                logger.info("[%s] [PAPER] Side: %s", LOG_TS, entry_side)
+                logger.info("[%s] [PAPER] Entry: %.4f", LOG_TS, entry_price)
+                logger.info("[%s] [PAPER] Exit: %.4f", LOG_TS, exit_price)
+                logger.info("[%s] [PAPER] Gross P&L: %+.4f", LOG_TS, gross_pnl)
+                logger.info("[%s] [PAPER] Fees: -%.4f (buy: %.4f, sell: %.4f)", LOG_TS, total_fees, buy_fee, sell_fee)
+                logger.info("[%s] [PAPER] Net P&L: %+.4f (%+.1f%%)", LOG_TS, net_pnl, net_pnl_pct)
+                logger.info("[%s] [PAPER] Positions taken: %s/%s", LOG_TS, positions_taken, max_positions)
+                logger.info("[%s] [PAPER] State: position_open=%s", LOG_TS, self._paper_state.position_open)
+                if positions_taken < max_positions:
+                    logger.info("[%s] [PAPER] Will look for NEW ENTRY on next iteration", LOG_TS)
+                else:
+                    logger.info("[%s] [PAPER] Max positions reached, waiting for next market", LOG_TS)
+                logger.info("[%s] [PAPER] ══════════════════════════════════════", LOG_TS)
 
             await self._update_bot_state(
                 last_action=f"[{reason}] Closed @ {exit_price:.4f}, Net P&L: ${net_pnl:+.2f} | {positions_taken}/{max_positions}"
@@ -1709,21 +2080,12 @@ class TradingBot:
         reason: str
     ) -> None:
         """Exit a paper position. Includes taker fees in P&L calculation."""
-        # Calculate fees for display
-        buy_value = position.avg_price * position.quantity
-        sell_value = exit_price * position.quantity
-        buy_fee = self._calculate_taker_fee(buy_value)
-        sell_fee = self._calculate_taker_fee(sell_value)
-        total_fees = buy_fee + sell_fee
-
-        # Calculate P&L
-        gross_pnl = (exit_price - position.avg_price) * position.quantity
-        net_pnl = gross_pnl - total_fees
-        net_pnl_pct = (net_pnl / buy_value) * 100 if buy_value > 0 else 0
+        # Calculate fees and P&L for display
+        buy_fee, sell_fee, total_fees, gross_pnl, net_pnl, net_pnl_pct = self._exit_pnl(position.avg_price, exit_price, position.quantity)
 
         market_name = market.get("question") or market.get("title")
         order_id = await self._simulate_paper_order(
-            market_id=market.get("id") or market.get("conditionId"),
+            market_id=market["_id"],
             token_id=position.token_id,
             side="sell",
             price=exit_price,
@@ -1736,20 +2098,21 @@ class TradingBot:
             positions_taken = self._paper_state.positions_taken + 1  # Increment before reset
             self._paper_state.reset()  # Reset for next trade
             self._paper_state.positions_taken = positions_taken  # Restore incremented count
-            max_positions = self.settings.max_positions_per_market
+            max_positions = self._max_positions
             await self._update_bot_state(
                 last_action=f"[{reason}] Sold {position.outcome} @ {exit_price:.4f}, Net P&L: {net_pnl:+.4f} ({net_pnl_pct:+.1f}%) | Positions: {positions_taken}/{max_positions}"
             )
-            logger.info(f"[{self._timestamp()}] [PAPER] ══════════════════════════════════════")
-            logger.info(f"[{self._timestamp()}] [PAPER] POSITION CLOSED: {reason}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Side: {position.outcome}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Entry: {position.avg_price:.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Exit: {exit_price:.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Gross P&L: {gross_pnl:+.4f}")
-            logger.info(f"[{self._timestamp()}] [PAPER] Fees: -{total_fees:.4f} (buy: {buy_fee:.4f}, sell: {sell_fee:.4f})")
-            logger.info(f"[{self._timestamp()}] [PAPER] Net P&L: {net_pnl:+.4f} ({net_pnl_pct:+.1f}%)")
-            logger.info(f"[{self._timestamp()}] [PAPER] Positions taken: {positions_taken}/{max_positions}")
-            logger.info(f"[{self._timestamp()}] [PAPER] ══════════════════════════════════════")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] [PAPER] ══════════════════════════════════════", LOG_TS)
+                logger.info("[%s] [PAPER] POSITION CLOSED: %s", LOG_TS, reason)
+                logger.info("[%s] [PAPER] Side: %s", LOG_TS, position.outcome)
+                logger.info("[%s] [PAPER] Entry: %.4f", LOG_TS, position.avg_price)
+                logger.info("[%s] [PAPER] Exit: %.4f", LOG_TS, exit_price)
+                logger.info("[%s] [PAPER] Gross P&L: %+.4f", LOG_TS, gross_pnl)
+                logger.info("[%s] [PAPER] Fees: -%.4f (buy: %.4f, sell: %.4f)", LOG_TS, total_fees, buy_fee, sell_fee)
+                logger.info("[%s] [PAPER] Net P&L: %+.4f (%+.1f%%)", LOG_TS, net_pnl, net_pnl_pct)
+                logger.info("[%s] [PAPER] Positions taken: %s/%s", LOG_TS, positions_taken, max_positions)
+                logger.info("[%s] [PAPER] ══════════════════════════════════════", LOG_TS)
 
     async def _monitor_positions(self, market: Dict[str, Any]) -> None:
         """
@@ -1763,12 +2126,12 @@ class TradingBot:
         Note: Live trading has its own monitoring in _monitor_live_position (stoploss orders)
         """
         # Paper trading handles its own position monitoring
-        if self.settings.paper_trading:
+        if self._paper:
             return
 
         # Live trading handles its own monitoring via _monitor_live_position
         # which uses stoploss limit orders - skip duplicate monitoring here
-        if not self.settings.paper_trading:
+        if not self._paper:
             return
 
         positions = await self._get_positions_for_market(market)
@@ -1776,26 +2139,28 @@ class TradingBot:
         if not positions:
             return
 
-        await self._update_bot_state(last_action=BotAction.MONITORING.value)
+        await self._update_bot_state(last_action=ACTION_MONITORING)
 
-        total_pnl = 0.0
-        for position in positions:
-            # Get current price
-            current_price = await self.client.get_current_price(position.token_id)
-            if current_price is None:
-                continue
+        # Get current prices for all positions in one batch
+        prices = await self._get_prices(*(position.token_id for position in positions))
 
-            # Calculate P&L
-            pnl = (current_price - position.avg_price) * position.quantity
-            total_pnl += pnl
+        # Mark every position in one pass, then write them all in one UPDATE
+        marks = []
+        for position in positions:
+            current_price = prices.get(position.token_id)
+            if current_price is not None:
+                pnl = (current_price - position.avg_price) * position.quantity
+                marks.append((position, current_price, pnl))
 
-            # Update position in database
-            await self._update_position(position.id, current_price, pnl)
+        total_pnl = sum(pnl for _, _, pnl in marks)
+        await self._update_positions(marks)
 
+        price_target = self._price_target
+        for position, current_price, pnl in marks:
             # Check price target
-            if current_price >= self.settings.price_target:
-                logger.info(f"Price target reached for {position.outcome}: {current_price}")
-                await self._update_bot_state(last_action=BotAction.PRICE_TARGET.value)
+            if current_price >= price_target:
+                logger.info("Price target reached for %s: %s", position.outcome, current_price)
+                await self._update_bot_state(last_action=ACTION_PRICE_TARGET)
                 await self._place_order(
                     market=market,
                     token_id=position.token_id,
@@ -1806,33 +2171,34 @@ class TradingBot:
                 )
 
         # Check max loss
-        if total_pnl <= -self.settings.max_loss:
-            logger.warning(f"Max loss triggered! Total P&L: {total_pnl}")
-            await self._update_bot_state(last_action=BotAction.MAX_LOSS.value)
+        if total_pnl <= -self._max_loss:
+            logger.warning("Max loss triggered! Total P&L: %s", total_pnl)
+            await self._update_bot_state(last_action=ACTION_MAX_LOSS)
             await self._square_off(market)
 
     async def _square_off(self, market: Dict[str, Any]) -> None:
         """Close all positions in the market."""
-        await self._update_bot_state(last_action=BotAction.SQUARE_OFF.value)
+        await self._update_bot_state(last_action=ACTION_SQUARE_OFF)
 
         # Cancel all open orders first
         await self.client.cancel_all_orders()
+        self._active_orders.clear()
 
-        positions = await self._get_positions_for_market(market)
+        positions = [p for p in await self._get_positions_for_market(market) if p.quantity > 0]
+        # Price every open position in one batch instead of one request per position
+        prices = await self._get_prices(*(position.token_id for position in positions))
 
         for position in positions:
-            if position.quantity > 0:
-                current_price = await self.client.get_current_price(position.token_id)
-                if current_price:
-                    # Place market-like order (very low price for sell)
-                    await self._place_order(
-                        market=market,
-                        token_id=position.token_id,
-                        side="sell",
-                        price=0.01,  # Near-market order
-                        size=position.quantity,
-                        outcome=position.outcome
-                    )
+            if prices.get(position.token_id):
+                # Place market-like order (very low price for sell)
+                await self._place_order(
+                    market=market,
+                    token_id=position.token_id,
+                    side="sell",
+                    price=0.01,  # Near-market order
+                    size=position.quantity,
+                    outcome=position.outcome
+                )
 
         logger.info("Squared off all positions")
 
@@ -1846,20 +2212,21 @@ class TradingBot:
         outcome: str
     ) -> Optional[str]:
         """Place an order and record it in the database."""
-        market_id = market.get("id") or market.get("conditionId")
+        market_id = market["_id"]
         market_name = market.get("question") or market.get("title")
 
         # Check for existing order
-        order_key = f"{token_id}_{side}"
-        if order_key in self._active_orders:
-            existing = self._active_orders[order_key]
+        order_key = (token_id, side)
+        existing = self._active_orders.get(order_key)
+        if existing is not None:
             # Skip if similar order already active
-            if existing.get("status") in ["open", "pending"]:
-                logger.debug(f"[{self._timestamp()}] Skipping duplicate order: {order_key}")
+            if existing.get("status") in ("open", "pending"):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] Skipping duplicate order: %s", LOG_TS, order_key)
                 return None
 
         # Check if paper trading is enabled
-        is_paper = self.settings.paper_trading
+        is_paper = self._paper
 
         if is_paper:
             order_id = await self._simulate_paper_order(
@@ -1874,7 +2241,11 @@ class TradingBot:
             return order_id
 
         # Live trading - place REAL order on Polymarket with retry logic
-        market_options = await self.client.get_market_options(market_id)
+        # tick_size/neg_risk never change for a market, so look them up once
+        market_options = self._market_options_cache.get(market_id)
+        if market_options is None:
+            market_options = await self.client.get_market_options(market_id)
+            self._market_options_cache[market_id] = market_options
         tick_size = market_options.get("tick_size", "0.01")
         neg_risk = market_options.get("neg_risk", False)
 
@@ -1882,7 +2253,7 @@ class TradingBot:
         RETRY_DELAY = 1.0  # seconds between retries
 
         for attempt in range(1, MAX_RETRIES + 1):
-            logger.info(f"[{self._timestamp()}] [LIVE] Placing order attempt {attempt}/{MAX_RETRIES}: {side.upper()} {outcome} {size} @ {price}")
+            logger.info("[%s] [LIVE] Placing order attempt %s/%s: %s %s %s @ %s", LOG_TS, attempt, MAX_RETRIES, side.upper(), outcome, size, price)
 
             result = await self.client.place_limit_order(
                 token_id=token_id,
@@ -1894,14 +2265,14 @@ class TradingBot:
             )
 
             if not result:
-                logger.warning(f"[{self._timestamp()}] [LIVE] Order placement returned no result (attempt {attempt}/{MAX_RETRIES})")
+                logger.warning("[%s] [LIVE] Order placement returned no result (attempt %s/%s)", LOG_TS, attempt, MAX_RETRIES)
                 if attempt < MAX_RETRIES:
                     await asyncio.sleep(RETRY_DELAY)
                 continue
 
             order_id = result.get("orderID") or result.get("id")
             if not order_id:
-                logger.warning(f"[{self._timestamp()}] [LIVE] Order result has no order ID (attempt {attempt}/{MAX_RETRIES})")
+                logger.warning("[%s] [LIVE] Order result has no order ID (attempt %s/%s)", LOG_TS, attempt, MAX_RETRIES)
                 if attempt < MAX_RETRIES:
                     await asyncio.sleep(RETRY_DELAY)
                 continue
@@ -1912,10 +2283,10 @@ class TradingBot:
 
             if order_check:
                 order_status = order_check.get("status", "").upper()
-                logger.info(f"[{self._timestamp()}] [LIVE] Order verified: {order_id[:20]}... status={order_status}")
+                logger.info("[%s] [LIVE] Order verified: %s... status=%s", LOG_TS, order_id[:20], order_status)
 
                 # Order is confirmed - record and return
-                logger.info(f"[{self._timestamp()}] [LIVE] ORDER PLACED: {side.upper()} {outcome} {size} @ {price}")
+                logger.info("[%s] [LIVE] ORDER PLACED: %s %s %s @ %s", LOG_TS, side.upper(), outcome, size, price)
 
                 await self._record_trade(
                     order_id=order_id,
@@ -1937,20 +2308,16 @@ class TradingBot:
 
                 return order_id
             else:
-                logger.warning(f"[{self._timestamp()}] [LIVE] Order verification failed for {order_id[:20]}... (attempt {attempt}/{MAX_RETRIES})")
+                logger.warning("[%s] [LIVE] Order verification failed for %s... (attempt %s/%s)", LOG_TS, order_id[:20], attempt, MAX_RETRIES)
                 if attempt < MAX_RETRIES:
                     await asyncio.sleep(RETRY_DELAY)
 
-        logger.error(f"[{self._timestamp()}] [LIVE] ORDER FAILED after {MAX_RETRIES} attempts")
+        logger.error("[%s] [LIVE] ORDER FAILED after %s attempts", LOG_TS, MAX_RETRIES)
         return None
 
-    def _calculate_taker_fee(self, trade_value: float) -> float:
-        """
-        Calculate taker fee for a trade.
-        Fee = max(trade_value * fee_rate, min_fee)
-        """
-        fee = trade_value * self.settings.taker_fee_rate
-        return max(fee, self.settings.min_taker_fee)
+    def _exit_pnl(self, entry_price: float, exit_price: float, size: float) -> ExitPnL:
+        """Fees and P&L of a paper exit at the configured taker fee."""
+        return _compute_exit_pnl(entry_price, exit_price, size, self._fee_rate, self._min_fee)
 
     async def _simulate_paper_order(
         self,
@@ -1969,63 +2336,47 @@ class TradingBot:
         since we're simulating market orders at current prices.
         Includes taker fee calculation (configurable).
         """
-        ENTRY_MIN = self.settings.entry_min
-        ENTRY_MAX = self.settings.entry_max
+        ENTRY_MIN = self._entry_min
+        ENTRY_MAX = self._entry_max
 
         # CHECK: For buy orders, only allow if price is in entry range
-        if side.lower() == "buy" and (price < ENTRY_MIN or price > ENTRY_MAX):
-            logger.warning(f"[{self._timestamp()}] [PAPER] ✗ ORDER REJECTED: Buy {outcome} @ {price:.4f} not in range {ENTRY_MIN}-{ENTRY_MAX}")
+        if side == "buy" and (price < ENTRY_MIN or price > ENTRY_MAX):
+            logger.warning("[%s] [PAPER] ✗ ORDER REJECTED: Buy %s @ %.4f not in range %s-%s", LOG_TS, outcome, price, ENTRY_MIN, ENTRY_MAX)
             return None
 
         # Generate a unique paper order ID
-        order_id = f"paper_{uuid.uuid4().hex[:16]}"
+        order_id = f"paper_{next(self._paper_order_seq):016x}"
 
         # Calculate cost and fee for the trade
         trade_value = price * size
-        taker_fee = self._calculate_taker_fee(trade_value)
+        taker_fee = max(trade_value * self._fee_rate, self._min_fee)  # Taker fee: max(value * fee_rate, min_fee)
         total_cost = trade_value + taker_fee  # Cost + fee for buys
 
-        async with async_session_maker() as session:
-            bot_state = await get_or_create_bot_state(session)
-
-            # Check if we have enough paper balance for buy orders (including fee)
-            if side.lower() == "buy":
-                if bot_state.paper_balance < total_cost:
-                    logger.warning(f"[{self._timestamp()}] [PAPER] Insufficient balance: {bot_state.paper_balance:.2f} < {total_cost:.2f} (cost: {trade_value:.2f} + fee: {taker_fee:.4f})")
-                    return None
+        # Check if we have enough paper balance for buy orders (including fee)
+        cost = total_cost if side == "buy" else 0.0
+        if cost:
+            # Buys still waiting in the write queue are not deducted yet
+            available = await self._get_paper_balance() - self._queued_paper_cost
 
-                # Deduct cost + fee from paper balance
-                bot_state.paper_balance -= total_cost
-                logger.info(f"[{self._timestamp()}] [PAPER] Deducted {total_cost:.4f} (cost: {trade_value:.4f} + fee: {taker_fee:.4f}) from balance. New balance: {bot_state.paper_balance:.4f}")
-
-            await session.commit()
+            if available < cost:
+                logger.warning("[%s] [PAPER] Insufficient balance: %.2f < %.2f (cost: %.2f + fee: %.4f)", LOG_TS, available, total_cost, trade_value, taker_fee)
+                return None
 
-        # Record the paper trade - always FILLED for paper trading
-        await self._record_trade(
+        # Balance, trade and position are written off the entry path by _db_writer
+        await self._queue_paper_fill(
+            cost=cost,
             order_id=order_id,
             market_id=market_id,
             token_id=token_id,
             side=side,
             price=price,
             size=size,
-            is_paper=True,
-            status=OrderStatus.FILLED,
+            outcome=outcome,
             market_name=market_name
         )
 
-        # Update position immediately since paper orders always fill
-        await self._update_paper_position(
-            market_id=market_id,
-            token_id=token_id,
-            side=side,
-            price=price,
-            size=size,
-            outcome=outcome
-        )
-
         # Track active order
-        order_key = f"{token_id}_{side}"
-        self._active_orders[order_key] = {
+        self._active_orders[(token_id, side)] = {
             "order_id": order_id,
             "status": "filled",
             "price": price,
@@ -2050,142 +2401,283 @@ class TradingBot:
         Uses trigger_price logic instead of entry_min/entry_max range.
         Paper orders always fill immediately at the specified price.
         """
-        TRIGGER_PRICE = self.settings.trigger_price
-        TARGET = self.settings.target
+        TRIGGER_PRICE = self._trigger
+        TARGET = self._target
 
         # CHECK: For buy orders, only allow if price >= trigger_price and < target
-        if side.lower() == "buy":
+        if side == "buy":
             if price < TRIGGER_PRICE:
-                logger.warning(f"[{self._timestamp()}] [PAPER] ORDER REJECTED: Buy {outcome} @ {price:.4f} < trigger {TRIGGER_PRICE}")
+                logger.warning("[%s] [PAPER] ORDER REJECTED: Buy %s @ %.4f < trigger %s", LOG_TS, outcome, price, TRIGGER_PRICE)
                 return None
             if price >= TARGET:
-                logger.warning(f"[{self._timestamp()}] [PAPER] ORDER REJECTED: Buy {outcome} @ {price:.4f} >= target {TARGET}")
+                logger.warning("[%s] [PAPER] ORDER REJECTED: Buy %s @ %.4f >= target %s", LOG_TS, outcome, price, TARGET)
                 return None
 
         # Generate a unique paper order ID
-        order_id = f"paper_{uuid.uuid4().hex[:16]}"
+        order_id = f"paper_{next(self._paper_order_seq):016x}"
 
         # Calculate cost and fee for the trade
         trade_value = price * size
-        taker_fee = self._calculate_taker_fee(trade_value)
+        taker_fee = max(trade_value * self._fee_rate, self._min_fee)  # Taker fee: max(value * fee_rate, min_fee)
         total_cost = trade_value + taker_fee  # Cost + fee for buys
 
-        async with async_session_maker() as session:
-            bot_state = await get_or_create_bot_state(session)
-
-            # Check if we have enough paper balance for buy orders (including fee)
-            if side.lower() == "buy":
-                if bot_state.paper_balance < total_cost:
-                    logger.warning(f"[{self._timestamp()}] [PAPER] Insufficient balance: {bot_state.paper_balance:.2f} < {total_cost:.2f}")
-                    return None
+        # Check if we have enough paper balance for buy orders (including fee)
+        cost = total_cost if side == "buy" else 0.0
+        if cost:
+            # Buys still waiting in the write queue are not deducted yet
+            available = await self._get_paper_balance() - self._queued_paper_cost
 
-                # Deduct cost + fee from paper balance
-                bot_state.paper_balance -= total_cost
-                logger.info(f"[{self._timestamp()}] [PAPER] Deducted {total_cost:.4f} from balance. New balance: {bot_state.paper_balance:.4f}")
-
-            await session.commit()
+            if available < cost:
+                logger.warning("[%s] [PAPER] Insufficient balance: %.2f < %.2f", LOG_TS, available, total_cost)
+                return None
 
-        # Record the paper trade - always FILLED for paper trading
-        await self._record_trade(
+        # Balance, trade and position are written off the entry path by _db_writer
+        await self._queue_paper_fill(
+            cost=cost,
             order_id=order_id,
             market_id=market_id,
             token_id=token_id,
             side=side,
             price=price,
             size=size,
-            is_paper=True,
-            status=OrderStatus.FILLED,
+            outcome=outcome,
             market_name=market_name
         )
 
-        # Update position immediately since paper orders always fill
-        await self._update_paper_position_unified(
-            market_id=market_id,
-            token_id=token_id,
-            side=side,
-            price=price,
-            size=size,
-            outcome=outcome
-        )
-
         return order_id
 
-    async def _update_paper_position_unified(
+    async def _get_paper_balance(self) -> float:
+        """Read just the paper balance column instead of loading the whole BotState row."""
+        query = select(BotState.paper_balance)
+        if self._bot_state_id is not None:
+            query = query.where(BotState.id == self._bot_state_id)
+
+        async with async_session_maker() as session:
+            balance = await session.scalar(query.limit(1))
+            if balance is None:
+                balance = (await get_or_create_bot_state(session)).paper_balance
+        return balance
+
+    async def _queue_paper_fill(
         self,
+        cost: float,
+        order_id: str,
         market_id: str,
         token_id: str,
         side: str,
         price: float,
         size: float,
-        outcome: str
+        outcome: str,
+        market_name: Optional[str]
     ) -> None:
         """
-        Update paper trading position after a fill (UNIFIED version).
-        Includes taker fee in P&L calculation for both buy and sell sides.
+        Queue the DB writes for a simulated paper fill: balance deduction
+        (cost, buys only), trade record and position update, applied in one
+        transaction. Runs immediately when the DB writer is not running.
+        The deduction is conditional on the balance covering it - if it no
+        longer does, the fill is dropped instead of overdrawing the balance,
+        and the in-memory entry it opened is undone - as it is when the
+        write fails to commit.
         """
-        async with async_session_maker() as session:
-            # Find existing position
-            result = await session.execute(
-                select(Position).where(Position.token_id == token_id)
+        async def write(session: AsyncSession) -> None:
+            if cost:
+                if self._bot_state_id is None:
+                    self._bot_state_id = (await get_or_create_bot_state(session)).id
+                result = await session.execute(
+                    update(BotState)
+                    .where(BotState.id == self._bot_state_id, BotState.paper_balance >= cost)
+                    .values(paper_balance=BotState.paper_balance - cost)
+                    .returning(BotState.paper_balance)
+                )
+                # RETURNING yields no row when the WHERE matched nothing - a
+                # portable rowcount of 0 (rowcount isn't reliable with RETURNING)
+                balance = result.scalar()
+                if balance is None:
+                    logger.warning("[%s] [PAPER] Dropped fill %s: balance no longer covers %.4f", LOG_TS, order_id, cost)
+                    self._paper_fill_dropped(order_id, token_id, side)
+                    return
+                logger.info("[%s] [PAPER] Deducted %.4f from balance. New balance: %.4f", LOG_TS, cost, balance)
+
+            # Record the paper trade - always FILLED for paper trading
+            await self._record_trade(
+                order_id=order_id,
+                market_id=market_id,
+                token_id=token_id,
+                side=side,
+                price=price,
+                size=size,
+                is_paper=True,
+                status=OrderStatus.FILLED,
+                market_name=market_name,
+                session=session
             )
-            position = result.scalar_one_or_none()
 
-            bot_state = await get_or_create_bot_state(session)
+            # Update position immediately since paper orders always fill
+            await self._update_paper_position(
+                market_id=market_id,
+                token_id=token_id,
+                side=side,
+                price=price,
+                size=size,
+                outcome=outcome,
+                session=session
+            )
 
-            if side.lower() == "buy":
-                if position:
-                    # Update existing position with average price
-                    total_cost = (position.avg_price * position.quantity) + (price * size)
-                    new_quantity = position.quantity + size
-                    position.avg_price = total_cost / new_quantity
-                    position.quantity = new_quantity
-                    position.updated_at = datetime.utcnow()
-                else:
-                    # Create new position
-                    position = Position(
-                        market_id=market_id,
-                        token_id=token_id,
-                        outcome=outcome,
-                        quantity=size,
-                        avg_price=price,
-                        current_price=price
-                    )
-                    session.add(position)
+        await self._submit_write(write, cost, on_error=lambda: self._paper_fill_dropped(order_id, token_id, side))
 
-                bot_state.trades_count += 1
+    def _paper_fill_dropped(self, order_id: str, token_id: str, side: str) -> None:
+        """Forget in-memory state for a paper fill that was never written."""
+        tracked = self._active_orders.get((token_id, side))
+        if tracked is not None and tracked.get("order_id") == order_id:
+            del self._active_orders[(token_id, side)]
+        if self._paper_state.position_open and self._paper_state.entry_order_id == order_id:
+            self._paper_state.cancel_entry()
 
-            elif side.lower() == "sell":
-                if position and position.quantity >= size:
-                    # Calculate fees for P&L
-                    buy_value = position.avg_price * size
-                    sell_value = price * size
-                    buy_fee = self._calculate_taker_fee(buy_value)
-                    sell_fee = self._calculate_taker_fee(sell_value)
-                    total_fees = buy_fee + sell_fee
-
-                    # Calculate P&L including fees
-                    gross_pnl = (price - position.avg_price) * size
-                    net_pnl = gross_pnl - total_fees
+    async def _submit_write(
+        self,
+        write: Callable[[AsyncSession], Awaitable[None]],
+        cost: float = 0.0,
+        on_error: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Queue a DB write for _db_writer, which applies queued writes in order.
+        cost is paper buy cost the write will deduct from the balance, and
+        on_error is called if the write ends up not committed.
+        Runs the write in its own transaction when the DB writer is not running.
+        """
+        job = QueuedWrite(write, cost, on_error)
+        if self._db_writer_task is None:
+            try:
+                await self._apply_writes([job])
+            except Exception:
+                if on_error:
+                    on_error()
+                raise
+            return
 
-                    position.quantity -= size
-                    position.current_pnl += net_pnl
-                    position.updated_at = datetime.utcnow()
+        self._queued_paper_cost += cost
+        self._db_queue.put_nowait(job)
 
-                    # Update bot state
-                    bot_state.total_pnl += net_pnl
-                    # Add proceeds minus sell fee to balance
-                    net_proceeds = sell_value - sell_fee
-                    bot_state.paper_balance += net_proceeds
-                    bot_state.trades_count += 1
+    async def _db_writer(self) -> None:
+        """
+        Apply queued DB writes in the background, in order.
+        Writes queued within DB_WRITE_BATCH_DELAY share one commit. If that
+        commit fails, the batch is retried one write per transaction so a
+        single bad write (e.g. a duplicate order_id) doesn't lose the others.
+        """
+        while True:
+            batch = [await self._db_queue.get()]
+            await asyncio.sleep(DB_WRITE_BATCH_DELAY)
+            while not self._db_queue.empty() and len(batch) < DB_WRITE_BATCH_SIZE:
+                batch.append(self._db_queue.get_nowait())
 
-                    if net_pnl > 0:
-                        bot_state.wins += 1
-                    else:
-                        bot_state.losses += 1
+            try:
+                await self._apply_writes(batch)
+            except Exception as e:
+                if len(batch) == 1:
+                    self._write_failed(batch[0], e)
+                else:
+                    logger.warning("[%s] [DB] Batch of %d writes failed (%s), retrying one by one", LOG_TS, len(batch), e)
+                    for job in batch:
+                        try:
+                            await self._apply_writes([job])
+                        except Exception as e:
+                            self._write_failed(job, e)
+            finally:
+                for job in batch:
+                    self._queued_paper_cost -= job.cost
+                    self._db_queue.task_done()
+
+    async def _apply_writes(self, batch: List[QueuedWrite]) -> None:
+        """Run queued writes in one transaction."""
+        async with async_session_maker() as session:
+            for job in batch:
+                await job.write(session)
+            await session.commit()
+        self._invalidate_status()
 
-                    logger.info(f"[{self._timestamp()}] [PAPER] Sold {size} {outcome} @ {price:.4f} | Net P&L: {net_pnl:+.4f}")
+    def _write_failed(self, job: QueuedWrite, error: Exception) -> None:
+        """Log a queued write that could not be committed and let its owner undo its bookkeeping."""
+        logger.error("[%s] [DB] Failed to apply queued write: %s", LOG_TS, error, exc_info=error)
+        if job.on_error:
+            job.on_error()
 
-            await session.commit()
+    async def _load_position_and_state(
+        self,
+        session: AsyncSession,
+        token_id: str
+    ) -> Tuple[Optional[Position], BotState]:
+        """
+        Load the position for a token together with the bot state in one query.
+        The position is LEFT JOINed so a missing position still returns the state row.
+        Rows seen before are matched on their cached primary keys.
+        """
+        position_id = self._position_ids.get(token_id)
+        query = select(BotState, Position).outerjoin(
+            Position,
+            Position.id == position_id if position_id is not None else Position.token_id == token_id
+        )
+        if self._bot_state_id is not None:
+            query = query.where(BotState.id == self._bot_state_id)
+
+        result = await session.execute(query.limit(1))
+        row = result.first()
+        if row is not None:
+            self._bot_state_id = row.BotState.id
+            if row.Position is not None:
+                self._position_ids[token_id] = row.Position.id
+            return row.Position, row.BotState
+
+        # No bot state row yet (first run) - create it, then look up the position
+        bot_state = await get_or_create_bot_state(session)
+        result = await session.execute(
+            select(Position).where(Position.token_id == token_id)
+        )
+        return result.scalar_one_or_none(), bot_state
+
+    async def _add_buy_to_position(
+        self,
+        session: AsyncSession,
+        market_id: str,
+        token_id: str,
+        outcome: str,
+        price: float,
+        size: float
+    ) -> None:
+        """
+        Apply a buy fill without reading any rows first: one upsert creates the
+        position or adds to it (re-averaging the entry price), and one UPDATE
+        bumps trades_count on the bot's state row.
+        """
+        dialect_insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(Position).values(
+            market_id=market_id,
+            token_id=token_id,
+            outcome=outcome,
+            quantity=size,
+            avg_price=price,
+            current_price=price
+        )
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Position.token_id],
+                # ON CONFLICT DO UPDATE skips Column.onupdate, so updated_at is set here
+                set_={
+                    # Right-hand sides see the existing row, before this update
+                    "avg_price": (Position.avg_price * Position.quantity + price * size) / (Position.quantity + size),
+                    "quantity": Position.quantity + size,
+                    "updated_at": datetime.utcnow(),
+                }
+            )
+        )
+        if self._bot_state_id is None:
+            self._bot_state_id = (await get_or_create_bot_state(session)).id
+        await session.execute(
+            update(BotState)
+            .where(BotState.id == self._bot_state_id)
+            .values(trades_count=BotState.trades_count + 1)
+        )
+        get_outcome_cache().invalidate(token_id)
 
     async def _update_paper_position(
         self,
@@ -2194,78 +2686,54 @@ class TradingBot:
         side: str,
         price: float,
         size: float,
-        outcome: str
+        outcome: str,
+        session: Optional[AsyncSession] = None
     ) -> None:
         """
         Update paper trading position after a fill.
         Includes taker fee in P&L calculation for both buy and sell sides.
+        With a session, changes are added to it and left for the caller to commit.
         """
-        async with async_session_maker() as session:
-            # Find existing position
-            result = await session.execute(
-                select(Position).where(Position.token_id == token_id)
-            )
-            position = result.scalar_one_or_none()
-
-            bot_state = await get_or_create_bot_state(session)
-
-            if side.lower() == "buy":
-                if position:
-                    # Update existing position with average price
-                    total_cost = (position.avg_price * position.quantity) + (price * size)
-                    new_quantity = position.quantity + size
-                    position.avg_price = total_cost / new_quantity
-                    position.quantity = new_quantity
-                    position.updated_at = datetime.utcnow()
-                else:
-                    # Create new position
-                    position = Position(
-                        market_id=market_id,
-                        token_id=token_id,
-                        outcome=outcome,
-                        quantity=size,
-                        avg_price=price,
-                        current_price=price
-                    )
-                    session.add(position)
+        if session is None:
+            async with async_session_maker() as session:
+                await self._update_paper_position(
+                    market_id=market_id,
+                    token_id=token_id,
+                    side=side,
+                    price=price,
+                    size=size,
+                    outcome=outcome,
+                    session=session
+                )
+                await session.commit()
+            return
 
-                bot_state.trades_count += 1
+        if side == "buy":
+            await self._add_buy_to_position(session, market_id, token_id, outcome, price, size)
 
-            elif side.lower() == "sell":
-                if position and position.quantity >= size:
-                    # Calculate fees for P&L
-                    buy_value = position.avg_price * size
-                    sell_value = price * size
-                    buy_fee = self._calculate_taker_fee(buy_value)
-                    sell_fee = self._calculate_taker_fee(sell_value)
-                    total_fees = buy_fee + sell_fee
-
-                    # Calculate P&L including fees
-                    # Gross P&L = (sell_price - buy_price) * size
-                    # Net P&L = Gross P&L - buy_fee - sell_fee
-                    gross_pnl = (price - position.avg_price) * size
-                    net_pnl = gross_pnl - total_fees
+        elif side == "sell":
+            position, bot_state = await self._load_position_and_state(session, token_id)
+            if position and position.quantity >= size:
+                # Calculate P&L including fees
+                exit_pnl = self._exit_pnl(position.avg_price, price, size)
+                net_pnl = exit_pnl.net_pnl
 
-                    position.quantity -= size
-                    position.current_pnl += net_pnl
-                    position.updated_at = datetime.utcnow()
-
-                    # Update bot state
-                    bot_state.total_pnl += net_pnl
-                    # Add proceeds minus sell fee to balance
-                    net_proceeds = sell_value - sell_fee
-                    bot_state.paper_balance += net_proceeds
-                    bot_state.trades_count += 1
+                position.quantity -= size
+                position.current_pnl += net_pnl
 
-                    if net_pnl > 0:
-                        bot_state.wins += 1
-                    else:
-                        bot_state.losses += 1
+                # Update bot state
+                bot_state.total_pnl += net_pnl
+                # Add proceeds minus sell fee to balance
+                net_proceeds = price * size - exit_pnl.sell_fee
+                bot_state.paper_balance += net_proceeds
+                bot_state.trades_count += 1
 
-                    logger.info(f"[{self._timestamp()}] [PAPER] Sold {size} {outcome} @ {price:.4f}")
-                    logger.info(f"[{self._timestamp()}] [PAPER] Gross P&L: {gross_pnl:+.4f} | Fees: -{total_fees:.4f} (buy: {buy_fee:.4f}, sell: {sell_fee:.4f}) | Net P&L: {net_pnl:+.4f}")
+                if net_pnl > 0:
+                    bot_state.wins += 1
+                else:
+                    bot_state.losses += 1
 
-            await session.commit()
+                logger.info("[%s] [PAPER] Sold %s %s @ %.4f | Net P&L: %+.4f", LOG_TS, size, outcome, price, net_pnl)
 
     async def _record_trade(
         self,
@@ -2277,36 +2745,62 @@ class TradingBot:
         size: float,
         is_paper: bool = False,
         status: OrderStatus = OrderStatus.OPEN,
-        market_name: Optional[str] = None
+        market_name: Optional[str] = None,
+        session: Optional[AsyncSession] = None
     ) -> None:
-        """Record a trade in the database."""
-        async with async_session_maker() as session:
-            trade = Trade(
+        """
+        Record a trade in the database.
+        With a session, changes are added to it and left for the caller to commit.
+        Without one, the insert is queued for the DB writer and batched with other writes.
+        """
+        if session is None:
+            async def write(session: AsyncSession) -> None:
+                await self._record_trade(
+                    order_id=order_id,
+                    market_id=market_id,
+                    token_id=token_id,
+                    side=side,
+                    price=price,
+                    size=size,
+                    is_paper=is_paper,
+                    status=status,
+                    market_name=market_name,
+                    session=session
+                )
+
+            await self._submit_write(write)
+            return
+
+        # Core INSERT - trades are append-only, so skip the ORM unit of work
+        await session.execute(
+            insert(Trade.__table__).values(
                 order_id=order_id,
                 market_id=market_id,
                 market_name=market_name,
                 token_id=token_id,
-                side=Side.BUY if side.lower() == "buy" else Side.SELL,
+                side=Side(side),
                 price=price,
                 size=size,
                 status=status,
                 is_paper=is_paper
             )
-            session.add(trade)
-            await session.commit()
+        )
 
     async def _update_trade_status(self, order_id: str, status: OrderStatus) -> None:
-        """Update the status of a trade by order_id."""
-        async with async_session_maker() as session:
+        """
+        Update the status of a trade by order_id.
+        Queued behind the trade's insert on the DB writer, so it always finds the row.
+        """
+        async def write(session: AsyncSession) -> None:
             result = await session.execute(
-                select(Trade).where(Trade.order_id == order_id)
+                update(Trade)
+                .where(Trade.order_id == order_id)
+                .values(status=status)
             )
-            trade = result.scalar_one_or_none()
-            if trade:
-                trade.status = status
-                trade.updated_at = datetime.utcnow()
-                await session.commit()
-                logger.info(f"[{self._timestamp()}] [LIVE] Trade {order_id[:16]}... status updated to {status.value}")
+            if result.rowcount:
+                logger.info("[%s] [LIVE] Trade %s... status updated to %s", LOG_TS, order_id[:16], status.value)
+
+        await self._submit_write(write)
 
     async def _update_live_position(
         self,
@@ -2322,45 +2816,18 @@ class TradingBot:
         Similar to _update_paper_position but for live trades.
         """
         async with async_session_maker() as session:
-            # Find existing position
-            result = await session.execute(
-                select(Position).where(Position.token_id == token_id)
-            )
-            position = result.scalar_one_or_none()
-
-            bot_state = await get_or_create_bot_state(session)
+            if side == "buy":
+                await self._add_buy_to_position(session, market_id, token_id, outcome, price, size)
+                logger.info("[%s] [LIVE] Position created/updated: BUY %s %s @ %.4f", LOG_TS, size, outcome, price)
 
-            if side.lower() == "buy":
-                if position:
-                    # Update existing position with average price
-                    total_cost = (position.avg_price * position.quantity) + (price * size)
-                    new_quantity = position.quantity + size
-                    position.avg_price = total_cost / new_quantity
-                    position.quantity = new_quantity
-                    position.updated_at = datetime.utcnow()
-                else:
-                    # Create new position
-                    position = Position(
-                        market_id=market_id,
-                        token_id=token_id,
-                        outcome=outcome,
-                        quantity=size,
-                        avg_price=price,
-                        current_price=price
-                    )
-                    session.add(position)
-
-                bot_state.trades_count += 1
-                logger.info(f"[{self._timestamp()}] [LIVE] Position created/updated: BUY {size} {outcome} @ {price:.4f}")
-
-            elif side.lower() == "sell":
+            elif side == "sell":
+                position, bot_state = await self._load_position_and_state(session, token_id)
                 if position and position.quantity >= size:
                     # Calculate P&L
                     gross_pnl = (price - position.avg_price) * size
 
                     position.quantity -= size
                     position.current_pnl += gross_pnl
-                    position.updated_at = datetime.utcnow()
 
                     # Update bot state
                     bot_state.total_pnl += gross_pnl
@@ -2371,13 +2838,14 @@ class TradingBot:
                     else:
                         bot_state.losses += 1
 
-                    logger.info(f"[{self._timestamp()}] [LIVE] Position updated: SELL {size} {outcome} @ {price:.4f} | P&L: {gross_pnl:+.4f}")
+                    logger.info("[%s] [LIVE] Position updated: SELL %s %s @ %.4f | P&L: %+.4f", LOG_TS, size, outcome, price, gross_pnl)
 
             await session.commit()
+        self._invalidate_status()
 
     async def _get_positions_for_market(self, market: Dict[str, Any]) -> List[Position]:
         """Get positions for a specific market from database."""
-        market_id = market.get("id") or market.get("conditionId")
+        market_id = market["_id"]
 
         async with async_session_maker() as session:
             result = await session.execute(
@@ -2385,83 +2853,166 @@ class TradingBot:
             )
             return list(result.scalars().all())
 
-    async def _update_position(
-        self,
-        position_id: int,
-        current_price: float,
-        pnl: float
-    ) -> None:
-        """Update position with current price and P&L."""
+    async def _update_positions(self, marks: List[Tuple[Position, float, float]]) -> None:
+        """Update positions with current price and P&L in one bulk UPDATE."""
+        if not marks:
+            return
+
+        now = datetime.utcnow()
         async with async_session_maker() as session:
-            result = await session.execute(
-                select(Position).where(Position.id == position_id)
+            await session.execute(
+                update(Position),
+                [
+                    {"id": position.id, "current_price": current_price, "current_pnl": pnl, "updated_at": now}
+                    for position, current_price, pnl in marks
+                ]
             )
-            position = result.scalar_one_or_none()
-            if position:
-                position.current_price = current_price
-                position.current_pnl = pnl
-                position.updated_at = datetime.utcnow()
-                await session.commit()
+            await session.commit()
 
     async def _update_bot_state(
         self,
         is_running: Optional[bool] = None,
-        last_action: Optional[str] = None,
+        last_action: Optional[Union[str, StatusLine]] = None,
         current_market_id: Optional[str] = None,
         total_pnl: Optional[float] = None
     ) -> None:
-        """Update bot state in database."""
-        async with async_session_maker() as session:
-            bot_state = await get_or_create_bot_state(session)
+        """
+        Update bot state in database.
+
+        Periodic heartbeat actions (see HEARTBEAT_ACTIONS) are only buffered
+        here - the strategy loop writes the latest one once per tick via
+        _flush_state. Event actions (fills, exits) and changes to is_running,
+        current_market_id or total_pnl are flushed immediately.
+        """
+        fields = {
+            "is_running": is_running,
+            "last_action": last_action,
+            "current_market_id": current_market_id,
+            "total_pnl": total_pnl,
+        }
+        self._pending_state.update({k: v for k, v in fields.items() if v is not None})
+
+        changed = {
+            k for k, v in self._pending_state.items()
+            if self._last_state_payload.get(k) != v
+        }
+        if changed <= {"last_action"} and _is_heartbeat_action(self._pending_state.get("last_action")):
+            return
+        await self._flush_state()
 
-            if is_running is not None:
-                bot_state.is_running = is_running
-            if last_action is not None:
-                bot_state.last_action = last_action
-            if current_market_id is not None:
-                bot_state.current_market_id = current_market_id
-            if total_pnl is not None:
-                bot_state.total_pnl = total_pnl
+    async def _flush_state(self) -> None:
+        """
+        Write buffered bot state fields in one UPDATE, queued on the DB writer
+        so it shares a commit with any fills from the same tick.
 
-            bot_state.updated_at = datetime.utcnow()
-            await session.commit()
+        Payloads identical to the last write are dropped, and a change to a
+        heartbeat action alone is written at most every HEARTBEAT_INTERVAL -
+        held fields are merged into the next write.
+        """
+        if not self._pending_state:
+            return
+
+        changed = {
+            k for k, v in self._pending_state.items()
+            if self._last_state_payload.get(k) != v
+        }
+        if not changed:
+            # Same action as last persisted (e.g. idle "Watching for entry...") - nothing to write
+            self._pending_state.clear()
+            return
+
+        now = time.monotonic()
+
+        heartbeat = _is_heartbeat_action(self._pending_state.get("last_action"))
+        if changed == {"last_action"} and heartbeat and now - self._last_heartbeat < HEARTBEAT_INTERVAL:
+            return
+
+        values = {
+            key: str(value) if isinstance(value, StatusLine) else value
+            for key, value in self._pending_state.items()
+            if key in changed
+        }
+
+        written = dict(self._pending_state)
+
+        async def write(session: AsyncSession) -> None:
+            if self._bot_state_id is None:
+                self._bot_state_id = (await get_or_create_bot_state(session)).id
+            await session.execute(
+                update(BotState).where(BotState.id == self._bot_state_id).values(**values)
+            )
+
+        def on_error() -> None:
+            # Not persisted after all - forget it was written and re-buffer it,
+            # unless a newer value for the field is already waiting
+            for key, value in written.items():
+                if self._last_state_payload.get(key) == value:
+                    del self._last_state_payload[key]
+                self._pending_state.setdefault(key, value)
+
+        # Counted as written as soon as it is queued, so the next ticks don't
+        # queue the same fields again - on_error undoes this if the commit fails
+        self._last_state_payload.update(written)
+        self._pending_state.clear()
+        await self._submit_write(write, on_error=on_error)
+
+        # An event action resets the window so the next heartbeat shows promptly
+        self._last_heartbeat = now if heartbeat else 0.0
 
     async def get_status(self) -> Dict[str, Any]:
         """Get current bot status."""
-        async with async_session_maker() as session:
-            bot_state = await get_or_create_bot_state(session)
+        bot_state = self._status_row
+        if bot_state is None:
+            gen = self._status_gen
+            # Only the row read holds a DB connection - the client calls below may hit the network
+            query = select(*(getattr(BotState, column) for column in STATUS_COLUMNS))
+            if self._bot_state_id is not None:
+                query = query.where(BotState.id == self._bot_state_id)
+            async with async_session_maker() as session:
+                # Just the status columns - the row is only created if it doesn't exist yet
+                row = (await session.execute(query.limit(1))).first()
+                if row is None:
+                    row = await get_or_create_bot_state(session)
+            bot_state = {column: getattr(row, column) for column in STATUS_COLUMNS}
+            if gen == self._status_gen:
+                self._status_row = bot_state
+
+        time_to_close = None
+        if bot_state["current_market_id"] and self.client:
+            time_to_close = await self.client.get_time_to_close(
+                bot_state["current_market_id"]
+            )
 
-            time_to_close = None
-            if bot_state.current_market_id and self.client:
-                time_to_close = await self.client.get_time_to_close(
-                    bot_state.current_market_id
-                )
+        # The ACTUAL trading mode is determined by config, not database
+        config_paper_trading = self.settings.paper_trading
+        trading_mode = "PAPER (Simulated)" if config_paper_trading else "LIVE (Real Money)"
+
+        # Get live balance from Polymarket
+        live_balance = None
+        if self.client and self.client.is_connected and not config_paper_trading:
+            live_balance = await self._get_live_balance()
+
+        return {
+            **bot_state,
+            "time_to_close": time_to_close,
+            "paper_trading": config_paper_trading,
+            "trading_mode": trading_mode,
+            "live_balance": live_balance
+        }
+
+    async def _get_live_balance(self) -> Optional[float]:
+        """Get the USDC balance, reusing a fetch younger than LIVE_BALANCE_TTL."""
+        now = time.monotonic()
+        if self._live_balance and now - self._live_balance[0] < LIVE_BALANCE_TTL:
+            return self._live_balance[1]
+        balance = await self.client.get_balance()
+        self._live_balance = (now, balance)
+        return balance
 
-            # The ACTUAL trading mode is determined by config, not database
-            config_paper_trading = self.settings.paper_trading
-            trading_mode = "PAPER (Simulated)" if config_paper_trading else "LIVE (Real Money)"
-
-            # Get live balance from Polymarket
-            live_balance = None
-            if self.client and self.client.is_connected and not config_paper_trading:
-                live_balance = await self.client.get_balance()
-
-            return {
-                "is_running": bot_state.is_running,
-                "current_market_id": bot_state.current_market_id,
-                "last_action": bot_state.last_action,
-                "total_pnl": bot_state.total_pnl,
-                "trades_count": bot_state.trades_count,
-                "wins": bot_state.wins,
-                "losses": bot_state.losses,
-                "updated_at": bot_state.updated_at,
-                "time_to_close": time_to_close,
-                "paper_trading": config_paper_trading,
-                "trading_mode": trading_mode,
-                "paper_balance": bot_state.paper_balance,
-                "paper_starting_balance": bot_state.paper_starting_balance,
-                "live_balance": live_balance
-            }
+    def _invalidate_status(self) -> None:
+        """Drop the cached get_status row after a DB write."""
+        self._status_row = None
+        self._status_gen += 1
 
     async def set_paper_trading(self, enabled: bool) -> None:
         """Enable or disable paper trading mode."""
@@ -2475,7 +3026,8 @@ class TradingBot:
                 bot_state.paper_starting_balance = self.settings.paper_balance
 
             await session.commit()
-            logger.info(f"Paper trading {'enabled' if enabled else 'disabled'}")
+            logger.info("Paper trading %s", 'enabled' if enabled else 'disabled')
+        self._invalidate_status()
 
 
 # Singleton instance
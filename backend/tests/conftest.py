@@ -0,0 +1,39 @@
+"""Shared test setup - the app is pointed at a throwaway SQLite database before it is imported."""
+
+import os
+import sys
+import tempfile
+
+import pytest_asyncio
+
+_DB_DIR = tempfile.mkdtemp(prefix="polymarket-bot-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/trades.db"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Base, engine, init_db  # noqa: E402
+from app.trading_bot import TradingBot  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Fresh tables for each test."""
+    await init_db()
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Pooled aiosqlite connections are bound to this test's event loop
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def bot(db):
+    """A trading bot with no client attached - DB paths only."""
+    bot = TradingBot()
+    yield bot
+    if bot._db_writer_task:
+        bot._db_writer_task.cancel()
+        try:
+            await bot._db_writer_task
+        except BaseException:
+            pass
@@ -0,0 +1,140 @@
+"""Tests for the streamed fill and balance bookkeeping in ClobMarketFeed."""
+
+import asyncio
+
+import pytest
+
+from app.polymarket_client import ClobMarketFeed
+from app.trading_bot import TradingBot
+
+
+def taker_trade(trade_id: str, size: float, side: str = "BUY", status: str = "MATCHED", order_id: str = "order-1") -> dict:
+    return {
+        "event_type": "trade",
+        "id": trade_id,
+        "status": status,
+        "trader_side": "TAKER",
+        "side": side,
+        "asset_id": "token-yes",
+        "size": str(size),
+        "taker_order_id": order_id,
+        "maker_orders": [],
+    }
+
+
+@pytest.fixture
+def feed():
+    feed = ClobMarketFeed()
+    feed._user_connected = True
+    return feed
+
+
+def test_fill_keeps_largest_matched_size(feed):
+    feed._handle_user_event({"event_type": "order", "id": "order-1", "size_matched": "4"})
+    feed._handle_user_event(taker_trade("trade-1", 2))
+
+    assert feed.get_filled_size("order-1") == 4.0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_fill_wakes_on_streamed_fill(feed):
+    waiter = asyncio.create_task(feed.wait_for_fill("order-1", timeout=1.0))
+    await asyncio.sleep(0)
+    feed._handle_user_event(taker_trade("trade-1", 5))
+
+    assert await waiter == 5.0
+
+
+def test_trade_seen_before_seeding_is_not_applied_on_top_of_the_seed(feed):
+    feed._handle_user_event(taker_trade("trade-1", 5))
+    assert feed.get_token_balance("token-yes") is None
+
+    # REST seed already includes the trade, then the trade is re-sent as it confirms
+    feed.seed_token_balance("token-yes", 5.0)
+    feed._handle_user_event(taker_trade("trade-1", 5, status="MINED"))
+    feed._handle_user_event(taker_trade("trade-1", 5, status="CONFIRMED"))
+
+    assert feed.get_token_balance("token-yes") == 5.0
+
+
+def test_seed_taken_before_settlement_reads_low(feed):
+    feed._handle_user_event(taker_trade("trade-1", 5))
+    feed.seed_token_balance("token-yes", 0.0)
+    feed._handle_user_event(taker_trade("trade-1", 5, status="CONFIRMED"))
+
+    # Never over-counted - _get_sell_balance re-reads a low balance from REST
+    assert feed.get_token_balance("token-yes") == 0.0
+
+
+def test_sell_and_failed_trades(feed):
+    feed.seed_token_balance("token-yes", 10.0)
+    feed._handle_user_event(taker_trade("trade-1", 4, side="SELL"))
+    feed._handle_user_event(taker_trade("trade-2", 3, status="FAILED"))
+
+    assert feed.get_token_balance("token-yes") == 6.0
+
+
+def test_maker_trade_counts_only_our_orders(feed):
+    feed._auth = {"apiKey": "our-key", "secret": "", "passphrase": ""}
+    feed.seed_token_balance("token-yes", 0.0)
+    feed._handle_user_event({
+        "event_type": "trade",
+        "id": "trade-1",
+        "trader_side": "MAKER",
+        "side": "SELL",
+        "asset_id": "token-yes",
+        "taker_order_id": "their-order",
+        "maker_orders": [
+            {"order_id": "order-1", "owner": "our-key", "asset_id": "token-yes", "matched_amount": "3"},
+            {"order_id": "order-2", "owner": "other-key", "asset_id": "token-yes", "matched_amount": "7"},
+        ],
+    })
+
+    # The taker sold, so our maker order bought
+    assert feed.get_token_balance("token-yes") == 3.0
+
+
+def test_balance_is_not_served_while_user_channel_is_down(feed):
+    feed.seed_token_balance("token-yes", 10.0)
+    feed._user_connected = False
+
+    assert feed.get_token_balance("token-yes") is None
+
+
+def test_bookkeeping_is_bounded(feed, monkeypatch):
+    monkeypatch.setattr(ClobMarketFeed, "MAX_TRACKED", 3)
+    feed.seed_token_balance("token-yes", 0.0)
+    for i in range(5):
+        feed._handle_user_event(taker_trade(f"trade-{i}", 1, order_id=f"order-{i}"))
+
+    assert list(feed._fills) == ["order-2", "order-3", "order-4"]
+    assert list(feed._applied_trades) == ["trade-2", "trade-3", "trade-4"]
+
+
+class RestBalanceClient:
+    """Client double that serves REST balances and counts the requests."""
+
+    def __init__(self, feed: ClobMarketFeed, balance: float):
+        self.market_feed = feed
+        self.balance = balance
+        self.requests = 0
+
+    async def get_conditional_balance(self, token_id: str) -> float:
+        self.requests += 1
+        return self.balance
+
+
+@pytest.mark.asyncio
+async def test_sell_balance_falls_back_to_rest_below_filled_size(feed):
+    bot = TradingBot()
+    bot.client = RestBalanceClient(feed, balance=10.0)
+    bot._live_state.filled_size = 10.0
+
+    # Seed taken before the fill settled - streamed balance looks like dust
+    feed.seed_token_balance("token-yes", 0.0)
+    assert await bot._get_sell_balance("token-yes") == 10.0
+    assert bot.client.requests == 1
+
+    feed.seed_token_balance("token-yes", 10.0)
+    assert await bot._get_sell_balance("token-yes") == 10.0
+    assert bot.client.requests == 1
@@ -0,0 +1,149 @@
+"""Tests for the queued DB writer: batching, per-write fallback and draining on stop."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import BotState, Trade, async_session_maker, get_or_create_bot_state
+
+
+async def count_trades() -> int:
+    async with async_session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(Trade))
+
+
+async def record(bot, order_id: str) -> None:
+    await bot._record_trade(
+        order_id=order_id,
+        market_id="market-1",
+        token_id="token-yes",
+        side="buy",
+        price=0.75,
+        size=10.0,
+        is_paper=True,
+    )
+
+
+def count_commits(bot, monkeypatch) -> list:
+    """Record the size of every batch _apply_writes is called with."""
+    batches = []
+    apply_writes = bot._apply_writes
+
+    async def counting(batch):
+        batches.append(len(batch))
+        await apply_writes(batch)
+
+    monkeypatch.setattr(bot, "_apply_writes", counting)
+    return batches
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_share_one_commit(bot, monkeypatch):
+    batches = count_commits(bot, monkeypatch)
+    bot._db_writer_task = asyncio.create_task(bot._db_writer())
+
+    for i in range(3):
+        await record(bot, f"order-{i}")
+    await bot._db_queue.join()
+
+    assert batches == [3]
+    assert await count_trades() == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_one_write_at_a_time(bot, monkeypatch):
+    await record(bot, "order-dup")  # No writer yet - committed directly
+    batches = count_commits(bot, monkeypatch)
+    bot._db_writer_task = asyncio.create_task(bot._db_writer())
+
+    async def duplicate(session):
+        await bot._record_trade(
+            order_id="order-dup", market_id="market-1", token_id="token-yes",
+            side="buy", price=0.75, size=10.0, session=session,
+        )
+
+    failed = []
+    await record(bot, "order-1")
+    await bot._submit_write(duplicate, on_error=lambda: failed.append("order-dup"))
+    await record(bot, "order-2")
+    await bot._db_queue.join()
+
+    # The duplicate order_id fails the batch; the retry keeps the other two
+    assert batches == [3, 1, 1, 1]
+    assert failed == ["order-dup"]
+    assert await count_trades() == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_writes(bot):
+    bot._running = True
+    bot._db_writer_task = asyncio.create_task(bot._db_writer())
+
+    for i in range(5):
+        await record(bot, f"order-{i}")
+    assert await bot.stop()
+
+    assert bot._db_writer_task is None
+    assert bot._db_queue.empty()
+    assert await count_trades() == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_state_write_is_buffered_again(bot, monkeypatch):
+    async def failing(batch):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(bot, "_apply_writes", failing)
+    with pytest.raises(RuntimeError):
+        await bot._update_bot_state(total_pnl=12.5)
+
+    assert "total_pnl" not in bot._last_state_payload
+    assert bot._pending_state["total_pnl"] == 12.5
+
+    monkeypatch.undo()
+    await bot._flush_state()
+    assert bot._last_state_payload["total_pnl"] == 12.5
+    assert (await bot.get_status())["total_pnl"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_failed_paper_fill_undoes_the_entry(bot, monkeypatch):
+    async def failing(batch):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(bot, "_apply_writes", failing)
+    bot._db_writer_task = asyncio.create_task(bot._db_writer())
+
+    # In-memory entry as _place_paper_entry_unified leaves it once the fill is queued
+    bot._paper_state.position_open = True
+    bot._paper_state.entry_order_id = "paper-1"
+    bot._active_orders[("token-yes", "buy")] = {"order_id": "paper-1", "status": "filled", "is_paper": True}
+    await bot._queue_paper_fill(
+        cost=7.5, order_id="paper-1", market_id="market-1", token_id="token-yes",
+        side="buy", price=0.75, size=10.0, outcome="YES", market_name=None,
+    )
+    await bot._db_queue.join()
+
+    assert not bot._paper_state.position_open
+    assert bot._paper_state.entry_order_id is None
+    assert ("token-yes", "buy") not in bot._active_orders
+
+
+@pytest.mark.asyncio
+async def test_buy_fill_counts_only_on_the_bot_state_row(bot):
+    async with async_session_maker() as session:
+        own = await get_or_create_bot_state(session)
+        other = BotState(trades_count=0)
+        session.add(other)
+        await session.commit()
+        own_id, other_id = own.id, other.id
+
+    await bot._update_paper_position(
+        market_id="market-1", token_id="token-yes", side="buy",
+        price=0.75, size=10.0, outcome="YES",
+    )
+
+    async with async_session_maker() as session:
+        assert (await session.get(BotState, own_id)).trades_count == 1
+        assert (await session.get(BotState, other_id)).trades_count == 0
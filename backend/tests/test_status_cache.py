@@ -0,0 +1,85 @@
+"""Tests for the caches in front of the database: get_status rows and token outcomes."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import update
+
+from app import trading_bot
+from app.database import BotState, Position, async_session_maker, get_or_create_bot_state
+from app.outcome_cache import OutcomeCache
+
+
+@pytest.mark.asyncio
+async def test_status_row_is_cached_until_a_write(bot):
+    first = await bot.get_status()
+    assert bot._status_row is not None
+
+    # A change made behind the bot's back is not seen while the row is cached
+    async with async_session_maker() as session:
+        await session.execute(update(BotState).values(wins=7))
+        await session.commit()
+    assert (await bot.get_status())["wins"] == first["wins"]
+
+    await bot._update_bot_state(total_pnl=3.0)
+    assert bot._status_row is None
+    status = await bot.get_status()
+    assert status["wins"] == 7
+    assert status["total_pnl"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_queued_write_invalidates_status(bot):
+    await bot.get_status()
+    bot._db_writer_task = asyncio.create_task(bot._db_writer())
+
+    await bot._update_bot_state(total_pnl=-1.5)
+    await bot._db_queue.join()
+
+    assert bot._status_row is None
+    assert (await bot.get_status())["total_pnl"] == -1.5
+
+
+@pytest.mark.asyncio
+async def test_reload_racing_a_write_is_not_cached(bot, monkeypatch):
+    # A write committing while get_status reads must not leave the old row cached
+    async def racing(session):
+        row = await get_or_create_bot_state(session)
+        bot._invalidate_status()
+        return row
+
+    # No bot state row yet, so get_status creates it through the patched helper
+    monkeypatch.setattr(trading_bot, "get_or_create_bot_state", racing)
+    await bot.get_status()
+
+    assert bot._status_row is None
+
+
+@pytest.mark.asyncio
+async def test_outcome_cache_keeps_hits_until_invalidated(db):
+    cache = OutcomeCache()
+    async with async_session_maker() as session:
+        session.add(Position(market_id="market-1", token_id="token-yes", outcome="YES"))
+        await session.commit()
+
+        assert await cache.get_many(session, ["token-yes", "token-unknown"]) == {"token-yes": "YES"}
+
+        await session.execute(update(Position).values(outcome="NO"))
+        await session.commit()
+        assert await cache.get(session, "token-yes") == "YES"
+
+        cache.invalidate("token-yes")
+        assert await cache.get(session, "token-yes") == "NO"
+
+
+@pytest.mark.asyncio
+async def test_outcome_cache_entries_expire(db):
+    cache = OutcomeCache(ttl=0.0)
+    async with async_session_maker() as session:
+        session.add(Position(market_id="market-1", token_id="token-yes", outcome="YES"))
+        await session.commit()
+        assert await cache.get(session, "token-yes") == "YES"
+
+        await session.execute(update(Position).values(outcome="NO"))
+        await session.commit()
+        assert await cache.get(session, "token-yes") == "NO"
@@ -55,7 +55,7 @@ export function usePriceWebSocket({
         try {
           const message = JSON.parse(event.data);
 
-          if (message.type === 'prices') {
+          if (message.type === 'prices' || message.type === 'prices_delta') {
             setPrices((prev) => ({
               ...prev,
               ...message.data,